@@ -0,0 +1,62 @@
+# desktop/benchmarks/bench_chunk.py
+
+"""
+Fixed chunk sizes vs the auto-tuner on a simulated link.
+
+Uploads the same image stop-and-wait with several fixed WRITE_CHUNK sizes
+and once with a ChunkTuner, over a DTL+CRC link with latency and bit
+errors, so small chunks pay the round trip and large ones pay re-sends.
+
+    python benchmarks/bench_chunk.py --size 262144 --latency 0.001 --ber 2e-6
+"""
+
+import argparse
+import os
+import time
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.client.tuner import ChunkTuner
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+
+def run(image: bytes, chunk, link: dict) -> tuple:
+    """Return (elapsed s, re-sends) for one upload."""
+    dev    = SimDevice(flash_size=len(image), dtl=True, crc_enable=True)
+    client = GSPClient(SimTransport(dev, timeout=0.5, **link), dtl=True, crc_enable=True)
+    client._max_retries = 20
+
+    start = time.perf_counter()
+    client.upload_image(image, chunk_size=chunk)
+    elapsed = time.perf_counter() - start
+
+    if dev.flash != image:
+        raise RuntimeError("flash mismatch")
+    return elapsed, client.retries
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--size",    type=int,   default=256 * 1024, help="image bytes")
+    ap.add_argument("--latency", type=float, default=0.001, help="one-way delay (s)")
+    ap.add_argument("--baud",    type=int,   default=921600)
+    ap.add_argument("--ber",     type=float, default=2e-6, help="bit error rate")
+    ap.add_argument("--max",     type=int,   default=8192, help="largest chunk probed")
+    ap.add_argument("--seed",    type=int,   default=1)
+    args = ap.parse_args()
+
+    image = os.urandom(args.size)
+    link  = dict(latency=args.latency, baudrate=args.baud, bit_error_rate=args.ber, seed=args.seed)
+
+    print(f"{'chunk':<12} {'seconds':>9} {'KB/s':>8} {'re-sent':>8}")
+    for size in (256, 1024, 4096, args.max):
+        dt, retries = run(image, size, link)
+        print(f"{size:<12} {dt:>9.3f} {args.size / dt / 1e3:>8.1f} {retries:>8}")
+    tuner = ChunkTuner(max_size=args.max)
+    dt, retries = run(image, tuner, link)
+    label = f"auto→{tuner.size}"
+    print(f"{label:<12} {dt:>9.3f} {args.size / dt / 1e3:>8.1f} {retries:>8}")
+
+
+if __name__ == "__main__":
+    main()
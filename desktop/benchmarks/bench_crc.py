@@ -0,0 +1,56 @@
+# desktop/benchmarks/bench_crc.py
+
+"""
+CRC-16 throughput (MB/s) per variant: bytewise vs slicing-by-8 engine,
+plus the incremental Crc16 object fed in chunk-sized pieces and
+crc16_batch() computing one CRC per chunk.
+
+    python benchmarks/bench_crc.py --size 1048576 --chunk 256
+"""
+
+import argparse
+import os
+import timeit
+
+import gsp_core.protocol.crc as crc_mod
+from gsp_core.protocol.crc import VARIANTS, Crc16, crc16_batch, _update, _update_bytewise
+
+
+def _mbps(fn, nbytes: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=3))
+    return nbytes / best / 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--size",  type=int, default=1 << 20, help="bytes per run")
+    ap.add_argument("--chunk", type=int, default=256,     help="update() size for Crc16")
+    args = ap.parse_args()
+
+    data  = os.urandom(args.size)
+    view  = memoryview(data)
+    parts = [view[i:i + args.chunk] for i in range(0, len(data), args.chunk)]
+
+    def incremental(variant: str) -> int:
+        c = Crc16(variant=variant)
+        for p in parts:
+            c.update(p)
+        return c.value
+
+    print(f"{'variant':<12} {'bytewise':>10} {'slicing-8':>10} {'Crc16 obj':>10}   (MB/s)")
+    for name, (seed, xorout) in VARIANTS.items():
+        ref = (_update_bytewise(seed, data) ^ xorout) & 0xFFFF
+        if incremental(name) != ref:
+            raise RuntimeError(f"{name}: engines disagree")
+        b = _mbps(lambda: _update_bytewise(seed, data), len(data))
+        s = _mbps(lambda: _update(seed, data), len(data))
+        i = _mbps(lambda: incremental(name), len(data))
+        print(f"{name:<12} {b:>10.1f} {s:>10.1f} {i:>10.1f}")
+
+    engine = "numpy" if crc_mod._np is not None else "scalar fallback"
+    bt = _mbps(lambda: crc16_batch(data, args.chunk), len(data))
+    print(f"\ncrc16_batch, {args.chunk}-byte chunks ({engine}): {bt:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
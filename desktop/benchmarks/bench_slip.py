@@ -0,0 +1,48 @@
+# desktop/benchmarks/bench_slip.py
+
+"""
+Reference vs fast SLIP codec on random, escape-heavy and escape-free payloads.
+
+    python benchmarks/bench_slip.py --size 65536
+"""
+
+import argparse
+import os
+import timeit
+
+from gsp_core.protocol.slip import encode, decode, encode_fast, decode_fast
+
+
+def _payloads(size: int) -> dict:
+    return {
+        "random":       os.urandom(size),
+        "escape-heavy": bytes([0xC0, 0xDB]) * (size // 2),
+        "escape-free":  bytes(i % 0xC0 for i in range(size)),
+    }
+
+
+def _mbps(fn, arg, nbytes: int, number: int) -> float:
+    best = min(timeit.repeat(lambda: fn(arg), number=number, repeat=3))
+    return nbytes * number / best / 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--size",   type=int, default=65536, help="payload bytes")
+    ap.add_argument("--number", type=int, default=20,    help="calls per timing run")
+    args = ap.parse_args()
+
+    print(f"{'payload':<14} {'op':<7} {'reference MB/s':>15} {'fast MB/s':>12} {'speed-up':>9}")
+    for name, data in _payloads(args.size).items():
+        frame = encode(data)
+        for op, ref, fast, arg in (
+            ("encode", encode, encode_fast, data),
+            ("decode", decode, decode_fast, frame),
+        ):
+            r = _mbps(ref,  arg, len(data), args.number)
+            f = _mbps(fast, arg, len(data), args.number)
+            print(f"{name:<14} {op:<7} {r:>15.1f} {f:>12.1f} {f / r:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# desktop/benchmarks/bench_tcp.py
+
+"""
+Receive throughput of TCPTransport against a local loopback server.
+
+The server streams N SLIP-wrapped frames as fast as the socket allows;
+the client pulls them with recv_frame() in per-byte and buffered mode.
+
+    python benchmarks/bench_tcp.py --frames 20000 --size 256
+"""
+
+import argparse
+import os
+import socket
+import threading
+import time
+
+from gsp_core.protocol.slip import encode
+from gsp_core.transport.tcp import TCPTransport
+
+
+def _serve(srv: socket.socket, blob: bytes) -> None:
+    conn, _ = srv.accept()
+    with conn:
+        conn.sendall(blob)
+        # hold the connection open until the client has read everything
+        conn.recv(1)
+
+
+def run(frames: int, size: int, buffered: bool) -> float:
+    """Return the elapsed seconds to receive `frames` frames of `size` bytes."""
+    frame = encode(os.urandom(size))
+    blob  = frame * frames
+
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    th = threading.Thread(target=_serve, args=(srv, blob), daemon=True)
+    th.start()
+
+    t = TCPTransport("127.0.0.1", srv.getsockname()[1], timeout=5.0, buffered=buffered)
+    start = time.perf_counter()
+    for _ in range(frames):
+        if t.recv_frame() != frame:
+            raise RuntimeError("frame mismatch")
+    elapsed = time.perf_counter() - start
+
+    t.send(b"\x00")
+    t.close()
+    th.join()
+    srv.close()
+    return elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--frames", type=int, default=5000)
+    ap.add_argument("--size",   type=int, default=256, help="payload bytes per frame")
+    args = ap.parse_args()
+
+    wire = len(encode(os.urandom(args.size))) * args.frames
+    print(f"{'mode':<10} {'frames/s':>12} {'MB/s':>10}")
+    for label, buffered in (("recv(1)", False), ("buffered", True)):
+        dt = run(args.frames, args.size, buffered)
+        print(f"{label:<10} {args.frames / dt:>12.0f} {wire / dt / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# desktop/benchmarks/bench_vserial.py
+
+"""
+Throughput and latency of UARTTransport through a real tty (pty + SimDevice).
+
+Unlike the unit tests, every byte goes through pyserial and the kernel
+tty layer. For each receive mode (read_until and the threaded reader):
+
+  - latency:    round-trip time of small stop-and-wait commands
+  - throughput: frames/s and bytes/s of pipelined WRITE_CHUNK commands
+
+    python benchmarks/bench_vserial.py --frames 2000 --size 256 --window 16
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.protocol.commands import CMD_WRITE_CHUNK
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.vserial import VirtualSerialPort
+from gsp_core.transport.uart import UARTTransport
+
+
+def run(threaded: bool, frames: int, size: int, window: int, pings: int) -> tuple:
+    """Return (median RTT s, p99 RTT s, elapsed s for `frames` chunks)."""
+    dev = SimDevice(flash_size=frames * size)
+    with VirtualSerialPort(dev) as vsp:
+        t = UARTTransport(vsp.port, 115200, timeout=1.0, threaded=threaded)
+        client = GSPClient(t)
+
+        rtts = []
+        for _ in range(pings):
+            start = time.perf_counter()
+            client.send_message(b"ping")
+            rtts.append(time.perf_counter() - start)
+
+        chunk = os.urandom(size)
+        start = time.perf_counter()
+        with client.pipeline(window=window) as pipe:
+            for _ in range(frames):
+                pipe.submit(CMD_WRITE_CHUNK, chunk)
+        elapsed = time.perf_counter() - start
+        t.close()
+
+    rtts.sort()
+    return statistics.median(rtts), rtts[int(len(rtts) * 0.99) - 1], elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--frames", type=int, default=2000)
+    ap.add_argument("--size",   type=int, default=256, help="payload bytes per chunk")
+    ap.add_argument("--window", type=int, default=16)
+    ap.add_argument("--pings",  type=int, default=500)
+    args = ap.parse_args()
+
+    wire = (args.size + 7) * args.frames
+    print(f"{'mode':<11} {'rtt p50 us':>11} {'rtt p99 us':>11} {'frames/s':>10} {'MB/s':>8}")
+    for label, threaded in (("read_until", False), ("threaded", True)):
+        p50, p99, dt = run(threaded, args.frames, args.size, args.window, args.pings)
+        print(f"{label:<11} {p50 * 1e6:>11.0f} {p99 * 1e6:>11.0f} "
+              f"{args.frames / dt:>10.0f} {wire / dt / 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
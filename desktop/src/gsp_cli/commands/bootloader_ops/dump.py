@@ -0,0 +1,164 @@
+# src/gsp_cli/commands/bootloader_ops/dump.py
+
+import os
+import typer
+from typer import Context, Argument, Option
+from rich.console import Console
+from rich.progress import Progress
+from rich.theme import Theme
+
+from gsp_core.config import load_config
+from gsp_core.client.commands.bootloader_ops.read import MAX_READ
+from gsp_core.client.commands.bootloader_ops.verify import range_result
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.client.tuner import ChunkTuner, resolve_chunk_size
+from gsp_core.protocol.cra import Priority
+from gsp_core.protocol.crc import Crc16
+
+# Register custom Rich styles
+theme = Theme({
+    "info":    "bold cyan",
+    "error":   "bold red",
+    "status":  "yellow",
+    "success": "bold green",
+})
+console = Console(theme=theme)
+
+_READ_BLOCK = 1 << 16   # read size when re-hashing the part of a dump already on disk
+
+def dump(
+    ctx: Context,
+    file: str = Argument(..., help="File to write the flash contents to"),
+    length: str = Option(..., "-l", "--length", help="Bytes to read (e.g. 0x40000)"),
+    address: str = Option(
+        None, "-a", "--address",
+        help="Flash address to start at [config: transfer.address]"
+    ),
+    priority: Priority = Option(
+        Priority.NORMAL,
+        "--priority", "-P",
+        case_sensitive=False,
+        help="Command priority (LOW, NORMAL, HIGH, CRITICAL)"
+    ),
+    chunk_size: str = Option(
+        None, "-c", "--chunk-size",
+        help="Bytes per READ_FLASH (1–65534); 'auto' reads transfer.initial_chunk [config: transfer.chunk_size]"
+    ),
+    window: int = Option(
+        None, "-w", "--window",
+        help="Commands in flight (1–128) [config: transfer.window]"
+    ),
+    resume: bool = Option(
+        False, "-r", "--resume",
+        help="Continue a dump of the same range whose file was cut short"
+    ),
+    verify: bool = Option(
+        None, "--verify/--no-verify",
+        help="Have the target confirm the CRC of the whole range [config: transfer.verify]"
+    ),
+    port: str = Option("", "-p", "--port", help="Serial port"),
+    baud: int = Option(None, "-b", "--baud", help="Baud rate override"),
+    timeout: float = Option(None, "-t", "--timeout", help="I/O timeout override (s)"),
+):
+    """
+    Read a flash range back into a file. Data is written as it arrives,
+    so only the chunks in flight are held in memory, and its CRC-16 is
+    computed on the way. The file always holds a contiguous prefix of the
+    range: after a failure or Ctrl+C, --resume continues where it ends.
+    """
+    # late-import to break circular dependency
+    from gsp_cli.transport import get_transport
+
+    interactive = ctx.find_root().obj.get("interactive", False)
+    file = os.path.expanduser(file.strip().strip("'\""))
+
+    # load config defaults
+    cfg     = load_config()
+    baud    = baud    or cfg["serial"]["baudrate"]
+    timeout = timeout or cfg["serial"]["timeout"]
+    try:
+        chunk  = resolve_chunk_size(chunk_size, cfg["transfer"])
+        chunk  = chunk.size if isinstance(chunk, ChunkTuner) else chunk
+        if chunk > MAX_READ:
+            raise ValueError(f"chunk size must be between 1 and {MAX_READ} for reads")
+        window = int(window or cfg["transfer"]["window"])
+        verify = cfg["transfer"]["verify"] if verify is None else verify
+        if not 1 <= window <= 128:
+            raise ValueError("window must be between 1 and 128")
+        if address is None:
+            address = cfg["transfer"]["address"]
+        address = int(address, 0) if isinstance(address, str) else int(address)
+        length  = int(length, 0)
+        if length <= 0:
+            raise ValueError("length must be positive")
+    except ValueError as e:
+        console.print(f"[error]{e}[/error]")
+        raise typer.Exit(1)
+
+    # what is already on disk counts towards the CRC, and is not read again
+    crc  = Crc16()
+    done = 0
+    if resume and os.path.exists(file):
+        try:
+            done = _rehash(file, length, crc)
+        except OSError as e:
+            console.print(f"[error]Unable to read {file}: {e}[/error]")
+            raise typer.Exit(1)
+        console.print(f"[status]Resuming at offset {done} of {length}[/status]")
+
+    transport = get_transport(port, baud, timeout, interactive)
+    client    = GSPClient(transport)
+
+    try:
+        with open(file, "ab" if done else "wb") as out, Progress() as prog:
+            task = prog.add_task("[info]Dumping…[/info]", total=length, completed=done)
+            try:
+                if done < length:
+                    client.read_flash(
+                        address + done, length - done, out, chunk_size=chunk, window=window,
+                        priority=priority, crc=crc,
+                        on_chunk=lambda offset, n: prog.update(task, advance=n),
+                    )
+            except (GSPTimeout, ValueError) as e:
+                out.flush()
+                console.print(f"\n[error]Read failed at offset {out.tell()}: {e}[/error]")
+                console.print("[status]Run the same command with --resume to continue from there.[/status]")
+                raise typer.Exit(1)
+    except OSError as e:
+        console.print(f"[error]Unable to write {file}: {e}[/error]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        console.print()  # newline
+        console.print(f"[status]Stopped at offset {os.path.getsize(file)}; continue with --resume[/status]")
+        raise typer.Exit(130)
+
+    console.print(f"[info]0x{address:08X}[/info]  {length} bytes  CRC-16 0x{crc.value:04X}")
+    if verify:
+        try:
+            matched, target = range_result(client.verify_range(address, length, crc.value, priority))
+        except GSPTimeout as e:
+            console.print(f"[error]Verification failed: {e}[/error]")
+            raise typer.Exit(1)
+        if not matched:
+            console.print(f"[error]Verification failed: flash reads CRC 0x{target:04X}, "
+                          f"the dump 0x{crc.value:04X}[/error]")
+            raise typer.Exit(1)
+    console.print(f"[success]Dumped to {file}[/success]")
+
+
+def _rehash(file: str, length: int, crc: Crc16) -> int:
+    """Feed the first `length` bytes of `file` into `crc`; drop any excess. Returns bytes kept."""
+    with open(file, "r+b") as f:
+        done = 0
+        while done < length:
+            block = f.read(min(_READ_BLOCK, length - done))
+            if not block:
+                break
+            crc.update(block)
+            done += len(block)
+        f.truncate(done)
+    return done
+
+
+if __name__ == "__main__":
+    typer.run(dump)
@@ -10,6 +10,8 @@ from rich.theme import Theme
 
 from gsp_core.config import load_config
 from gsp_core.protocol.cra import Priority
+from gsp_core.protocol.ports import port_identity
+from gsp_core.client.flashcache import FlashCache
 from gsp_core.client.highlevel import GSPClient, GSPTimeout
 
 # Register custom Rich styles
@@ -33,6 +35,10 @@ def erase(
     ),
     address: int = Option(None, "-a", "--address", help="Start address to erase"),
     length: int = Option(None, "-l", "--length", help="Length in bytes to erase"),
+    device_id: str = Option(
+        None, "--device-id",
+        help="Device whose `gsp write --diff` record to drop (default: USB serial number of the port)"
+    ),
     port: str = Option("", "-p", "--port", help="Serial port (e.g. /dev/ttyACM0)"),
     baud: int = Option(None, "-b", "--baud", help="Baud rate override"),
     timeout: float = Option(None, "-t", "--timeout", help="I/O timeout override (s)"),
@@ -84,6 +90,11 @@ def erase(
     transport = get_transport(port, baud, timeout, interactive)
     client    = GSPClient(transport)
 
+    # the --diff record no longer describes the flash, even if the erase fails halfway
+    cache = FlashCache(cfg["flash"]["cache_dir"])
+    if os.path.isdir(cache.root):
+        cache.invalidate(device_id or port_identity(transport.ser.port))
+
     try:
         console.print(Panel("Erasing flash…", style="info"))
         client.erase_flash(address, length, priority)
@@ -1,6 +1,8 @@
 # src/gsp_cli/commands/bootloader_ops/write.py
 
+import bisect
 import os
+from typing import Dict, Optional
 import typer
 from typer import Context, Argument, Option
 from rich.console import Console
@@ -12,8 +14,16 @@ from prompt_toolkit.completion import PathCompleter
 from prompt_toolkit.styles import Style
 
 from gsp_core.config import load_config
-from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.client.commands.bootloader_ops.verify import range_result
+from gsp_core.client.flashcache import FlashCache
+from gsp_core.client.highlevel import GSPClient, GSPTimeout, GSPVerifyError
+from gsp_core.client.journal import UploadJournal, journal_path
+from gsp_core.client.tuner import ChunkTuner, resolve_chunk_size
+from gsp_core.image.load import FORMATS, detect_format, load_image
+from gsp_core.image.sectors import SectorMap
+from gsp_core.image.segments import SegmentMap
 from gsp_core.protocol.cra import Priority
+from gsp_core.protocol.ports import port_identity
 
 # Register custom Rich styles
 theme = Theme({
@@ -29,19 +39,72 @@ def write(
     interactive: bool = Option(
         None, "-i", "--interactive", help="Interactive prompts for write"
     ),
-    file: str = Argument(None, help="Path to binary file"),
+    file: str = Argument(None, help="Path to firmware image (.bin, .hex, .s19/.srec, .elf)"),
+    image_format: str = Option(
+        None, "-f", "--format",
+        help=f"Image format ({', '.join(FORMATS)}); detected from the file by default"
+    ),
     priority: Priority = Option(
         Priority.NORMAL,
         "--priority", "-P",
         case_sensitive=False,
         help="Command priority (LOW, NORMAL, HIGH, CRITICAL)"
     ),
+    chunk_size: str = Option(
+        None, "-c", "--chunk-size",
+        help="Bytes per WRITE_CHUNK (1–65535) or 'auto' to tune for the link [config: transfer.chunk_size]"
+    ),
+    window: int = Option(
+        None, "-w", "--window",
+        help="Commands in flight (1–128) [config: transfer.window]"
+    ),
+    address: str = Option(
+        None, "-a", "--address",
+        help="Flash address of the image, used to resume [config: transfer.address]"
+    ),
+    resume: bool = Option(
+        False, "-r", "--resume",
+        help="Continue an interrupted upload of the same image from its journal"
+    ),
+    skip_blank: bool = Option(
+        False, "--skip-blank",
+        help="Raw images: do not send chunks of erased flash; the target range "
+             "must already be erased [config: transfer.erased_value]"
+    ),
+    verify: bool = Option(
+        None, "--verify/--no-verify",
+        help="Check the written flash with one CRC per image or sector [config: transfer.verify]"
+    ),
+    diff: bool = Option(
+        False, "-d", "--diff",
+        help="Erase and rewrite only the sectors that changed since the last --diff write to this device"
+    ),
+    full: bool = Option(
+        False, "--full", help="With --diff: flash everything and refresh the device's record"
+    ),
+    device_id: str = Option(
+        None, "--device-id",
+        help="Name the device for --diff (default: USB serial number of the port)"
+    ),
     port: str = Option("", "-p", "--port", help="Serial port"),
     baud: int = Option(None, "-b", "--baud", help="Baud rate override"),
     timeout: float = Option(None, "-t", "--timeout", help="I/O timeout override (s)"),
 ):
     """
-    Upload a firmware image in 256-byte chunks, sending each chunk with the given priority.
+    Stream a firmware image in chunks (256 bytes by default, or auto-tuned;
+    memory-mapped, so size is not limited by RAM), sending each chunk with
+    the given priority. Progress is journaled in flash.journal_dir, so a
+    failed or interrupted upload can be continued with --resume.
+
+    Intel HEX, S-record and ELF images are sparse: only their populated
+    ranges are erased and written, each at its own address, and chunks
+    that only contain erased flash (transfer.erased_value) are skipped.
+
+    With --diff the tool remembers what it flashed on each device and
+    next time erases and rewrites only the sectors whose CRC changed,
+    falling back to a full flash whenever that record cannot be trusted.
+    The sectors it skips are first confirmed on the device with
+    VERIFY_RANGE (one per run of unchanged sectors).
     """
     # late-import to break circular dependency
     from gsp_cli.transport import get_transport
@@ -92,17 +155,79 @@ def write(
     cfg     = load_config()
     baud    = baud    or cfg["serial"]["baudrate"]
     timeout = timeout or cfg["serial"]["timeout"]
+    try:
+        chunk = resolve_chunk_size(chunk_size, cfg["transfer"])
+        window = int(window or cfg["transfer"]["window"])
+        verify = cfg["transfer"]["verify"] if verify is None else verify
+        if not 1 <= window <= 128:
+            raise ValueError("window must be between 1 and 128")
+        if address is None:
+            address = cfg["transfer"]["address"]
+        address = int(address, 0) if isinstance(address, str) else int(address)
+        erased  = cfg["transfer"]["erased_value"]
+        erased  = int(erased, 0) if isinstance(erased, str) else erased
+    except ValueError as e:
+        console.print(f"[error]{e}[/error]")
+        raise typer.Exit(1)
 
     # set up transport and client
     transport = get_transport(port, baud, timeout, interactive)
     client    = GSPClient(transport)
 
-    # read data
     try:
-        data = open(file, "rb").read()
-    except Exception as e:
+        fmt = image_format or detect_format(file)
+    except OSError as e:
         console.print(f"[error]Unable to open file: {e}[/error]")
         raise typer.Exit(1)
+    if resume and (fmt != "bin" or diff):
+        console.print("[error]--resume supports plain raw binary writes only.[/error]")
+        raise typer.Exit(1)
+
+    fc = cfg["flash"]
+    try:
+        sectors = SectorMap.from_config(fc)
+    except ValueError as e:
+        console.print(f"[error]flash.sectors: {e}[/error]")
+        raise typer.Exit(1)
+    if diff and sectors is None:
+        # rewriting a piece of an erase sector of unknown size would wipe the rest
+        console.print("[error]--diff needs the target's erase geometry: "
+                      "set flash.sector_size or flash.sectors in the config.[/error]")
+        raise typer.Exit(1)
+    # the cache compares whole erase sectors, as upload_segments erases them
+    cache  = FlashCache(fc["cache_dir"], erased_value=0xFF if erased is None else erased,
+                        max_age=fc["cache_max_age"], sectors=sectors)
+    # any write changes the device behind the cache's back unless it goes
+    # through it; without a cache there is no record to drop
+    device = None
+    if diff or os.path.isdir(cache.root):
+        device = device_id or port_identity(transport.ser.port)
+        if not diff:
+            cache.invalidate(device)
+    if diff or fmt != "bin":
+        image = _load(file, fmt, address)
+        if diff:
+            _write_diff(client, cache, device, image, full, chunk, window, priority, erased,
+                        sectors, fc["max_erase"], verify)
+        else:
+            _write_segments(client, image, chunk, window, priority, erased, sectors, fc["max_erase"], verify)
+        return
+
+    # size and hash only: the image is streamed from a memory map, never read whole
+    try:
+        size    = os.path.getsize(file)
+        journal = UploadJournal.open(journal_path(fc["journal_dir"], file), file, address, resume=resume)
+    except (OSError, ValueError) as e:
+        console.print(f"[error]Unable to open file: {e}[/error]")
+        raise typer.Exit(1)
+    if skip_blank and erased is None:
+        console.print("[error]--skip-blank needs transfer.erased_value in the config.[/error]")
+        raise typer.Exit(1)
+    if resume:
+        if journal.resumed:
+            console.print(f"[status]Resuming at offset {journal.confirmed} of {size}[/status]")
+        else:
+            console.print("[status]No matching journal; starting from offset 0[/status]")
 
     error_offset = None
     error_msg    = ""
@@ -110,27 +235,149 @@ def write(
     # upload with progress, handle Ctrl+C
     try:
         with Progress() as prog:
-            task = prog.add_task("[info]Uploading…[/info]", total=len(data))
-            for i in range(0, len(data), 256):
-                chunk = data[i : i + 256]
-                try:
-                    client.write_chunk(chunk, priority)
-                except GSPTimeout as e:
-                    error_offset = i
-                    error_msg    = str(e)
-                    break
-                prog.update(task, advance=len(chunk))
+            task = prog.add_task("[info]Uploading…[/info]", total=size, completed=journal.confirmed)
+            try:
+                client.upload_image(
+                    file, chunk_size=chunk, priority=priority, window=window, journal=journal,
+                    address=address if skip_blank or verify else None, verify=verify,
+                    erased_value=erased if skip_blank else None,
+                    on_chunk=lambda offset, length: prog.update(task, advance=length),
+                )
+            except GSPTimeout as e:
+                error_offset = journal.confirmed
+                error_msg    = str(e)
+            except GSPVerifyError as e:
+                console.print(f"\n[error]Verification failed: {e}[/error]")
+                raise typer.Exit(1)
     except KeyboardInterrupt:
         console.print()  # newline
-        raise typer.Exit()
+        console.print(f"[status]Stopped at offset {journal.confirmed}; continue with --resume[/status]")
+        raise typer.Exit(130)
 
     # report any error_offset
     if error_offset is not None:
         console.print(f"\n[error]Write failed at offset {error_offset}: {error_msg}[/error]")
+        console.print("[status]Run the same command with --resume to continue from there.[/status]")
         raise typer.Exit(1)
 
+    if isinstance(chunk, ChunkTuner):
+        console.print(f"[status]Chunk size settled at {chunk.size} bytes[/status]")
     console.print("[success]Upload complete![/success]")
 
 
+def _load(file: str, fmt: str, address: int) -> SegmentMap:
+    try:
+        return load_image(file, fmt, address)
+    except (OSError, ValueError) as e:
+        console.print(f"[error]Unable to load {fmt} image: {e}[/error]")
+        raise typer.Exit(1)
+
+
+def _write_diff(client: GSPClient, cache: FlashCache, device: str, image: SegmentMap,
+                full: bool, chunk, window: int, priority: Priority, erased_value,
+                sectors: SectorMap, max_erase: int, verify: bool) -> None:
+    """Program the sectors that differ from the device's cached image."""
+    def check(address: int, length: int, crc: int) -> bool:
+        # the record names the port's adapter, not the board: confirm what it skips
+        try:
+            return range_result(client.verify_range(address, length, crc, priority))[0]
+        except GSPTimeout:
+            return False
+
+    try:
+        plan = cache.plan(device, image, full=full, check=check)
+    except ValueError as e:
+        console.print(f"[error]{e}[/error]")
+        raise typer.Exit(1)
+    if plan.full:
+        console.print(f"[status]Full flash of {device} ({plan.reason})[/status]")
+    elif not plan.changed:
+        console.print(f"[success]{device} already holds this image; nothing to write.[/success]")
+        return
+    else:
+        console.print(f"[status]{device}: {plan.changed} of {len(plan.sectors)} sectors changed[/status]")
+    cache.begin(plan)
+    _write_segments(client, plan.image, chunk, window, priority, erased_value, sectors, max_erase, verify)
+    cache.commit(plan)
+
+
+def _write_segments(client: GSPClient, image: SegmentMap, chunk, window: int, priority: Priority,
+                    erased_value, sectors: Optional[SectorMap], max_erase: int, verify: bool) -> None:
+    """
+    Erase and program only the populated ranges of a sparse image: sector
+    by sector given the geometry, else every range before the first write.
+    """
+    for address, length in image.ranges():
+        console.print(f"[info]0x{address:08X}[/info]  {length} bytes")
+
+    acked = _Acked(image)
+
+    def on_chunk(address: int, length: int) -> None:
+        acked.ack(address, length)
+        prog.update(task, advance=length)
+
+    try:
+        with Progress() as prog:
+            task = prog.add_task("[info]Uploading…[/info]", total=image.size)
+            client.upload_segments(
+                image, chunk_size=chunk, priority=priority, window=window,
+                erased_value=erased_value, sectors=sectors, max_erase=max_erase,
+                verify=verify, on_chunk=on_chunk,
+            )
+    except GSPTimeout as e:
+        end   = acked.end
+        where = f"0x{end:08X}" if end is not None else "the start"
+        console.print(f"\n[error]Write failed after {where}: {e}[/error]")
+        raise typer.Exit(1)
+    except GSPVerifyError as e:
+        console.print(f"\n[error]Verification failed: {e}[/error]")
+        raise typer.Exit(1)
+    except ValueError as e:
+        # e.g. data outside the flash.sectors layout
+        console.print(f"\n[error]{e}[/error]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        console.print()  # newline
+        raise typer.Exit(130)
+
+    if isinstance(chunk, ChunkTuner):
+        console.print(f"[status]Chunk size settled at {chunk.size} bytes[/status]")
+    console.print("[success]Upload complete![/success]")
+
+
+class _Acked:
+    """
+    How far a sparse image is written without gaps. Pipelined acks and
+    skipped blank chunks arrive out of order; like UploadJournal.ack(),
+    only the contiguous prefix (in image order, across the gaps between
+    ranges) counts.
+    """
+    def __init__(self, image: SegmentMap):
+        self._ranges = image.ranges()
+        self._starts = [a for a, _ in self._ranges]
+        self._bases  = []                   # image offset of each range
+        offset = 0
+        for _, length in self._ranges:
+            self._bases.append(offset)
+            offset += length
+        self.confirmed = 0
+        self._acked: Dict[int, int] = {}   # offset → end, beyond `confirmed`
+
+    def ack(self, address: int, length: int) -> None:
+        i = bisect.bisect_right(self._starts, address) - 1
+        offset = self._bases[i] + address - self._starts[i]
+        self._acked[offset] = offset + length
+        while self.confirmed in self._acked:
+            self.confirmed = self._acked.pop(self.confirmed)
+
+    @property
+    def end(self) -> Optional[int]:
+        """Flash address after the contiguously written prefix (None: nothing yet)."""
+        if not self.confirmed:
+            return None
+        i = bisect.bisect_right(self._bases, self.confirmed - 1) - 1
+        return self._starts[i] + self.confirmed - self._bases[i]
+
+
 if __name__ == "__main__":
     typer.run(write)
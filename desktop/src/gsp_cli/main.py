@@ -13,6 +13,7 @@ from gsp_cli.interactive import run_menu
 # your CLI commands
 from gsp_cli.commands.bootloader_ops.erase import erase   as cmd_erase
 from gsp_cli.commands.bootloader_ops.write import write   as cmd_write
+from gsp_cli.commands.bootloader_ops.dump  import dump    as cmd_dump
 from gsp_cli.commands.messaging.message       import message as cmd_message
 
 console = Console(
@@ -55,6 +56,7 @@ def main(
         run_menu(app, [
             ("erase", cmd_erase),
             ("write", cmd_write),
+            ("dump", cmd_dump),
             ("message", cmd_message),
         ], interactive)
 
@@ -70,6 +72,7 @@ def main(
 # Register subcommands
 app.command()(cmd_erase)
 app.command()(cmd_write)
+app.command()(cmd_dump)
 app.command()(cmd_message)
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+# src/gsp_core/client/aio.py
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from gsp_core.client.base import ClientCore, GSPTimeout, _remaining
+from gsp_core.client.commands.bootloader_ops.erase import EraseMixin
+from gsp_core.client.commands.bootloader_ops.write import WriteMixin
+from gsp_core.client.commands.bootloader_ops.verify import VerifyMixin
+from gsp_core.client.commands.bootloader_ops.reset import ResetMixin
+from gsp_core.client.commands.bootloader_ops.abort import AbortMixin
+from gsp_core.client.commands.bootloader_ops.address import AddressMixin
+from gsp_core.client.commands.messaging.message    import MessageMixin
+from gsp_core.events import publish
+from gsp_core.protocol.cra import CommandFrame, Priority
+
+class AsyncBaseGSPClient(ClientCore):
+    """
+    asyncio counterpart of BaseGSPClient. The transport's send() and
+    recv_frame() are coroutines (AsyncTCPTransport, AsyncUARTTransport).
+
+    Calls on one client are serialised (stop-and-wait per target); run one
+    client per board and let the event loop drive them all concurrently.
+    """
+    def __init__(self, transport: Any, *args: Any, **kwargs: Any):
+        super().__init__(transport, *args, **kwargs)
+        self._lock = asyncio.Lock()
+
+    async def _call(
+        self,
+        cmd: int,
+        payload: bytes = b"",
+        priority: Priority = Priority.NORMAL
+    ) -> bytes:
+        async with self._lock:
+            sid      = self._next_sid()
+            frame    = CommandFrame(sid=sid, cmd=cmd, payload=payload, priority=priority)
+            slip_cmd = self._encode(frame)
+            last_exc: Optional[Exception] = None
+
+            for attempt in range(1, self._max_retries + 1):
+                await self.transport.send(slip_cmd)
+                sent_at  = time.monotonic()
+                timeout  = self._timeout(cmd, attempt)
+                deadline = None if timeout is None else sent_at + timeout
+                try:
+                    while True:
+                        raw  = await self._recv(_remaining(deadline))
+                        resp = self._check_response(raw, sid, attempt)
+                        for reply in self._take_replies():
+                            await self.transport.send(reply)
+                        if resp is not None:
+                            self._sample(cmd, attempt, sent_at)
+                            return resp
+                except (GSPTimeout, ValueError, RuntimeError) as e:
+                    last_exc = e
+                    if attempt < self._max_retries:
+                        self.retries += 1
+                        publish("status", f"Retrying (attempt {attempt}/{self._max_retries})")
+                        continue
+                    break
+
+            raise self._give_up(cmd, last_exc)
+
+class AsyncGSPClient(AsyncBaseGSPClient,
+                     EraseMixin,
+                     WriteMixin,
+                     VerifyMixin,
+                     ResetMixin,
+                     AbortMixin,
+                     AddressMixin,
+                     MessageMixin):
+    """
+    asyncio GSP client with the single-command API of GSPClient.
+    The mixin methods hand back what _call() returns, which here is a
+    coroutine, so every command is awaited:
+
+        transport = await AsyncTCPTransport.open("10.0.0.7", 4001, timeout=0.2)
+        client    = AsyncGSPClient(transport)
+        await client.erase_flash()
+        await client.write_chunk(data)
+
+    The helpers built on Pipeline (write_chunks, upload_image, read_flash)
+    drive a blocking transport and are not part of this client; run one
+    AsyncGSPClient per target with asyncio.gather() instead.
+    """
+    pass
@@ -1,27 +1,158 @@
-from typing import Any, Optional
-from gsp_core.protocol.cra import CommandFrame, parse_frame, Priority
-from gsp_core.protocol.slip import encode, decode
+import inspect
+import time
+from typing import TYPE_CHECKING, Any, List, Optional
+from gsp_core.protocol.commands import STATUS_OK
+from gsp_core.protocol.cra import CommandFrame, Frame, ResponseFrame, parse, Priority
+from gsp_core.protocol.slip import decode_fast as decode, encode_into
+from gsp_core.protocol.dtl import HEADROOM, TAILROOM, encode_frame_into, decode_frame
+from gsp_core.client.dispatch import Dispatcher
+from gsp_core.client.rto import RetransmitPolicy
 from gsp_core.config import load_config
 from gsp_core.events import publish
 
-_OK_STATUS = 0x00
+if TYPE_CHECKING:
+    from gsp_core.client.pipeline import Pipeline
 
 class GSPTimeout(Exception):
     """Raised when GSP retries are exhausted or a timeout occurs."""
     pass
 
-class BaseGSPClient:
-    def __init__(self, transport: Any, start_sid: int = 0):
+class GSPVerifyError(Exception):
+    """Raised when the target's flash does not hold what was written."""
+    pass
+
+class ClientCore:
+    """
+    Transport-agnostic half of a GSP client: configuration, SID allocation,
+    wire framing and response checking. BaseGSPClient (blocking) and
+    AsyncBaseGSPClient (asyncio) add the I/O loop on top.
+    """
+    def __init__(
+        self,
+        transport:  Any,
+        start_sid:  int = 0,
+        dtl:        Optional[bool] = None,
+        crc_enable: Optional[bool] = None
+    ):
+        """
+        :param transport:  object with send(frame) / recv_frame()
+        :param start_sid:  first session ID to use
+        :param dtl:        wrap frames in the DTL header (default: config general.dtl);
+                           otherwise bare SLIP frames are exchanged
+        :param crc_enable: append/verify CRC-16 in DTL mode (default: config general.crc_enable)
+        """
         cfg = load_config()
-        self._max_retries = cfg.get("general", {}).get("max_retries", 5)
+        general = cfg.get("general", {})
+        self._max_retries = general.get("max_retries", 5)
+        self._dtl         = general.get("dtl", False) if dtl is None else dtl
+        self._crc_enable  = general.get("crc_enable", True) if crc_enable is None else crc_enable
         self.transport    = transport
         self._sid         = start_sid & 0xFF
+        self._timed_recv  = _takes_timeout(transport.recv_frame)
+        # adaptive per-command timeouts; None → the transport's fixed timeout
+        self.rto: Optional[RetransmitPolicy] = RetransmitPolicy.from_config(
+            cfg.get("timeouts", {}), getattr(transport, "timeout", None)
+        )
+        # device-initiated commands, ACKs and stale responses end up here
+        self.dispatcher = Dispatcher()
+        self._replies: List[bytes] = []   # wire responses owed to the device
+        self.retries = 0                  # commands re-sent (timeouts, bad frames, error status)
+
+    def _recv(self, timeout: Optional[float]) -> Any:
+        """
+        transport.recv_frame(), bounded by `timeout` when there is one and
+        the transport takes it (None: the transport's own timeout).
+        """
+        if timeout is None or not self._timed_recv:
+            return self.transport.recv_frame()
+        return self.transport.recv_frame(timeout)
 
     def _next_sid(self) -> int:
         sid = self._sid
         self._sid = (sid + 1) & 0xFF
         return sid
 
+    def _encode(self, frame: Frame) -> bytes:
+        """
+        Build `frame` straight into its wire buffer (bare SLIP or DTL).
+        The payload is copied once; escape-free frames are sent from that
+        same buffer.
+        """
+        n = frame.nbytes
+        if not self._dtl:
+            buf = bytearray(n + 2)
+            frame.build_into(buf, 1)
+            return encode_into(buf, n + 2)
+        buf = bytearray(HEADROOM + n + TAILROOM)
+        frame.build_into(buf, HEADROOM)
+        return encode_frame_into(buf, n, self._crc_enable)
+
+    def _decode(self, frame: bytes) -> bytes:
+        """Unwrap a received wire frame into the raw CRA frame."""
+        if not self._dtl:
+            return decode(frame)
+        return decode_frame(frame)[0]
+
+    def _check_response(self, raw: bytes, sid: int, attempt: int) -> Optional[bytes]:
+        """
+        Validate one received wire frame as the OK response to `sid` and
+        return its payload. Raises GSPTimeout / ValueError / RuntimeError,
+        which the caller treats as "retry".
+
+        Any other decodable frame (device command, ACK, late response to
+        an older SID) goes to the dispatcher and None is returned: keep
+        waiting, without re-sending. Replies the dispatcher produced are
+        queued for _take_replies().
+        """
+        if not raw:
+            raise GSPTimeout(f"no data (timeout #{attempt})")
+
+        resp = parse(self._decode(raw))
+
+        if not isinstance(resp, ResponseFrame) or resp.sid != sid:
+            self._route(resp)
+            return None
+        if resp.status != STATUS_OK:
+            raise RuntimeError(f"GSP error status 0x{resp.status:02x}")
+
+        return bytes(resp.payload)
+
+    def _route(self, frame: Frame) -> None:
+        """Hand an unsolicited frame to the dispatcher, queueing its reply."""
+        reply = self.dispatcher.route(frame)
+        if reply is not None:
+            self._replies.append(self._encode(reply))
+
+    def _take_replies(self) -> List[bytes]:
+        replies, self._replies = self._replies, []
+        return replies
+
+    def _timeout(self, cmd: int, attempt: int) -> Optional[float]:
+        """recv_frame() timeout for this attempt (None = transport default)."""
+        return self.rto.timeout(cmd, attempt) if self.rto is not None else None
+
+    def _sample(self, cmd: int, attempt: int, sent_at: float) -> None:
+        """Feed the RTT of a first-attempt reply to the estimator (Karn)."""
+        if self.rto is not None and attempt == 1:
+            self.rto.sample(cmd, time.monotonic() - sent_at)
+
+    def _give_up(self, cmd: int, last_exc: Optional[Exception]) -> GSPTimeout:
+        msg = f"Command 0x{cmd:02X} failed after {self._max_retries} attempts: {last_exc}"
+        publish("error", msg)
+        return GSPTimeout(msg)
+
+class BaseGSPClient(ClientCore):
+    def pipeline(self, window: int = 8, timeout: Optional[float] = None) -> "Pipeline":
+        """
+        Return a Pipeline that keeps up to `window` commands in flight,
+        matching responses by SID (see gsp_core.client.pipeline).
+        `timeout` fixes the per-command deadline; by default it follows
+        the client's adaptive retransmit timeouts.
+        """
+        # late import: pipeline.py builds on this module
+        from gsp_core.client.pipeline import Pipeline
+        return Pipeline(self, window=window, timeout=timeout)
+
     def _call(
         self,
         cmd: int,
@@ -29,36 +160,50 @@ class BaseGSPClient:
         priority: Priority = Priority.NORMAL
     ) -> bytes:
         sid      = self._next_sid()
-        raw_cmd  = CommandFrame(sid=sid, cmd=cmd, payload=payload, priority=priority).build()
-        slip_cmd = encode(raw_cmd)
+        frame    = CommandFrame(sid=sid, cmd=cmd, payload=payload, priority=priority)
+        slip_cmd = self._encode(frame)
         last_exc = None
 
         for attempt in range(1, self._max_retries + 1):
-            self.transport.send(slip_cmd)
             try:
-                raw = self.transport.recv_frame()
-                if not raw:
-                    raise GSPTimeout(f"no data (timeout #{attempt})")
-
-                resp = decode(raw)
-                kind, info = parse_frame(resp)
-
-                if kind != "resp":
-                    raise RuntimeError(f"expected 'resp', got '{kind}'")
-                if info["sid"] != sid:
-                    raise RuntimeError(f"Session ID mismatch (sent={sid}, got={info['sid']})")
-                status = info["status"]
-                if status != bytes([_OK_STATUS]):
-                    raise RuntimeError(f"GSP error status 0x{status.hex()}")
-
-                return info.get("payload", b"")
+                return self._attempt(cmd, sid, slip_cmd, attempt)
             except (GSPTimeout, ValueError, RuntimeError) as e:
                 last_exc = e
                 if attempt < self._max_retries:
+                    self.retries += 1
                     publish("status", f"Retrying (attempt {attempt}/{self._max_retries})")
                     continue
                 break
 
-        msg = f"Command 0x{cmd:02X} failed after {self._max_retries} attempts: {last_exc}"
-        publish("error", msg)
-        raise GSPTimeout(msg)
+        raise self._give_up(cmd, last_exc)
+
+    def _attempt(self, cmd: int, sid: int, wire: bytes, attempt: int) -> bytes:
+        """
+        Send `wire` once and wait for its response; returns the payload.
+        Unsolicited frames arriving meanwhile are dispatched and do not
+        end the wait. Raises like _check_response() if this attempt failed.
+        """
+        self.transport.send(wire)
+        sent_at  = time.monotonic()
+        timeout  = self._timeout(cmd, attempt)
+        deadline = None if timeout is None else sent_at + timeout
+        while True:
+            raw  = self._recv(_remaining(deadline))
+            resp = self._check_response(raw, sid, attempt)
+            for reply in self._take_replies():
+                self.transport.send(reply)
+            if resp is not None:
+                self._sample(cmd, attempt, sent_at)
+                return resp
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until `deadline` (None = use the transport default)."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+def _takes_timeout(recv_frame: Any) -> bool:
+    """Whether a transport's recv_frame() accepts a per-call timeout."""
+    try:
+        params = inspect.signature(recv_frame).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "timeout" or p.kind == p.VAR_POSITIONAL for p in params)
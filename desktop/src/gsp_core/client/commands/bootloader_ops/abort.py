@@ -1,10 +1,12 @@
 from gsp_core.events import publish
 from gsp_core.protocol.commands import CMD_ABORT
+from gsp_core.protocol.cra import Priority
 
 class AbortMixin:
-    def abort(self) -> None:
+    def abort(self, priority: Priority = Priority.CRITICAL) -> bytes:
         """
         Abort the current session and discard partial state.
+        Sent as CRITICAL by default so a scheduler runs it ahead of bulk traffic.
         """
         publish("status", "Aborting session")
-        self._call(cmd=CMD_ABORT)
+        return self._call(cmd=CMD_ABORT, priority=priority)
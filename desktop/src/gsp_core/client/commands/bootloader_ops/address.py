@@ -0,0 +1,20 @@
+from struct import Struct
+from gsp_core.events import publish
+from gsp_core.protocol.commands import CMD_SET_ADDRESS
+from gsp_core.protocol.cra import Priority
+
+_ADDRESS = Struct("<I")  # address (LE)
+
+class AddressMixin:
+    def set_address(
+        self,
+        address: int,
+        priority: Priority = Priority.NORMAL
+    ) -> bytes:
+        """
+        Move the target's write pointer: the next WRITE_CHUNK is programmed
+        at `address`. Applied in SID order, so it may be pipelined between
+        chunks.
+        """
+        publish("status", f"Write address 0x{address:08X}")
+        return self._call(cmd=CMD_SET_ADDRESS, payload=_ADDRESS.pack(address), priority=priority)
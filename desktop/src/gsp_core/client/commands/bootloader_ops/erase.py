@@ -1,15 +1,18 @@
+from struct import Struct
 from typing import Optional
 from gsp_core.events import publish
 from gsp_core.protocol.commands import CMD_ERASE_FLASH
 from gsp_core.protocol.cra import Priority
 
+_REGION = Struct("<II")  # address, length (LE)
+
 class EraseMixin:
     def erase_flash(
         self,
         address: Optional[int] = None,
         length: Optional[int] = None,
         priority: Priority = Priority.NORMAL
-    ) -> None:
+    ) -> bytes:
         """
         Erase flash memory. If address+length given, erases that region;
         otherwise a full-chip erase.
@@ -17,6 +20,6 @@ class EraseMixin:
         publish("status", "Erasing flash")
         data = b""
         if address is not None and length is not None:
-            data = address.to_bytes(4, "little") + length.to_bytes(4, "little")
+            data = _REGION.pack(address, length)
         # self._call comes from the base client
-        self._call(cmd=CMD_ERASE_FLASH, payload=data, priority=priority)
+        return self._call(cmd=CMD_ERASE_FLASH, payload=data, priority=priority)
@@ -0,0 +1,138 @@
+import os
+from collections import deque
+from typing import Any, Callable, Optional
+from gsp_core.events import publish
+from gsp_core.protocol.commands import CMD_READ_FLASH, READ_FLASH_REQUEST
+from gsp_core.protocol.cra import MAX_PAYLOAD, Priority
+from gsp_core.protocol.crc import Crc16
+
+# the response payload also carries the status byte
+MAX_READ = MAX_PAYLOAD - 1
+
+# on_chunk(offset, length): called once a chunk has been written to the sink
+ChunkCallback = Callable[[int, int], None]
+
+class _Sink:
+    """
+    Destination of read_flash(): a path (created or truncated), a binary
+    file object (written at its current position) or a writable buffer of
+    at least `length` bytes (filled from index 0). Data arrives in order.
+    """
+    def __init__(self, sink: Any, length: int):
+        self._file = None
+        self._view: Optional[memoryview] = None
+        if isinstance(sink, (str, os.PathLike)):
+            self._file  = open(sink, "wb")
+            self._write = self._file.write
+        elif hasattr(sink, "write"):
+            self._write = sink.write
+        else:
+            self._view = memoryview(sink).cast("B")
+            if self._view.readonly or len(self._view) < length:
+                raise ValueError(f"sink buffer must be writable and hold {length} bytes")
+
+    def put(self, offset: int, data: bytes) -> None:
+        if self._view is not None:
+            self._view[offset:offset + len(data)] = data
+        else:
+            self._write(data)
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+        if self._file is not None:
+            self._file.close()
+
+class ReadMixin:
+    def read_chunk(
+        self,
+        address: int,
+        length: int,
+        priority: Priority = Priority.NORMAL
+    ) -> bytes:
+        """
+        Read `length` bytes (up to MAX_READ, 65534) of flash at `address`.
+        Applied in SID order, after every write sent before it. Returns
+        the data.
+        """
+        _check_length(length)
+        payload = READ_FLASH_REQUEST.pack(address, length)
+        return self._call(cmd=CMD_READ_FLASH, payload=payload, priority=priority)
+
+    def read_flash(
+        self,
+        address: int,
+        length: int,
+        sink: Any,
+        chunk_size: int = 256,
+        window: int = 1,
+        priority: Priority = Priority.NORMAL,
+        crc: Optional[Crc16] = None,
+        on_chunk: Optional[ChunkCallback] = None
+    ) -> int:
+        """
+        Read flash [address, address + length) as READ_FLASH commands and
+        stream it into `sink` (see _Sink: path, binary file or writable
+        buffer) in address order. Only the chunks in the window are held
+        in memory, however large the range.
+
+        :param chunk_size: bytes per READ_FLASH (up to MAX_READ, 65534)
+        :param window:     commands in flight; 1 = stop-and-wait
+        :param crc:        Crc16 to continue (e.g. over the part of a dump
+                           already on disk); updated with the data read
+        :param on_chunk:   on_chunk(offset, length) after each chunk is written
+        Returns the CRC-16 (CCITT-False) of the data, so it can be checked
+        with verify_range(); raises GSPTimeout on failure.
+        """
+        _check_length(chunk_size, "chunk_size")
+        crc = Crc16() if crc is None else crc
+        out = _Sink(sink, length)
+        publish("status", f"Reading 0x{address:08X} (+{length})")
+        try:
+            if window <= 1:
+                for offset in range(0, length, chunk_size):
+                    n = min(chunk_size, length - offset)
+                    _store(out, crc, address, offset, n, self.read_chunk(address + offset, n, priority), on_chunk)
+            else:
+                self._read_pipelined(out, crc, address, length, chunk_size, window, priority, on_chunk)
+        finally:
+            out.close()
+        return crc.value
+
+    def _read_pipelined(self, out, crc, address, length, chunk_size, window, priority, on_chunk) -> None:
+        # responses come back in any order; hold them until the one before
+        # has been written, but never more than a window's worth
+        queue = deque()     # (offset, length, future), in address order
+        with self.pipeline(window=window) as pipe:
+            for offset in range(0, length, chunk_size):
+                if pipe.error is not None:
+                    break
+                n = min(chunk_size, length - offset)
+                queue.append((offset, n, pipe.submit(CMD_READ_FLASH, READ_FLASH_REQUEST.pack(address + offset, n), priority)))
+                while queue and (queue[0][2].done() or len(queue) >= window):
+                    offset, n, future = queue.popleft()
+                    _store(out, crc, address, offset, n, future.result(), on_chunk)
+            while queue:
+                offset, n, future = queue.popleft()
+                _store(out, crc, address, offset, n, future.result(), on_chunk)
+
+def _check_length(length: int, name: str = "length") -> None:
+    if not 0 < length <= MAX_READ:
+        raise ValueError(f"{name} must be between 1 and {MAX_READ}")
+
+def _store(
+    out: _Sink,
+    crc: Crc16,
+    address: int,
+    offset: int,
+    length: int,
+    data: bytes,
+    on_chunk: Optional[ChunkCallback]
+) -> None:
+    if len(data) != length:
+        raise ValueError(f"READ_FLASH at 0x{address + offset:08X} returned {len(data)} of {length} bytes")
+    out.put(offset, data)
+    crc.update(data)
+    publish("progress", length)
+    if on_chunk is not None:
+        on_chunk(offset, length)
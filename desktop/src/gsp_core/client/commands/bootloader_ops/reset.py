@@ -2,9 +2,9 @@ from gsp_core.events import publish
 from gsp_core.protocol.commands import CMD_RESET_AND_RUN
 
 class ResetMixin:
-    def reset_and_run(self) -> None:
+    def reset_and_run(self) -> bytes:
         """
         Exit bootloader and run the main application.
         """
         publish("status", "Resetting and running")
-        self._call(cmd=CMD_RESET_AND_RUN)
+        return self._call(cmd=CMD_RESET_AND_RUN)
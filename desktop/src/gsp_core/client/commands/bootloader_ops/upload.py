@@ -0,0 +1,491 @@
+import mmap
+import os
+import time
+from functools import partial
+from struct import Struct
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from gsp_core.client.base import GSPTimeout, GSPVerifyError
+from gsp_core.client.commands.bootloader_ops.verify import range_result
+from gsp_core.client.journal import UploadJournal
+from gsp_core.client.tuner import ChunkTuner
+from gsp_core.events import publish
+from gsp_core.image.blank import is_blank
+from gsp_core.image.sectors import EraseStep, SectorMap, plan_erases
+from gsp_core.image.segments import SegmentMap
+from gsp_core.protocol.commands import (
+    CMD_ERASE_FLASH, CMD_SET_ADDRESS, CMD_VERIFY_RANGE, CMD_WRITE_CHUNK, VERIFY_RANGE_REQUEST,
+)
+from gsp_core.protocol.cra import MAX_PAYLOAD, Priority
+from gsp_core.protocol.crc import Crc16
+
+_READ_BLOCK = 1 << 16   # read size for file objects that cannot be mapped
+_ADDRESS    = Struct("<I")
+_REGION     = Struct("<II")
+
+# on_chunk(offset, length): called once the target has accepted a chunk
+ChunkCallback = Callable[[int, int], None]
+
+class ImageSource:
+    """
+    Zero-copy chunk view of a firmware image, as a context manager.
+
+    `source` may be
+      - a path (str / os.PathLike): the file is mmap'ed read-only, so only
+        the pages being sent are resident, however large the image
+      - any buffer-protocol object (bytes, bytearray, memoryview, mmap,
+        array, numpy array): sliced in place
+      - a binary file object, or an iterable of bytes-like blocks of any
+        size: re-cut into chunk_size pieces through one reusable buffer
+
+    chunks() yields (offset, memoryview) pairs. A chunk is only valid until
+    the next one is requested; frame encoding copies it once into the wire
+    buffer, so callers just send it (and may release() it). chunk_size may
+    be changed between chunks (ChunkTuner does).
+
+        with ImageSource("firmware.bin") as image:
+            for offset, chunk in image.chunks():
+                client.write_chunk(chunk)
+    """
+    def __init__(self, source: Any, chunk_size: int = 256):
+        """
+        :param source:     path, buffer, binary file or iterable of blocks
+        :param chunk_size: bytes per chunk (1–65535)
+        """
+        if not 0 < chunk_size <= MAX_PAYLOAD:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_PAYLOAD}")
+        self.source     = source
+        self.chunk_size = chunk_size
+        self.size: Optional[int] = None   # None for streams of unknown length
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._blocks: Optional[Iterable] = None
+
+    def __enter__(self) -> "ImageSource":
+        src = self.source
+        if isinstance(src, (str, os.PathLike)):
+            self._file = open(src, "rb")
+            self.size  = os.fstat(self._file.fileno()).st_size
+            if self.size:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._map, "madvise"):
+                    # sent once, front to back: read ahead, drop behind
+                    self._map.madvise(mmap.MADV_SEQUENTIAL)
+                self._view = memoryview(self._map)
+            else:
+                self._view = memoryview(b"")
+        elif hasattr(src, "read") and not _is_buffer(src):
+            self._blocks = iter(partial(src.read, _READ_BLOCK), b"")
+        elif _is_buffer(src):
+            self._view = memoryview(src).cast("B")
+            self.size  = self._view.nbytes
+        else:
+            self._blocks = src
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # a chunk is still referenced (e.g. from a traceback);
+                # the map is closed when that reference goes away
+                pass
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def chunks(self, start: int = 0) -> Iterator[Tuple[int, memoryview]]:
+        """Yield (offset, chunk) from byte `start` to the end of the image."""
+        if self._view is not None:
+            return self._slices(start)
+        if self._blocks is None:
+            raise RuntimeError("ImageSource used outside its 'with' block")
+        return self._rechunk(start)
+
+    def _slices(self, start: int) -> Iterator[Tuple[int, memoryview]]:
+        view, off = self._view, start
+        while off < len(view):
+            step = self.chunk_size
+            yield off, view[off:off + step]
+            off += step
+
+    def _rechunk(self, start: int) -> Iterator[Tuple[int, memoryview]]:
+        step   = self.chunk_size
+        stage  = bytearray(step)
+        fill   = 0
+        offset = 0      # image offset of the next byte to be emitted
+        skip   = start
+        for block in self._blocks:
+            view = memoryview(block).cast("B")
+            if skip:
+                n = min(skip, len(view))
+                view, skip, offset = view[n:], skip - n, offset + n
+            pos, end = 0, len(view)
+            while pos < end:
+                if not fill:
+                    step = self.chunk_size
+                    if end - pos >= step:
+                        # whole chunk inside this block: no copy
+                        yield offset, view[pos:pos + step]
+                        pos += step
+                        offset += step
+                        continue
+                    if len(stage) < step:
+                        stage = bytearray(step)
+                take = min(step - fill, end - pos)
+                stage[fill:fill + take] = view[pos:pos + take]
+                fill += take
+                pos  += take
+                if fill == step:
+                    yield offset, memoryview(stage)[:step]
+                    offset += step
+                    fill = 0
+        if fill:
+            yield offset, memoryview(stage)[:fill]
+
+def _is_buffer(obj: Any) -> bool:
+    try:
+        memoryview(obj).release()
+        return True
+    except TypeError:
+        return False
+
+def _acked(on_chunk: ChunkCallback, offset: int, length: int, future: Any) -> None:
+    if not future.cancelled() and future.exception() is None:
+        on_chunk(offset, length)
+
+def _journaled(
+    journal: UploadJournal,
+    on_chunk: Optional[ChunkCallback],
+    offset: int,
+    length: int
+) -> None:
+    journal.ack(offset, length)
+    if on_chunk is not None:
+        on_chunk(offset, length)
+
+def _relocated(on_chunk: ChunkCallback, address: int, offset: int, length: int) -> None:
+    on_chunk(address + offset, length)
+
+class UploadMixin:
+    def upload_image(
+        self,
+        source: Any,
+        chunk_size: Union[int, ChunkTuner] = 256,
+        priority: Priority = Priority.NORMAL,
+        window: int = 1,
+        start: int = 0,
+        address: Optional[int] = None,
+        journal: Optional[UploadJournal] = None,
+        erased_value: Optional[int] = None,
+        verify: bool = False,
+        on_chunk: Optional[ChunkCallback] = None
+    ) -> int:
+        """
+        Stream a whole image to the target as WRITE_CHUNK commands without
+        loading it into memory (see ImageSource for accepted sources).
+
+        :param chunk_size: bytes per WRITE_CHUNK (up to 65535), or a
+                           ChunkTuner that adapts it to the link as it goes
+        :param window:     commands in flight; 1 = stop-and-wait
+        :param start:      image offset to begin at (skip what is already written)
+        :param address:    flash address of image offset 0; if given, the
+                           write pointer is set to address + start first
+        :param journal:    UploadJournal checkpointing acknowledged bytes; a
+                           resumed journal supplies start (and address). It
+                           is saved if the upload stops early, removed once
+                           the image is complete.
+        :param erased_value: byte value of erased flash; chunks consisting
+                           only of it are not sent (the flash already reads
+                           that way) and the write pointer is moved past
+                           them with SET_ADDRESS. Needs `address`.
+        :param verify:     check the written range with one VERIFY_RANGE,
+                           its CRC computed while streaming; raises
+                           GSPVerifyError on mismatch. Needs `address`.
+                           The check runs after the journal is removed
+                           (every chunk was acknowledged), so the
+                           exception's message is the only record of a
+                           mismatch: re-write the image to repair it.
+        :param on_chunk:   on_chunk(offset, length) after each accepted
+                           (or skipped blank) chunk
+        Returns the number of bytes sent; raises GSPTimeout on failure.
+        """
+        tuner = chunk_size if isinstance(chunk_size, ChunkTuner) else None
+        size  = tuner.size if tuner is not None else chunk_size
+        if journal is not None:
+            on_chunk = partial(_journaled, journal, on_chunk)
+            if journal.resumed:
+                start   = max(start, journal.confirmed)
+                address = journal.address if address is None else address
+        if erased_value is not None and address is None:
+            raise ValueError("skipping blank chunks needs the image's flash address")
+        if verify and address is None:
+            raise ValueError("verifying needs the image's flash address")
+        if address is not None:
+            self.set_address(address + start, priority)
+        blank    = _Blanks(address, erased_value, on_chunk)
+        expected = _Expected() if verify else None
+
+        try:
+            with ImageSource(source, size) as image:
+                if window <= 1:
+                    sent = self._upload_serial(image, start, priority, tuner, blank, expected, on_chunk)
+                else:
+                    sent = self._upload_pipelined(image, start, priority, window, tuner, blank, expected, on_chunk)
+        finally:
+            # also on GSPTimeout / Ctrl-C: keep what was confirmed
+            if journal is not None and not journal.done:
+                journal.save()
+        if journal is not None:
+            journal.discard()
+        if blank.skipped:
+            publish("status", f"Skipped {blank.skipped} blank bytes")
+        if expected is not None:
+            expected.check(self.verify_range(address + start, expected.length, expected.value, priority),
+                           address + start)
+        return sent
+
+    def upload_segments(
+        self,
+        image: SegmentMap,
+        erase: bool = True,
+        chunk_size: Union[int, ChunkTuner] = 256,
+        priority: Priority = Priority.NORMAL,
+        window: int = 1,
+        erased_value: Optional[int] = None,
+        sectors: Optional[SectorMap] = None,
+        max_erase: int = 0,
+        verify: bool = False,
+        on_chunk: Optional[ChunkCallback] = None
+    ) -> int:
+        """
+        Program a sparse image (see gsp_core.image): erase every populated
+        range, then SET_ADDRESS and stream each segment. Gaps between
+        segments are neither erased nor sent.
+
+        All ranges are erased before the first write, so a range sharing
+        an erase sector with a previous segment cannot wipe it. Given the
+        target's `sectors`, the erases are planned per sector instead (see
+        plan_erases) and sent in the same command stream as the writes:
+        each sector is erased right before its data, while the previous
+        sector's chunks are still in the window.
+        :param erase:    erase the populated ranges first
+        :param erased_value: skip chunks of erased flash (see upload_image);
+                         only meaningful together with `erase`
+        :param sectors:  erase geometry; interleave sector erases with writes
+        :param max_erase: with `sectors`: merge neighbouring sectors into
+                         erases of up to this many bytes (0: one per sector)
+        :param verify:   VERIFY_RANGE every segment (with `sectors`: every
+                         piece of a sector) once written
+        :param on_chunk: on_chunk(flash_address, length) per accepted chunk
+        Returns the number of bytes sent.
+        """
+        if erase and sectors is not None:
+            steps = plan_erases(image, sectors, max_erase)
+            return self._upload_steps(steps, chunk_size, priority, window, erased_value, verify, on_chunk)
+        if erase:
+            for address, length in image.ranges():
+                self.erase_flash(address, length, priority)
+        sent = 0
+        for seg in image:
+            report = partial(_relocated, on_chunk, seg.address) if on_chunk is not None else None
+            sent += self.upload_image(
+                seg.data, chunk_size, priority, window, address=seg.address,
+                erased_value=erased_value if erase else None, verify=verify, on_chunk=report
+            )
+        return sent
+
+    def _core(self) -> Any:
+        # ScheduledGSPClient keeps counters and timeouts on its scheduler's client
+        scheduler = getattr(self, "scheduler", None)
+        return scheduler.client if scheduler is not None else self
+
+    def _retry_count(self) -> int:
+        return getattr(self._core(), "retries", 0)
+
+    def _follow(self, image: ImageSource, tuner: ChunkTuner) -> None:
+        """Apply the tuner's chunk size; a new size invalidates the learned RTT."""
+        if tuner.size != image.chunk_size:
+            image.chunk_size = tuner.size
+            rto = getattr(self._core(), "rto", None)
+            if rto is not None:
+                rto.reset(CMD_WRITE_CHUNK)
+
+    def _upload_serial(self, image, start, priority, tuner, blank, expected, on_chunk) -> int:
+        sent = 0
+        for offset, chunk in image.chunks(start):
+            n = len(chunk)
+            if expected is not None:
+                expected.update(chunk)
+            if blank.skip(offset, chunk):
+                continue
+            if blank.moved:
+                self.set_address(blank.resume(offset), priority)
+            t0, r0 = time.monotonic(), self._retry_count()
+            try:
+                self.write_chunk(chunk, priority)
+            except GSPTimeout:
+                if tuner is None or not tuner.reject(n):
+                    raise
+                # too big for the target: the same bytes at the size that worked
+                self._follow(image, tuner)
+                for i in range(0, n, tuner.size):
+                    self._call(cmd=CMD_WRITE_CHUNK, payload=chunk[i:i + tuner.size], priority=priority)
+            else:
+                if tuner is not None:
+                    tuner.record(n, time.monotonic() - t0, self._retry_count() - r0)
+                    self._follow(image, tuner)
+            chunk.release()
+            sent += n
+            if on_chunk is not None:
+                on_chunk(offset, n)
+        return sent
+
+    def _upload_steps(
+        self,
+        steps: Iterable[EraseStep],
+        chunk_size: Union[int, ChunkTuner],
+        priority: Priority,
+        window: int,
+        erased_value: Optional[int],
+        verify: bool,
+        on_chunk: Optional[ChunkCallback]
+    ) -> int:
+        """Erase and program planned steps as one pipelined command stream."""
+        tuner = chunk_size if isinstance(chunk_size, ChunkTuner) else None
+        sent, skipped = 0, 0
+        checks = []     # (address, expected, future) per written piece
+        with self.pipeline(window=window) as pipe:
+            for step in steps:
+                if pipe.error is not None:
+                    break
+                publish("status", f"Erasing 0x{step.address:08X} (+{step.length})")
+                pipe.submit(CMD_ERASE_FLASH, _REGION.pack(step.address, step.length), priority)
+                pointer = step.address          # erase rewinds the write pointer
+                for address, data in step.writes:
+                    if address != pointer:
+                        pipe.submit(CMD_SET_ADDRESS, _ADDRESS.pack(address), priority)
+                    report = partial(_relocated, on_chunk, address) if on_chunk is not None else None
+                    blank  = _Blanks(address, erased_value, report)
+                    size   = tuner.size if tuner is not None else chunk_size
+                    expected = _Expected() if verify else None
+                    with ImageSource(data, size) as image:
+                        sent += self._submit_chunks(pipe, image, 0, priority, tuner, blank, expected, report)
+                    skipped += blank.skipped
+                    pointer  = address + len(data)
+                    if expected is not None and pipe.error is None:
+                        # checked by the target after this piece's last chunk
+                        payload = VERIFY_RANGE_REQUEST.pack(address, expected.length, expected.value)
+                        checks.append((address, expected, pipe.submit(CMD_VERIFY_RANGE, payload, priority)))
+        if skipped:
+            publish("status", f"Skipped {skipped} blank bytes")
+        for address, expected, future in checks:
+            expected.check(future.result(), address)
+        return sent
+
+    def _upload_pipelined(self, image, start, priority, window, tuner, blank, expected, on_chunk) -> int:
+        with self.pipeline(window=window) as pipe:
+            return self._submit_chunks(pipe, image, start, priority, tuner, blank, expected, on_chunk)
+
+    def _submit_chunks(self, pipe, image, start, priority, tuner, blank, expected, on_chunk) -> int:
+        sent = 0
+        # with the window full, chunks are submitted at the rate they
+        # complete, so the time between submits measures goodput
+        t0, r0 = time.monotonic(), self._retry_count()
+        for offset, chunk in image.chunks(start):
+            if pipe.error is not None:
+                break
+            n = len(chunk)
+            if expected is not None:
+                expected.update(chunk)
+            if blank.skip(offset, chunk):
+                continue
+            if blank.moved:
+                # applied in SID order, between the surrounding chunks
+                pipe.submit(CMD_SET_ADDRESS, _ADDRESS.pack(blank.resume(offset)), priority)
+            publish("progress", n)
+            probe = tuner is not None and tuner.probing
+            if probe:
+                # first chunk of a new size goes alone, so that if the
+                # target cannot take it nothing queued behind it is lost
+                pipe.flush()
+            future = pipe.submit(CMD_WRITE_CHUNK, chunk, priority)
+            if probe:
+                if future.exception() is None:
+                    tuner.confirm(n)
+                elif tuner.reject(n):
+                    pipe.error = None
+                    self._follow(image, tuner)
+                    for i in range(0, n, tuner.size):
+                        future = pipe.submit(CMD_WRITE_CHUNK, chunk[i:i + tuner.size], priority)
+                t0, r0 = time.monotonic(), self._retry_count()   # the drain is not goodput
+            chunk.release()     # submit() already encoded (copied) it
+            sent += n
+            if tuner is not None and not probe:
+                t1, r1 = time.monotonic(), self._retry_count()
+                tuner.record(n, t1 - t0, r1 - r0)
+                self._follow(image, tuner)
+                t0, r0 = t1, r1
+            if on_chunk is not None:
+                future.add_done_callback(partial(_acked, on_chunk, offset, n))
+        return sent
+
+class _Blanks:
+    """Blank-chunk elision state for one upload_image() call."""
+    __slots__ = ("address", "erased", "on_chunk", "moved", "skipped")
+
+    def __init__(self, address: Optional[int], erased: Optional[int], on_chunk: Optional[ChunkCallback]):
+        self.address  = address
+        self.erased   = erased
+        self.on_chunk = on_chunk
+        self.moved    = False   # chunks were skipped: the write pointer lags
+        self.skipped  = 0       # bytes not sent
+
+    def skip(self, offset: int, chunk: memoryview) -> bool:
+        """Consume `chunk` if it is blank (reported as done, not sent)."""
+        if self.erased is None or not is_blank(chunk, self.erased):
+            return False
+        n = len(chunk)
+        chunk.release()
+        self.moved    = True
+        self.skipped += n
+        publish("progress", n)
+        if self.on_chunk is not None:
+            self.on_chunk(offset, n)
+        return True
+
+    def resume(self, offset: int) -> int:
+        """Flash address to move the write pointer to before `offset`."""
+        self.moved = False
+        return self.address + offset
+
+class _Expected:
+    """CRC-16 and length of the image bytes streamed so far, for VERIFY_RANGE."""
+    __slots__ = ("crc", "length")
+
+    def __init__(self):
+        self.crc    = Crc16()
+        self.length = 0
+
+    def update(self, chunk: memoryview) -> None:
+        self.crc.update(chunk)
+        self.length += len(chunk)
+
+    @property
+    def value(self) -> int:
+        return self.crc.value
+
+    def check(self, payload: bytes, address: int) -> None:
+        """Raise GSPVerifyError unless the VERIFY_RANGE reply says it matched."""
+        matched, crc = range_result(payload)
+        if not matched:
+            raise GSPVerifyError(
+                f"flash 0x{address:08X} (+{self.length}) reads CRC 0x{crc:04X}, "
+                f"expected 0x{self.value:04X}"
+            )
@@ -1,10 +1,37 @@
+from typing import Tuple
 from gsp_core.events import publish
-from gsp_core.protocol.commands import CMD_VERIFY_CHUNK
+from gsp_core.protocol.commands import (
+    CMD_VERIFY_CHUNK, CMD_VERIFY_RANGE, STATUS_OK, VERIFY_RANGE_REQUEST, VERIFY_RANGE_RESULT,
+)
+from gsp_core.protocol.cra import Priority
+
+def range_result(payload: bytes) -> Tuple[bool, int]:
+    """(matched, target's CRC) from a VERIFY_RANGE response payload."""
+    status, crc = VERIFY_RANGE_RESULT.unpack(payload)
+    return status == STATUS_OK, crc
 
 class VerifyMixin:
-    def verify_chunk(self) -> None:
+    def verify_chunk(self) -> bytes:
         """
         Request CRC check of the last written chunk.
         """
         publish("status", "Verifying chunk")
-        self._call(cmd=CMD_VERIFY_CHUNK)
+        return self._call(cmd=CMD_VERIFY_CHUNK)
+
+    def verify_range(
+        self,
+        address: int,
+        length: int,
+        expected_crc: int,
+        priority: Priority = Priority.NORMAL
+    ) -> bytes:
+        """
+        Have the target compare the CRC-16 (CCITT-False, see crc16()) of
+        flash [address, address + length) with `expected_crc`: one round
+        trip for a whole sector or image. Applied in SID order, after every
+        write sent before it. Returns the response payload; range_result()
+        tells whether it matched.
+        """
+        publish("status", f"Verifying 0x{address:08X} (+{length})")
+        payload = VERIFY_RANGE_REQUEST.pack(address, length, expected_crc)
+        return self._call(cmd=CMD_VERIFY_RANGE, payload=payload, priority=priority)
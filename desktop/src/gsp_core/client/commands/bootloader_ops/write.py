@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from gsp_core.events import publish
 from gsp_core.protocol.commands import CMD_WRITE_CHUNK
 from gsp_core.protocol.cra import Priority
@@ -7,9 +9,33 @@ class WriteMixin:
         self,
         data: bytes,
         priority: Priority = Priority.NORMAL
-    ) -> None:
+    ) -> bytes:
         """
-        Send one 0–256 byte data chunk to the target.
+        Send one data chunk (bytes or memoryview, up to 65535 bytes; 256 is
+        accepted by every target) to the target.
         """
         publish("progress", len(data))
-        self._call(cmd=CMD_WRITE_CHUNK, payload=data, priority=priority)
+        return self._call(cmd=CMD_WRITE_CHUNK, payload=data, priority=priority)
+
+class PipelinedWriteMixin:
+    """Bulk writes over self.pipeline(); only for clients that can open one."""
+    def write_chunks(
+        self,
+        chunks: Iterable[bytes],
+        priority: Priority = Priority.NORMAL,
+        window: int = 8
+    ) -> None:
+        """
+        Stream many chunks with up to `window` WRITE_CHUNK commands in flight.
+        Stops submitting at the first chunk that exhausts its retries and
+        raises GSPTimeout once the outstanding ones have drained.
+
+        Chunks carry no address, so the target must apply them in SID order
+        even if a re-sent chunk arrives after its successors.
+        """
+        with self.pipeline(window=window) as pipe:
+            for chunk in chunks:
+                if pipe.error is not None:
+                    break
+                publish("progress", len(chunk))
+                pipe.submit(CMD_WRITE_CHUNK, chunk, priority)
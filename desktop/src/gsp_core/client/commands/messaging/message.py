@@ -9,9 +9,9 @@ class MessageMixin:
         self,
         data: bytes,
         priority: Priority = Priority.NORMAL
-    ) -> None:
+    ) -> bytes:
         """
         Send an arbitrary message blob to the board.
         """
         publish("status", f"Sending message ({len(data)} bytes)")
-        self._call(cmd=CMD_SEND_MESSAGE, payload=data, priority=priority)
+        return self._call(cmd=CMD_SEND_MESSAGE, payload=data, priority=priority)
@@ -0,0 +1,95 @@
+# src/gsp_core/client/dispatch.py
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from gsp_core.events import publish
+from gsp_core.protocol.commands import STATUS_OK, STATUS_ERROR
+from gsp_core.protocol.cra import AckFrame, CommandFrame, Frame, ResponseFrame
+
+# handler(frame) -> response payload (None = empty); raising answers STATUS_ERROR
+Handler = Callable[[CommandFrame], Optional[bytes]]
+
+# remembered device commands, so a re-sent one is answered, not re-run
+_HISTORY = 32
+
+class Dispatcher:
+    """
+    Receive-side router for frames that are not the response a client is
+    waiting for:
+
+      - commands sent by the device go to the handler registered for
+        their command ID; the handler's return value is sent back as an
+        OK response (an exception, or no handler, answers STATUS_ERROR)
+      - ACK frames are counted and consumed
+      - responses to SIDs nobody waits for any more (a late reply to an
+        attempt that was already re-sent) are discarded
+
+    None of these make the client re-send its own command.
+
+        @client.dispatcher.on(CMD_SEND_MESSAGE)
+        def log_message(frame):
+            print(bytes(frame.payload))
+    """
+    def __init__(self):
+        self._handlers: Dict[int, Handler] = {}
+        self._answered: "OrderedDict[int, Tuple[bytes, ResponseFrame]]" = OrderedDict()
+
+        # counters
+        self.commands   = 0   # device commands handled
+        self.duplicates = 0   # re-sent device commands answered from the cache
+        self.acks       = 0   # ACK frames consumed
+        self.stale      = 0   # late responses discarded
+
+    def register(self, cmd: int, handler: Handler) -> None:
+        """Route device-initiated `cmd` frames to `handler`."""
+        self._handlers[cmd] = handler
+
+    def unregister(self, cmd: int) -> None:
+        """Stop handling `cmd`; such frames are answered with an error."""
+        self._handlers.pop(cmd, None)
+
+    def on(self, cmd: int) -> Callable[[Handler], Handler]:
+        """Decorator form of register()."""
+        def deco(handler: Handler) -> Handler:
+            self.register(cmd, handler)
+            return handler
+        return deco
+
+    def route(self, frame: Frame) -> Optional[ResponseFrame]:
+        """
+        Handle one unsolicited frame. Returns the response to send back
+        to the device, if any.
+        """
+        if isinstance(frame, ResponseFrame):
+            self.stale += 1
+            return None
+        if isinstance(frame, AckFrame):
+            self.acks += 1
+            return None
+        return self._command(frame)
+
+    def _command(self, frame: CommandFrame) -> ResponseFrame:
+        key = bytes(frame.payload)
+        seen = self._answered.get(frame.sid)
+        if seen is not None and seen[0] == (frame.cmd, key):
+            self.duplicates += 1
+            return seen[1]
+
+        self.commands += 1
+        handler = self._handlers.get(frame.cmd)
+        if handler is None:
+            publish("error", f"No handler for device command 0x{frame.cmd:02X}")
+            resp = ResponseFrame(frame.sid, STATUS_ERROR)
+        else:
+            try:
+                resp = ResponseFrame(frame.sid, STATUS_OK, handler(frame) or b"")
+            except Exception as e:
+                publish("error", f"Handler for device command 0x{frame.cmd:02X} failed: {e}")
+                resp = ResponseFrame(frame.sid, STATUS_ERROR)
+
+        self._answered[frame.sid] = ((frame.cmd, key), resp)
+        self._answered.move_to_end(frame.sid)
+        if len(self._answered) > _HISTORY:
+            self._answered.popitem(last=False)
+        return resp
@@ -0,0 +1,275 @@
+# src/gsp_core/client/flashcache.py
+
+import hashlib
+import os
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from gsp_core.client.statefile import read_state, write_atomic, write_state
+from gsp_core.image.sectors import SectorMap
+from gsp_core.image.segments import SegmentMap
+from gsp_core.protocol.crc import crc16, crc16_batch
+
+_VERSION = 2
+
+# check(address, length, crc): does the device's flash range have this CRC-16?
+RangeCheck = Callable[[int, int, int], bool]
+
+class FlashPlan:
+    """
+    What to program on one device: `image` is either the whole new image
+    (`full`, with the `reason`) or only its changed sectors.
+    """
+    def __init__(
+        self,
+        device: str,
+        image: SegmentMap,
+        full: bool,
+        reason: str,
+        changed: int,
+        sectors: List[int],
+        sizes: List[int],
+        crcs: List[int],
+        flat: bytes
+    ):
+        self.device  = device
+        self.image   = image
+        self.full    = full
+        self.reason  = reason
+        self.changed = changed       # sectors to erase and rewrite
+        self.sectors = sectors       # addresses of all sectors the image touches
+        self.sizes   = sizes         # and their sizes
+        self.crcs    = crcs          # CRC-16 of each of them
+        self.flat    = flat          # their contents, back to back
+        self.digest  = hashlib.sha256(flat).hexdigest()
+
+    def __repr__(self) -> str:
+        kind = f"full: {self.reason}" if self.full else "differential"
+        return f"FlashPlan({self.device!r}, {self.changed}/{len(self.sectors)} sectors, {kind})"
+
+class FlashCache:
+    """
+    Host-side record, per device, of the image last flashed there, so a
+    re-flash only erases and rewrites the sectors that changed.
+
+    Sectors are the target's erase sectors (`sectors`, a SectorMap, or a
+    uniform `sector_size`), so a changed piece is always rewritten whole.
+    Every sector the image touches is described by its contents (image
+    bytes, gaps as erased flash) and their CRC-16. A sector counts as
+    unchanged when its CRC matches the record and its bytes match the
+    cached copy of the old contents; the byte check rules out CRC-16
+    collisions. Contents are stored once per distinct image, so a line
+    of boards running the same firmware shares one copy.
+
+        cache = FlashCache("~/.gsp/cache", sectors=sectors)
+        plan  = cache.plan(device, load_image("fw.hex"))
+        cache.begin(plan)
+        client.upload_segments(plan.image, erased_value=0xFF, sectors=sectors)
+        cache.commit(plan)
+
+    The record can only know about flashes made through it. Everything it
+    cannot vouch for falls back to a full flash: no record, a record for
+    other sector geometry, a missing or damaged copy, a record older than
+    `max_age`, or an earlier flash that never committed (begin() removes
+    the record first). Given a `check`, plan() also confirms on the device
+    that the sectors it would leave alone hold what the record says, which
+    catches another board behind the same adapter, or flash changed by
+    another tool.
+    """
+    def __init__(
+        self,
+        root: str,
+        sector_size: int = 2048,
+        erased_value: int = 0xFF,
+        max_age: Optional[float] = None,
+        sectors: Optional[SectorMap] = None
+    ):
+        """
+        :param root:         cache directory (created on demand)
+        :param sector_size:  erase granularity of the target, in bytes
+        :param sectors:      erase geometry instead of a uniform sector_size
+        :param erased_value: value of an erased byte, for gaps in images
+        :param max_age:      seconds after which a record is not trusted
+                             (None: no limit)
+        """
+        if sectors is None:
+            sectors = SectorMap(uniform=sector_size)
+        self.root         = os.path.expanduser(os.fspath(root))
+        self.sectors      = sectors
+        self.erased_value = erased_value
+        self.max_age      = max_age
+
+    # ─── planning ───────────────────────────────────────────────────────
+
+    def plan(
+        self,
+        device: str,
+        image: SegmentMap,
+        full: bool = False,
+        check: Optional[RangeCheck] = None
+    ) -> FlashPlan:
+        """
+        Compare `image` against what `device` last received.
+
+        :param full:  ignore the record and flash everything
+        :param check: check(address, length, crc) -> True if the device's
+                      flash range has that CRC-16 (e.g. a VERIFY_RANGE);
+                      called once per run of unchanged sectors, and any
+                      False makes the plan full
+        """
+        pieces  = self._sectors(image)
+        sectors = [a for a, _ in pieces]
+        sizes   = [n for _, n in pieces]
+        flat    = b"".join(image.read(a, n, self.erased_value) for a, n in pieces)
+        offsets = _offsets(sizes)
+        crcs    = self._crcs(flat, sizes, offsets)
+
+        def whole(reason: str) -> FlashPlan:
+            return FlashPlan(device, image, True, reason, len(sectors), sectors, sizes, crcs, flat)
+
+        if full:
+            return whole("requested")
+        state = read_state(self._record(device), _VERSION)
+        if state is None or state.get("device") != device:
+            return whole("no record for this device")
+        if (state.get("geometry"), state.get("erased_value")) != (self.sectors.layout(), self.erased_value):
+            return whole("record is for other sector geometry")
+        if self.max_age is not None and time.time() - state.get("time", 0) > self.max_age:
+            return whole("record is too old")
+        old = self._load_contents(state)
+        if old is None:
+            return whole("cached image is missing or damaged")
+
+        old_sectors, old_flat = old
+        view, changed = memoryview(flat), []
+        for i, (a, n) in enumerate(pieces):
+            start, end = offsets[i], offsets[i] + n
+            prev = old_sectors.get(a)
+            if (prev is None or prev[2] != crcs[i] or prev[1] != n
+                    or old_flat[prev[0]:prev[0] + n] != view[start:end]):
+                changed.append(i)
+        patch = SegmentMap()
+        for i in changed:
+            patch.add(sectors[i], flat[offsets[i]:offsets[i] + sizes[i]])   # adjacent sectors merge
+        if check is not None:
+            for address, length, crc in _kept(pieces, offsets, view, set(changed)):
+                if not check(address, length, crc):
+                    return whole(f"flash at 0x{address:08X} (+{length}) does not match the record")
+        return FlashPlan(device, patch, False, "", len(changed), sectors, sizes, crcs, flat)
+
+    def _sectors(self, image: SegmentMap) -> List[Tuple[int, int]]:
+        """
+        (address, size) of the sectors `image` has data in, ascending.
+        Raises ValueError for data outside the sector layout.
+        """
+        out: List[Tuple[int, int]] = []
+        for seg in image:
+            for start, size in self.sectors.covering(seg.address, len(seg)):
+                if not out or start > out[-1][0]:
+                    out.append((start, size))
+        return out
+
+    def _crcs(self, flat: bytes, sizes: List[int], offsets: List[int]) -> List[int]:
+        if not flat:
+            return []
+        if self.sectors.uniform is not None:
+            return list(crc16_batch(flat, self.sectors.uniform))
+        view = memoryview(flat)
+        return [crc16(view[o:o + n]) for o, n in zip(offsets, sizes)]
+
+    def _load_contents(self, state: Dict[str, Any]) -> Optional[Tuple[Dict[int, Tuple[int, int, int]], bytes]]:
+        """({sector address: (offset, size, crc)}, contents) of a record, if intact."""
+        try:
+            sectors, offset = {}, 0
+            for a, n, c in state["sectors"]:
+                sectors[int(a)] = (offset, int(n), int(c))
+                offset += int(n)
+            with open(self._blob(state["sha256"]), "rb") as f:
+                flat = f.read()
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+        if len(flat) != offset or hashlib.sha256(flat).hexdigest() != state["sha256"]:
+            return None
+        return sectors, flat
+
+    # ─── recording ──────────────────────────────────────────────────────
+
+    def begin(self, plan: FlashPlan) -> None:
+        """
+        Forget the device's record before programming it: until commit()
+        its flash is in an unknown state, and the next plan must be full.
+        """
+        self.invalidate(plan.device)
+
+    def commit(self, plan: FlashPlan) -> None:
+        """Record the planned image as the device's contents (after success)."""
+        os.makedirs(os.path.join(self.root, "images"), exist_ok=True)
+        blob = self._blob(plan.digest)
+        if not os.path.exists(blob):
+            write_atomic(blob, plan.flat)
+        state = {
+            "version":      _VERSION,
+            "device":       plan.device,
+            "time":         time.time(),
+            "geometry":     self.sectors.layout(),
+            "erased_value": self.erased_value,
+            "sha256":       plan.digest,
+            "sectors":      [[a, n, c] for a, n, c in zip(plan.sectors, plan.sizes, plan.crcs)],
+        }
+        write_state(self._record(plan.device), state)
+        self._prune()
+
+    def invalidate(self, device: str) -> None:
+        """Drop the record of `device`; its next plan is a full flash."""
+        try:
+            os.remove(self._record(device))
+        except FileNotFoundError:
+            pass
+
+    def _prune(self) -> None:
+        """Remove cached contents no device record refers to any more."""
+        records = os.path.join(self.root, "devices")
+        used = set()
+        for name in os.listdir(records):
+            state = read_state(os.path.join(records, name), _VERSION)
+            if state is not None:
+                used.add(state.get("sha256"))
+        images = os.path.join(self.root, "images")
+        for name in os.listdir(images):
+            if name.endswith(".bin") and name[:-4] not in used:
+                os.remove(os.path.join(images, name))
+
+    # ─── files ──────────────────────────────────────────────────────────
+
+    def _record(self, device: str) -> str:
+        # device names are port paths or USB serials; keep them filename-safe
+        return os.path.join(self.root, "devices", re.sub(r"[^\w.-]", "_", device) + ".json")
+
+    def _blob(self, digest: str) -> str:
+        return os.path.join(self.root, "images", digest + ".bin")
+
+def _kept(
+    pieces: List[Tuple[int, int]],
+    offsets: List[int],
+    flat: memoryview,
+    changed: Set[int]
+) -> List[Tuple[int, int, int]]:
+    """(address, length, CRC-16) of each run of adjacent unchanged sectors."""
+    runs: List[List[int]] = []     # [address, length, offset in flat]
+    for i, (a, n) in enumerate(pieces):
+        if i in changed:
+            continue
+        if runs and runs[-1][0] + runs[-1][1] == a:
+            runs[-1][1] += n
+        else:
+            runs.append([a, n, offsets[i]])
+    return [(a, n, crc16(flat[o:o + n])) for a, n, o in runs]
+
+def _offsets(sizes: List[int]) -> List[int]:
+    """Start of each sector in the back-to-back contents."""
+    out, offset = [], 0
+    for n in sizes:
+        out.append(offset)
+        offset += n
+    return out
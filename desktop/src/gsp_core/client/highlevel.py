@@ -1,17 +1,24 @@
-from gsp_core.client.base import BaseGSPClient, GSPTimeout
+from gsp_core.client.base import BaseGSPClient, GSPTimeout, GSPVerifyError
 from gsp_core.client.commands.bootloader_ops.erase import EraseMixin
-from gsp_core.client.commands.bootloader_ops.write import WriteMixin
+from gsp_core.client.commands.bootloader_ops.write import WriteMixin, PipelinedWriteMixin
 from gsp_core.client.commands.bootloader_ops.verify import VerifyMixin
 from gsp_core.client.commands.bootloader_ops.reset import ResetMixin
 from gsp_core.client.commands.bootloader_ops.abort import AbortMixin
+from gsp_core.client.commands.bootloader_ops.address import AddressMixin
+from gsp_core.client.commands.bootloader_ops.read import ReadMixin
+from gsp_core.client.commands.bootloader_ops.upload import UploadMixin
 from gsp_core.client.commands.messaging.message    import MessageMixin
 
 class GSPClient(BaseGSPClient,
                 EraseMixin,
                 WriteMixin,
+                PipelinedWriteMixin,
                 VerifyMixin,
                 ResetMixin,
                 AbortMixin,
+                AddressMixin,
+                UploadMixin,
+                ReadMixin,
                 MessageMixin):
     """
     High-level GSP client composed of:
@@ -0,0 +1,149 @@
+# src/gsp_core/client/journal.py
+
+import hashlib
+import os
+import time
+from typing import Any, Dict, Optional
+
+from gsp_core.client.statefile import read_state, write_state
+from gsp_core.events import publish
+
+_VERSION = 1
+
+def image_digest(source: Any) -> str:
+    """
+    SHA-256 (hex) of an image given as a path or a buffer-protocol object.
+    Files are hashed through a memory map, so large images are not loaded.
+    """
+    # late import: upload.py builds on this module
+    from gsp_core.client.commands.bootloader_ops.upload import ImageSource
+    with ImageSource(source) as image:
+        if image.size is None:
+            raise ValueError("resumable uploads need a file or a buffer, not a stream")
+        h = hashlib.sha256()
+        for _, chunk in image.chunks():
+            h.update(chunk)
+        return h.hexdigest()
+
+def journal_path(directory: str, image: str) -> str:
+    """
+    Journal file for uploads of `image` (a path) kept in `directory`, so
+    images in read-only places can be resumed too. Named after the image,
+    plus a hash of its absolute path to tell same-named images apart.
+    """
+    image = os.path.abspath(os.fspath(image))
+    key   = hashlib.sha256(image.encode()).hexdigest()[:12]
+    return os.path.join(os.path.expanduser(directory), f"{os.path.basename(image)}.{key}.journal")
+
+class UploadJournal:
+    """
+    On-disk checkpoint of one image upload, so an interrupted upload can
+    continue where it stopped instead of from offset 0.
+
+    The journal holds the image's SHA-256, size and flash address, and
+    `confirmed`: the length of the image prefix the target has
+    acknowledged without gaps. Acks may arrive out of order from a
+    pipeline; only the contiguous prefix counts. The file is rewritten
+    atomically at most every `interval` seconds and on save().
+
+        journal = UploadJournal.open("fw.bin.journal", "fw.bin", 0x08000000, resume=True)
+        client.upload_image("fw.bin", journal=journal)
+
+    A journal that does not match the image (rebuilt firmware, other
+    address) is ignored and the upload starts over. If the journal cannot
+    be written, the upload goes on without checkpoints (an "error" event
+    says so once).
+    """
+    def __init__(
+        self,
+        path: str,
+        digest: str,
+        size: int,
+        address: Optional[int] = None,
+        confirmed: int = 0,
+        interval: float = 1.0
+    ):
+        """
+        :param path:      journal file
+        :param digest:    SHA-256 hex of the image
+        :param size:      image size in bytes
+        :param address:   flash address of image offset 0 (needed to resume)
+        :param confirmed: bytes already acknowledged
+        :param interval:  minimum seconds between automatic saves
+        """
+        self.path      = os.fspath(path)
+        self.digest    = digest
+        self.size      = size
+        self.address   = address
+        self.confirmed = confirmed
+        self.resumed   = confirmed > 0     # picked up from an earlier run
+        self.interval  = interval
+        self._acked: Dict[int, int] = {}   # offset → end, beyond `confirmed`
+        self._saved_at = 0.0
+        self._failed   = False             # could not write: stop trying
+
+    @classmethod
+    def open(
+        cls,
+        path: str,
+        source: Any,
+        address: Optional[int] = None,
+        resume: bool = True,
+        interval: float = 1.0
+    ) -> "UploadJournal":
+        """
+        Journal for uploading `source` (path or buffer) to `address`.
+        With `resume`, progress recorded by an earlier run for the same
+        image and address is picked up.
+        """
+        digest = image_digest(source)
+        size   = os.path.getsize(source) if isinstance(source, (str, os.PathLike)) else memoryview(source).nbytes
+        confirmed = 0
+        if resume:
+            state = read_state(path, _VERSION)
+            if (state is not None
+                    and state.get("sha256") == digest
+                    and state.get("size") == size
+                    and state.get("address") == address):
+                confirmed = min(int(state.get("confirmed", 0)), size)
+        return cls(path, digest, size, address, confirmed, interval)
+
+    @property
+    def done(self) -> bool:
+        return self.confirmed >= self.size
+
+    def ack(self, offset: int, length: int) -> None:
+        """Record that image bytes [offset, offset + length) were accepted."""
+        if offset + length <= self.confirmed:
+            return
+        self._acked[offset] = offset + length
+        while self.confirmed in self._acked:
+            self.confirmed = self._acked.pop(self.confirmed)
+        if time.monotonic() - self._saved_at >= self.interval:
+            self.save()
+
+    def save(self) -> None:
+        """Write the journal now (atomically: temp file + rename)."""
+        if self._failed:
+            return
+        state = {
+            "version":   _VERSION,
+            "sha256":    self.digest,
+            "size":      self.size,
+            "address":   self.address,
+            "confirmed": self.confirmed,
+        }
+        try:
+            write_state(self.path, state)
+        except OSError as e:
+            self._failed = True
+            publish("error", f"Cannot save the upload journal ({e}); continuing without checkpoints")
+            return
+        self._saved_at = time.monotonic()
+
+    def discard(self) -> None:
+        """Remove the journal file (upload finished)."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass        # never written (or not writable): nothing to remove
@@ -0,0 +1,188 @@
+# src/gsp_core/client/pipeline.py
+
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+from gsp_core.client.base import GSPTimeout
+from gsp_core.events import publish
+from gsp_core.protocol.commands import STATUS_OK
+from gsp_core.protocol.cra import CommandFrame, ResponseFrame, Priority, parse
+
+# SIDs are 8-bit; keep the window well inside half the space so a late
+# response can never be mistaken for one from the next lap
+MAX_WINDOW = 128
+
+class PipelineFuture(Future):
+    """
+    Future for one pipelined command. The pipeline is driven by the calling
+    thread, so result()/exception() pump it until this command completes
+    instead of waiting for another thread to do so.
+    """
+    def __init__(self, pipeline: "Pipeline"):
+        super().__init__()
+        self._pipeline = pipeline
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        self._pipeline._wait_for(self)
+        return super().result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        self._pipeline._wait_for(self)
+        return super().exception(timeout)
+
+class _Outstanding:
+    __slots__ = ("cmd", "wire", "future", "sent_at", "deadline", "attempt")
+
+    def __init__(self, cmd: int, wire: bytes, future: PipelineFuture, sent_at: float, deadline: float):
+        self.cmd      = cmd
+        self.wire     = wire
+        self.future   = future
+        self.sent_at  = sent_at
+        self.deadline = deadline
+        self.attempt  = 1
+
+class Pipeline:
+    """
+    Sliding-window command execution on top of a BaseGSPClient.
+
+    Up to `window` commands are in flight at once; responses are matched
+    to their commands by SID, in whatever order they arrive. Each command
+    has its own deadline: only the commands whose response is overdue (or
+    came back with an error status) are re-sent, up to the client's
+    max_retries, after which their future fails with GSPTimeout.
+
+    Not thread-safe: submit(), flush() and PipelineFuture.result() must be
+    called from one thread, which does all the transport I/O.
+
+        with client.pipeline(window=8) as pipe:
+            futures = [pipe.submit(CMD_WRITE_CHUNK, c) for c in chunks]
+        # leaving the block waited for every response
+    """
+
+    def __init__(self, client: Any, window: int = 8, timeout: Optional[float] = None):
+        """
+        :param client:  BaseGSPClient providing transport, framing & SIDs
+        :param window:  maximum number of outstanding commands (1–128)
+        :param timeout: fixed seconds to wait for a response before
+                        re-sending; None uses the client's adaptive
+                        per-command timeouts (falling back to 1 s)
+        """
+        if not 1 <= window <= MAX_WINDOW:
+            raise ValueError(f"window must be between 1 and {MAX_WINDOW}")
+        self._client  = client
+        self._window  = window
+        self._timeout = timeout
+        self._pending: Dict[int, _Outstanding] = {}
+        self.error: Optional[BaseException] = None   # first failure, if any
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands sent but not yet completed."""
+        return len(self._pending)
+
+    def submit(
+        self,
+        cmd: int,
+        payload: bytes = b"",
+        priority: Priority = Priority.NORMAL
+    ) -> PipelineFuture:
+        """
+        Send a command without waiting for its response. Blocks (pumping
+        responses) while the window is full, or while the next SID still
+        belongs to a command being retried since the SIDs last wrapped.
+        Returns a future resolving to the response payload (bytes).
+        """
+        client = self._client
+        while len(self._pending) >= self._window or client._sid in self._pending:
+            self._pump()
+
+        sid    = client._next_sid()
+        wire   = client._encode(CommandFrame(sid=sid, cmd=cmd, payload=payload, priority=priority))
+        future = PipelineFuture(self)
+        client.transport.send(wire)
+        now = time.monotonic()
+        self._pending[sid] = _Outstanding(cmd, wire, future, now, now + self._deadline(cmd, 1))
+        return future
+
+    def _deadline(self, cmd: int, attempt: int) -> float:
+        """Seconds until attempt `attempt` of `cmd` counts as lost."""
+        if self._timeout is not None:
+            return self._timeout
+        rto = self._client._timeout(cmd, attempt)
+        return rto if rto is not None else 1.0
+
+    def flush(self) -> None:
+        """
+        Wait until every submitted command has completed.
+        Raises the first failure seen by this pipeline, if any.
+        """
+        while self._pending:
+            self._pump()
+        if self.error is not None:
+            raise self.error
+
+    def _wait_for(self, future: PipelineFuture) -> None:
+        while not future.done():
+            self._pump()
+
+    def _pump(self) -> None:
+        """Handle one received frame (or one transport timeout), then expired commands."""
+        # wait no longer than the earliest deadline among the outstanding
+        wait = None
+        if self._pending:
+            wait = max(0.0, min(e.deadline for e in self._pending.values()) - time.monotonic())
+        raw = self._client._recv(wait)
+        if raw:
+            try:
+                frame = parse(self._client._decode(raw))
+            except ValueError:
+                # corrupt frame: its command times out and is re-sent on its own
+                frame = None
+            if isinstance(frame, ResponseFrame):
+                entry = self._pending.get(frame.sid)
+                if entry is not None:
+                    if frame.status == STATUS_OK:
+                        del self._pending[frame.sid]
+                        self._client._sample(entry.cmd, entry.attempt, entry.sent_at)
+                        entry.future.set_result(bytes(frame.payload))
+                    else:
+                        self._retry(frame.sid, entry, f"GSP error status 0x{frame.status:02x}")
+                else:
+                    # response for a SID no longer pending: a duplicate
+                    self._client.dispatcher.route(frame)
+            elif frame is not None:
+                self._client._route(frame)
+                for reply in self._client._take_replies():
+                    self._client.transport.send(reply)
+
+        now = time.monotonic()
+        for sid, entry in list(self._pending.items()):
+            if entry.deadline <= now:
+                self._retry(sid, entry, f"no response within {entry.deadline - entry.sent_at:.3f}s")
+
+    def _retry(self, sid: int, entry: _Outstanding, reason: str) -> None:
+        max_retries = self._client._max_retries
+        if entry.attempt >= max_retries:
+            del self._pending[sid]
+            msg = f"Command 0x{entry.cmd:02X} (sid {sid}) failed after {max_retries} attempts: {reason}"
+            publish("error", msg)
+            exc = GSPTimeout(msg)
+            if self.error is None:
+                self.error = exc
+            entry.future.set_exception(exc)
+            return
+
+        publish("status", f"Retrying sid {sid} (attempt {entry.attempt}/{max_retries})")
+        self._client.retries += 1
+        entry.attempt += 1
+        self._client.transport.send(entry.wire)
+        entry.sent_at  = time.monotonic()
+        entry.deadline = entry.sent_at + self._deadline(entry.cmd, entry.attempt)
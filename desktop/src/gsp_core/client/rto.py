@@ -0,0 +1,150 @@
+# src/gsp_core/client/rto.py
+
+import random
+from typing import Any, Dict, Mapping, Optional
+
+from gsp_core.protocol import commands
+
+# RFC 6298 §2 constants
+_ALPHA = 1 / 8
+_BETA  = 1 / 4
+_K     = 4
+_G     = 0.001   # clock granularity (s)
+
+class RttEstimator:
+    """
+    Smoothed round-trip time of one command ID (RFC 6298 §2).
+
+    Until the first sample the retransmit timeout is `initial`; after it,
+    RTO = SRTT + max(G, K·RTTVAR), clamped to [floor, ceiling].
+    """
+    __slots__ = ("srtt", "rttvar", "rto", "floor", "ceiling", "samples")
+
+    def __init__(self, initial: float, floor: float, ceiling: float):
+        self.srtt:   Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.floor   = floor
+        self.ceiling = ceiling
+        self.rto     = min(max(initial, floor), ceiling)
+        self.samples = 0
+
+    def sample(self, rtt: float) -> None:
+        """Fold one measured round trip (seconds) into the estimate."""
+        if self.srtt is None:
+            self.srtt   = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - _BETA) * self.rttvar + _BETA * abs(self.srtt - rtt)
+            self.srtt   = (1 - _ALPHA) * self.srtt + _ALPHA * rtt
+        self.samples += 1
+        rto = self.srtt + max(_G, _K * self.rttvar)
+        self.rto = min(max(rto, self.floor), self.ceiling)
+
+class RetransmitPolicy:
+    """
+    Per-command retransmit timeouts with jittered exponential backoff.
+
+    Each command ID gets its own RttEstimator, so a slow ERASE_FLASH does
+    not inflate the timeout of a fast WRITE_CHUNK. Attempt n waits
+
+        min(ceiling, RTO · backoff^(n-1)) · uniform(1 - jitter, 1 + jitter)
+
+    where the jitter keeps commands that timed out together (pipelining,
+    many boards on one host) from being re-sent in lockstep.
+
+    Callers only sample RTTs of commands answered on their first attempt
+    (Karn's algorithm): a reply to a re-sent command is ambiguous.
+    """
+    def __init__(
+        self,
+        initial:   float = 1.0,
+        floor:     float = 0.005,
+        ceiling:   float = 2.0,
+        backoff:   float = 2.0,
+        jitter:    float = 0.1,
+        overrides: Optional[Mapping[int, Mapping[str, float]]] = None,
+        seed:      Optional[int] = None
+    ):
+        """
+        :param initial:   timeout before the first RTT sample (s)
+        :param floor:     smallest timeout ever used (s)
+        :param ceiling:   largest timeout ever used (s)
+        :param backoff:   timeout multiplier per retry
+        :param jitter:    ± fraction of random spread applied to retries
+        :param overrides: {cmd_id: {"initial"/"floor"/"ceiling": s}}
+        :param seed:      seed for the jitter generator
+        """
+        self.initial    = initial
+        self.floor      = floor
+        self.ceiling    = ceiling
+        self.backoff    = backoff
+        self.jitter     = jitter
+        self._overrides = dict(overrides or {})
+        self._est: Dict[int, RttEstimator] = {}
+        self._rng       = random.Random(seed)
+
+    @classmethod
+    def from_config(
+        cls,
+        section: Mapping[str, Any],
+        initial: Optional[float] = None
+    ) -> Optional["RetransmitPolicy"]:
+        """
+        Build a policy from the `timeouts` config section, or return None
+        if adaptive timeouts are switched off. `initial` (e.g. the
+        transport's own timeout) is used when the section sets none.
+        Per-command keys are mnemonics ("erase_flash") or command IDs.
+        """
+        if not section.get("adaptive", True):
+            return None
+        overrides = {}
+        for key, limits in (section.get("commands") or {}).items():
+            overrides[_command_id(key)] = dict(limits)
+        if section.get("initial") is not None:
+            initial = section["initial"]
+        return cls(
+            initial=initial if initial is not None else 1.0,
+            floor=section.get("floor", 0.005),
+            ceiling=section.get("ceiling", 2.0),
+            backoff=section.get("backoff", 2.0),
+            jitter=section.get("jitter", 0.1),
+            overrides=overrides,
+        )
+
+    def estimator(self, cmd: int) -> RttEstimator:
+        """The RttEstimator for `cmd`, created on first use."""
+        est = self._est.get(cmd)
+        if est is None:
+            limits = self._overrides.get(cmd, {})
+            est = self._est[cmd] = RttEstimator(
+                limits.get("initial", self.initial),
+                limits.get("floor", self.floor),
+                limits.get("ceiling", self.ceiling),
+            )
+        return est
+
+    def timeout(self, cmd: int, attempt: int = 1) -> float:
+        """Seconds to wait for the response to `attempt` (1-based) of `cmd`."""
+        est = self.estimator(cmd)
+        if attempt <= 1:
+            return est.rto
+        rto = min(est.rto * self.backoff ** (attempt - 1), est.ceiling)
+        if self.jitter:
+            rto *= self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(max(rto, est.floor), est.ceiling)
+
+    def sample(self, cmd: int, rtt: float) -> None:
+        """Record the round trip of a command answered on its first attempt."""
+        self.estimator(cmd).sample(rtt)
+
+    def reset(self, cmd: int) -> None:
+        """Forget the RTT learned for `cmd` (e.g. its frames changed size)."""
+        self._est.pop(cmd, None)
+
+def _command_id(key: Any) -> int:
+    if isinstance(key, int):
+        return key
+    cmd = getattr(commands, "CMD_" + str(key).upper(), None)
+    if cmd is None:
+        raise ValueError(f"unknown command in timeouts config: {key!r}")
+    return cmd
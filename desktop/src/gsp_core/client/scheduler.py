@@ -0,0 +1,324 @@
+# src/gsp_core/client/scheduler.py
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from gsp_core.client.base import BaseGSPClient, GSPTimeout
+from gsp_core.client.commands.bootloader_ops.erase import EraseMixin
+from gsp_core.client.commands.bootloader_ops.write import WriteMixin, PipelinedWriteMixin
+from gsp_core.client.commands.bootloader_ops.verify import VerifyMixin
+from gsp_core.client.commands.bootloader_ops.reset import ResetMixin
+from gsp_core.client.commands.bootloader_ops.abort import AbortMixin
+from gsp_core.client.commands.bootloader_ops.address import AddressMixin
+from gsp_core.client.commands.bootloader_ops.read import ReadMixin
+from gsp_core.client.commands.bootloader_ops.upload import UploadMixin
+from gsp_core.client.commands.messaging.message    import MessageMixin
+from gsp_core.client.pipeline import MAX_WINDOW, PipelineFuture
+from gsp_core.events import publish
+from gsp_core.protocol.cra import CommandFrame, Priority
+
+class LatencyStats:
+    """
+    Submit-to-completion latency of one priority level.
+    Keeps totals plus the last `window` samples for percentiles.
+    """
+    def __init__(self, window: int = 1024):
+        self.count  = 0
+        self.total  = 0.0
+        self.max    = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max    = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """p-th percentile (0–100) of the recent samples."""
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+class _Job:
+    __slots__ = ("cmd", "payload", "priority", "future", "submitted", "sid", "wire", "attempt")
+
+    def __init__(self, cmd: int, payload: bytes, priority: Priority):
+        self.cmd       = cmd
+        self.payload   = payload
+        self.priority  = priority
+        self.future: Future = Future()
+        self.submitted = time.monotonic()
+        self.sid: Optional[int] = None
+        self.wire      = b""
+        self.attempt   = 0
+
+class CommandScheduler:
+    """
+    Thread-safe, priority-ordered front end for a BaseGSPClient.
+
+    Any thread may submit commands; one worker thread owns the client and
+    runs them one attempt at a time, always picking the most urgent queue:
+
+      - one FIFO queue per Priority; CRITICAL before HIGH before NORMAL/LOW
+      - retries go back to the front of their own queue, so a CRITICAL
+        abort runs between two attempts of a stuck bulk write instead of
+        after all of its retries
+      - starvation protection: the head of a queue gains one priority
+        level per `aging` seconds it has been passed over, so bulk traffic
+        still progresses under a steady stream of control commands (the
+        age counts from when the command reached the head of its queue,
+        so a long backlog of bulk chunks never outranks a fresh abort)
+
+    Per-priority submit-to-completion latency is kept in `stats`.
+
+        with CommandScheduler(GSPClient(transport)) as sched:
+            bulk  = [sched.submit(CMD_WRITE_CHUNK, c, Priority.LOW) for c in chunks]
+            sched.call(CMD_ABORT, priority=Priority.CRITICAL)   # from any thread
+    """
+    def __init__(self, client: BaseGSPClient, aging: float = 0.25):
+        """
+        :param client: client whose transport this scheduler drives exclusively
+        :param aging:  seconds of waiting that promote a command by one level
+        """
+        self.client  = client
+        self.aging   = aging
+        self.stats: Dict[Priority, LatencyStats] = {p: LatencyStats() for p in Priority}
+        self._queues: Dict[Priority, Deque[_Job]] = {p: deque() for p in Priority}
+        self._head_since: Dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._cond   = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="gsp-scheduler", daemon=True)
+        self._worker.start()
+
+    def __enter__(self) -> "CommandScheduler":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def submit(
+        self,
+        cmd: int,
+        payload: bytes = b"",
+        priority: Priority = Priority.NORMAL
+    ) -> Future:
+        """Queue a command; the future resolves to its response payload."""
+        job = _Job(cmd, payload, Priority(priority))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("scheduler is closed")
+            queue = self._queues[job.priority]
+            if not queue:
+                self._head_since[job.priority] = job.submitted
+            queue.append(job)
+            self._cond.notify()
+        return job.future
+
+    def call(
+        self,
+        cmd: int,
+        payload: bytes = b"",
+        priority: Priority = Priority.NORMAL
+    ) -> bytes:
+        """Submit a command and wait for its response payload."""
+        return self.submit(cmd, payload, priority).result()
+
+    @property
+    def pending(self) -> int:
+        """Number of queued commands (including ones waiting to retry)."""
+        with self._cond:
+            return sum(len(q) for q in self._queues.values())
+
+    def close(self, cancel: bool = False) -> None:
+        """
+        Stop accepting commands and wait for the worker to finish the
+        queue — or, with cancel=True, cancel everything still queued.
+        """
+        with self._cond:
+            self._closed = True
+            if cancel:
+                for q in self._queues.values():
+                    while q:
+                        q.popleft().future.cancel()
+            self._cond.notify()
+        self._worker.join()
+
+    # ─── worker ──────────────────────────────────────────────────────────
+
+    def _next_job(self) -> Optional[_Job]:
+        """Pop the most urgent job; None once closed and drained."""
+        with self._cond:
+            while True:
+                ready: List[Priority] = [p for p, q in self._queues.items() if q]
+                if ready:
+                    now  = time.monotonic()
+                    prio = max(ready, key=lambda p: (p + (now - self._head_since[p]) / self.aging, p))
+                    self._head_since[prio] = now
+                    return self._queues[prio].popleft()
+                if self._closed:
+                    return None
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while (job := self._next_job()) is not None:
+            if job.attempt == 0:
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                client    = self.client
+                job.sid   = client._next_sid()
+                job.wire  = client._encode(CommandFrame(job.sid, job.cmd, job.payload, job.priority))
+            self._step(job)
+
+    def _step(self, job: _Job) -> None:
+        """Run one attempt of `job`; requeue it at the front on failure."""
+        client = self.client
+        job.attempt += 1
+        try:
+            result = client._attempt(job.cmd, job.sid, job.wire, job.attempt)
+        except (GSPTimeout, ValueError, RuntimeError) as e:
+            if job.attempt < client._max_retries:
+                client.retries += 1
+                publish("status", f"Retrying (attempt {job.attempt}/{client._max_retries})")
+                with self._cond:
+                    self._queues[job.priority].appendleft(job)
+                    self._head_since[job.priority] = time.monotonic()
+                return
+            self._finish(job, exc=client._give_up(job.cmd, e))
+            return
+        except Exception as e:   # transport failure: don't kill the worker
+            self._finish(job, exc=e)
+            return
+        self._finish(job, result=result)
+
+    def _finish(self, job: _Job, result: bytes = b"", exc: Optional[BaseException] = None) -> None:
+        self.stats[job.priority].record(time.monotonic() - job.submitted)
+        if exc is not None:
+            job.future.set_exception(exc)
+        else:
+            job.future.set_result(result)
+
+class ScheduledPipeline:
+    """
+    Pipeline interface (submit/flush/error, PipelineFuture results) on top
+    of a CommandScheduler, for the bulk helpers of ScheduledGSPClient.
+
+    Commands go to the scheduler's queue for their priority and its worker
+    runs them one at a time, so the window bounds how many of them wait
+    there, not how many are on the wire; commands from other threads still
+    interleave by priority. Commands submitted with one priority run in
+    submission order.
+
+    Like Pipeline, not thread-safe: the submitting thread also settles the
+    futures, so their callbacks run on it rather than on the worker.
+    """
+    def __init__(self, scheduler: CommandScheduler, window: int = 8):
+        """
+        :param scheduler: scheduler to queue the commands with
+        :param window:    maximum number of unfinished commands (1–128)
+        """
+        if not 1 <= window <= MAX_WINDOW:
+            raise ValueError(f"window must be between 1 and {MAX_WINDOW}")
+        self._scheduler = scheduler
+        self._window    = window
+        self._pending: Deque[Tuple[Future, PipelineFuture]] = deque()   # submission order
+        self.error: Optional[BaseException] = None   # first failure, if any
+
+    def __enter__(self) -> "ScheduledPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands submitted but not yet settled."""
+        return len(self._pending)
+
+    def submit(
+        self,
+        cmd: int,
+        payload: bytes = b"",
+        priority: Priority = Priority.NORMAL
+    ) -> PipelineFuture:
+        """
+        Queue a command with the scheduler; blocks while the window is
+        full. Returns a future resolving to the response payload (bytes).
+        """
+        while len(self._pending) >= self._window:
+            self._pump()
+        future = PipelineFuture(self)
+        self._pending.append((self._scheduler.submit(cmd, bytes(payload), priority), future))
+        return future
+
+    def flush(self) -> None:
+        """
+        Wait until every submitted command has completed.
+        Raises the first failure seen by this pipeline, if any.
+        """
+        while self._pending:
+            self._pump()
+        if self.error is not None:
+            raise self.error
+
+    def _wait_for(self, future: PipelineFuture) -> None:
+        while not future.done():
+            self._pump()
+
+    def _pump(self) -> None:
+        """Wait for the oldest command, then settle every finished one in order."""
+        wait([self._pending[0][0]])
+        while self._pending and self._pending[0][0].done():
+            job, future = self._pending.popleft()
+            exc = job.exception()
+            if exc is None:
+                future.set_result(job.result())
+                continue
+            if self.error is None:
+                self.error = exc
+            future.set_exception(exc)
+
+class ScheduledGSPClient(EraseMixin,
+                         WriteMixin,
+                         PipelinedWriteMixin,
+                         VerifyMixin,
+                         ResetMixin,
+                         AbortMixin,
+                         AddressMixin,
+                         UploadMixin,
+                         ReadMixin,
+                         MessageMixin):
+    """
+    GSPClient command API on top of a CommandScheduler: every call is
+    queued with its priority and blocks only the calling thread, so e.g.
+
+        api = ScheduledGSPClient(sched)
+        threading.Thread(target=upload, args=(api,)).start()
+        api.abort()          # jumps ahead of the queued upload chunks
+    """
+    def __init__(self, scheduler: CommandScheduler):
+        self.scheduler = scheduler
+
+    def pipeline(self, window: int = 8) -> ScheduledPipeline:
+        """
+        Return a ScheduledPipeline queuing up to `window` commands with
+        the scheduler (used by write_chunks, upload_image and read_flash).
+        """
+        return ScheduledPipeline(self.scheduler, window=window)
+
+    def _call(
+        self,
+        cmd: int,
+        payload: bytes = b"",
+        priority: Priority = Priority.NORMAL
+    ) -> bytes:
+        return self.scheduler.call(cmd, payload, priority)
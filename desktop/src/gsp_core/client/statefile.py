@@ -0,0 +1,36 @@
+# src/gsp_core/client/statefile.py
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Replace `path` with `data` atomically (temp file, fsync, rename), so a
+    crash leaves either the old or the new contents, never a mix.
+    Missing parent directories are created.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def read_state(path: str, version: int) -> Optional[Dict[str, Any]]:
+    """JSON object stored at `path`, or None if missing, unreadable or of another `version`."""
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != version:
+        return None
+    return state
+
+def write_state(path: str, state: Dict[str, Any]) -> None:
+    """Store a JSON object (with its "version") atomically."""
+    write_atomic(path, json.dumps(state).encode())
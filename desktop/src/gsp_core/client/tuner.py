@@ -0,0 +1,176 @@
+# src/gsp_core/client/tuner.py
+
+from typing import Any, Dict, Mapping, Optional, Set, Union
+
+from gsp_core.events import publish
+from gsp_core.protocol.cra import MAX_PAYLOAD
+
+# chunk size every target accepts (docs/protocol: Write Chunk)
+SAFE_CHUNK = 256
+
+class ChunkStats:
+    """Bytes, time and re-sends measured over one window at one chunk size."""
+    __slots__ = ("bytes", "seconds", "chunks", "retries")
+
+    def __init__(self):
+        self.bytes   = 0
+        self.seconds = 0.0
+        self.chunks  = 0
+        self.retries = 0
+
+    @property
+    def goodput(self) -> float:
+        """Payload bytes per second."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def retry_rate(self) -> float:
+        """Re-sends per chunk."""
+        return self.retries / self.chunks if self.chunks else 0.0
+
+class ChunkTuner:
+    """
+    Picks the WRITE_CHUNK size with the best goodput on the current link.
+
+    Every frame pays a fixed cost (header, CRC, SID round trip), so larger
+    chunks go faster, until bit errors make large frames fail their CRC
+    and be re-sent. The tuner measures each candidate size for
+    `probe_bytes`, doubling it while goodput improves by at least `gain`
+    and the retry rate stays under `max_retry_rate`, then settles on the
+    best size seen. Once settled it keeps watching: a window with too many
+    re-sends halves the size.
+
+    A size the target cannot take at all (a chunk larger than its receive
+    buffer fails every retry) is reported with reject(): the tuner returns
+    to the last size that got through and never grows past it again. Every
+    target accepts 256-byte chunks; raise max_size to the target's receive
+    buffer to let the tuner probe beyond that.
+
+        tuner = ChunkTuner(max_size=4096)
+        client.upload_image("fw.bin", chunk_size=tuner)
+    """
+    def __init__(
+        self,
+        initial:        int = 256,
+        min_size:       int = 64,
+        max_size:       int = SAFE_CHUNK,
+        probe_bytes:    int = 16384,
+        max_retry_rate: float = 0.05,
+        gain:           float = 0.05
+    ):
+        """
+        :param initial:        first chunk size tried (bytes)
+        :param min_size:       smallest chunk size used
+        :param max_size:       largest chunk size probed; keep it within the
+                               target's receive buffer (at most 65535)
+        :param probe_bytes:    payload measured per decision
+        :param max_retry_rate: re-sends per chunk above which a size is too big
+        :param gain:           relative goodput improvement worth growing for
+        """
+        if not 1 <= min_size <= max_size <= MAX_PAYLOAD:
+            raise ValueError(f"need 1 <= min_size <= max_size <= {MAX_PAYLOAD}")
+        self.min_size       = min_size
+        self.max_size       = max_size
+        self.probe_bytes    = probe_bytes
+        self.max_retry_rate = max_retry_rate
+        self.gain           = gain
+        self.size           = min(max(initial, min_size), max_size)
+        self.settled        = False
+        self.results: Dict[int, ChunkStats] = {}   # last window per size
+        self._window        = ChunkStats()
+        self._working: Set[int] = set()             # sizes the target has accepted
+
+    @classmethod
+    def from_config(cls, section: Mapping[str, Any]) -> Optional["ChunkTuner"]:
+        """Build from the `transfer` config section; None unless chunk_size is "auto"."""
+        if str(section.get("chunk_size", "")).lower() != "auto":
+            return None
+        return cls(
+            initial        = section.get("initial_chunk", 256),
+            min_size       = section.get("min_chunk", 64),
+            max_size       = section.get("max_chunk", SAFE_CHUNK),
+            probe_bytes    = section.get("probe_bytes", 16384),
+            max_retry_rate = section.get("max_retry_rate", 0.05),
+        )
+
+    def record(self, nbytes: int, seconds: float, retries: int = 0, chunks: int = 1) -> None:
+        """
+        Account `chunks` chunks of the current size: `nbytes` of payload
+        delivered in `seconds`, needing `retries` re-sends. May change size.
+        """
+        self._working.add(self.size)
+        w = self._window
+        w.bytes   += nbytes
+        w.seconds += seconds
+        w.chunks  += chunks
+        w.retries += retries
+        if w.bytes >= self.probe_bytes:
+            self._window = ChunkStats()
+            self._evaluate(w)
+
+    @property
+    def probing(self) -> bool:
+        """True until a chunk of the current size has been accepted."""
+        return self.size not in self._working
+
+    def confirm(self, size: int) -> None:
+        """A chunk of `size` was accepted (without a measurement to record)."""
+        self._working.add(size)
+
+    def reject(self, size: int) -> bool:
+        """
+        A chunk of `size` failed every retry. If no chunk of that size has
+        got through yet, it is too big for the target: fall back to the
+        largest size that has (or half of it) and cap max_size there.
+        Returns False if there is nothing to fall back to.
+        """
+        if size in self._working or size <= self.min_size:
+            return False
+        smaller = [s for s in self._working if s < size]
+        cap = max(smaller) if smaller else max(self.min_size, size // 2)
+        self.max_size = cap
+        self.results  = {s: r for s, r in self.results.items() if s <= cap}
+        self._window  = ChunkStats()
+        self._resize(cap, f"{size} B rejected by the target")
+        return True
+
+    def _evaluate(self, w: ChunkStats) -> None:
+        size = self.size
+        self.results[size] = w
+        ok = w.retry_rate <= self.max_retry_rate
+
+        if self.settled:
+            if not ok and size > self.min_size:
+                self._resize(max(self.min_size, size // 2),
+                             f"{w.retry_rate:.0%} re-sent at {size} B")
+            return
+
+        best = max((r.goodput for s, r in self.results.items()
+                    if s < size and r.retry_rate <= self.max_retry_rate), default=0.0)
+        if ok and w.goodput >= best * (1 + self.gain) and size < self.max_size:
+            self._resize(min(size * 2, self.max_size), f"{w.goodput / 1024:.1f} KiB/s at {size} B")
+            return
+
+        good = {s: r for s, r in self.results.items() if r.retry_rate <= self.max_retry_rate}
+        self.settled = True
+        self._resize(max(good, key=lambda s: good[s].goodput) if good else self.min_size, "settled")
+
+    def _resize(self, size: int, reason: str) -> None:
+        if size != self.size:
+            publish("status", f"Chunk size {self.size} → {size} B ({reason})")
+        self.size = size
+
+def resolve_chunk_size(value: Any, section: Mapping[str, Any]) -> Union[int, ChunkTuner]:
+    """
+    Turn a chunk-size setting (CLI option or config value) into what
+    upload_image() takes: an int, or a ChunkTuner for "auto".
+    Tuning limits come from the `transfer` config section.
+    """
+    if value is None:
+        value = section.get("chunk_size", 256)
+    if str(value).lower() == "auto":
+        return ChunkTuner.from_config({**section, "chunk_size": "auto"})
+    size = int(value, 0) if isinstance(value, str) else int(value)
+    if not 0 < size <= MAX_PAYLOAD:
+        raise ValueError(f"chunk size must be between 1 and {MAX_PAYLOAD}, or 'auto'")
+    return size
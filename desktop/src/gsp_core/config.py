@@ -7,6 +7,8 @@ import yaml
 _DEFAULT = {
     "general": {
         "max_retries": 5,
+        "dtl":         False,
+        "crc_enable":  True,
     },
     "serial": {
         "port":        "/dev/ttyUSB0",
@@ -20,7 +22,39 @@ _DEFAULT = {
         "host":    None,
         "port":    0,
         "timeout": 0.2,
-    }
+    },
+    "timeouts": {
+        "adaptive": True,
+        "initial":  None,    # None → the transport's own timeout
+        "floor":    0.005,
+        "ceiling":  2.0,
+        "backoff":  2.0,
+        "jitter":   0.1,
+        "commands": {
+            "erase_flash": {"initial": 2.0, "ceiling": 30.0},
+        },
+    },
+    "transfer": {
+        "address":        0x08000000,  # flash address images are written to
+        "chunk_size":     256,         # bytes per WRITE_CHUNK (1–65535), or "auto"
+        "window":         1,           # commands in flight (1–128); 1 = stop-and-wait
+        "initial_chunk":  256,         # auto: first size probed
+        "min_chunk":      64,          # auto: bounds; max_chunk ≤ target RX buffer
+        "max_chunk":      256,         # raise to the target's RX buffer to probe further
+        "probe_bytes":    16384,       # auto: payload measured per decision
+        "max_retry_rate": 0.05,        # auto: re-sends per chunk that rule a size out
+        "verify":         False,       # check written ranges with VERIFY_RANGE (one CRC per range)
+        "erased_value":   0xFF,        # erased flash byte; blank chunks are not sent (None: send all)
+    },
+    "flash": {
+        "sector_size":   None,           # erase granularity of the target (None: unknown)
+        "sectors":       None,           # non-uniform layout, e.g. "4x16K,1x64K,7x128K"
+        "base":          0x08000000,     # address of the first sector of `sectors`
+        "max_erase":     0,              # merge neighbouring sectors up to this many bytes per erase
+        "cache_dir":     "~/.gsp/cache", # differential flashing: last image per device
+        "cache_max_age": None,           # seconds before a record is not trusted (None: no limit)
+        "journal_dir":   "~/.gsp/journal", # resumable raw writes: progress per image file
+    },
 }
 
 def load_config() -> dict:
@@ -47,7 +81,7 @@ def load_config() -> dict:
                 data = yaml.safe_load(p.read_text()) or {}
             except yaml.YAMLError:
                 continue
-            for section in ("serial", "tcp"):
+            for section in _DEFAULT:
                 sec = data.get(section)
                 if isinstance(sec, dict):
                     cfg[section].update(sec)
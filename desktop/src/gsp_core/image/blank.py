@@ -0,0 +1,34 @@
+# src/gsp_core/image/blank.py
+
+from functools import lru_cache
+
+from gsp_core.protocol.cra import Buffer
+
+try:
+    import numpy as _np
+except ImportError:  # optional: is_blank falls back to memcmp
+    _np = None
+
+# from this size on, a vectorised scan beats copying + comparing
+_NP_MIN = 4096
+
+@lru_cache(maxsize=32)
+def _blank(erased: int, n: int) -> bytes:
+    return bytes([erased]) * n
+
+def is_blank(chunk: Buffer, erased: int = 0xFF) -> bool:
+    """
+    True if every byte of `chunk` equals `erased` (flash that needs no
+    programming after an erase). Empty chunks are not blank.
+
+    Chunks of real data almost always differ in their first or last
+    byte, so those are tested first; full scans only happen for actual
+    padding: a single memcmp against a cached blank buffer, or a NumPy
+    comparison for large chunks when NumPy is installed.
+    """
+    n = len(chunk)
+    if not n or chunk[0] != erased or chunk[n - 1] != erased:
+        return False
+    if _np is not None and n >= _NP_MIN:
+        return not (_np.frombuffer(chunk, dtype=_np.uint8) != erased).any()
+    return bytes(chunk) == _blank(erased, n)
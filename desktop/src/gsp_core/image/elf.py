@@ -0,0 +1,79 @@
+# src/gsp_core/image/elf.py
+
+from struct import Struct
+from typing import IO, Union
+
+from gsp_core.image.segments import SegmentMap
+
+_PT_LOAD = 1
+_READ    = 1 << 16   # copy segment contents in blocks of this size
+
+# e_ident is 16 bytes; the rest of the header depends on class and byte order
+_HDR = {
+    (1, "<"): Struct("<HHIIIIIHHHHHH"),
+    (1, ">"): Struct(">HHIIIIIHHHHHH"),
+    (2, "<"): Struct("<HHIQQQIHHHHHH"),
+    (2, ">"): Struct(">HHIQQQIHHHHHH"),
+}
+_PHDR = {
+    (1, "<"): Struct("<IIIIIIII"),     # type, offset, vaddr, paddr, filesz, memsz, flags, align
+    (1, ">"): Struct(">IIIIIIII"),
+    (2, "<"): Struct("<IIQQQQQQ"),     # type, flags, offset, vaddr, paddr, filesz, memsz, align
+    (2, ">"): Struct(">IIQQQQQQ"),
+}
+
+def load_elf(source: Union[str, IO[bytes]]) -> SegmentMap:
+    """
+    Load the PT_LOAD program segments of an ELF32/ELF64 executable into
+    a SegmentMap, at their physical (load) addresses — where .data's
+    initial values live in flash, not where they are copied to at run
+    time. Only the file-backed part (p_filesz) is taken; .bss is zeroed
+    by the startup code, not programmed. Sections, symbols and debug
+    info are never read.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return _parse(f)
+    return _parse(source)
+
+def _parse(f: IO[bytes]) -> SegmentMap:
+    ident = f.read(16)
+    if len(ident) < 16 or ident[:4] != b"\x7fELF":
+        raise ValueError("not an ELF file")
+    cls, order = ident[4], {1: "<", 2: ">"}.get(ident[5])
+    if cls not in (1, 2) or order is None:
+        raise ValueError("unsupported ELF class or byte order")
+
+    hdr = _HDR[cls, order]
+    raw = f.read(hdr.size)
+    if len(raw) < hdr.size:
+        raise ValueError("truncated ELF header")
+    (_, _, _, entry, phoff, _, _, _, phentsize, phnum, _, _, _) = hdr.unpack(raw)
+
+    phdr = _PHDR[cls, order]
+    if phnum and phentsize < phdr.size:
+        raise ValueError("bad program header size")
+
+    image = SegmentMap()
+    image.entry = entry
+    for i in range(phnum):
+        f.seek(phoff + i * phentsize)
+        raw = f.read(phdr.size)
+        if len(raw) < phdr.size:
+            raise ValueError("truncated program header table")
+        fields = phdr.unpack(raw)
+        if cls == 1:
+            kind, offset, _, paddr, filesz = fields[:5]
+        else:
+            kind, _, offset, _, paddr, filesz = fields[:6]
+        if kind != _PT_LOAD or not filesz:
+            continue
+        f.seek(offset)
+        pos = 0
+        while pos < filesz:
+            block = f.read(min(_READ, filesz - pos))
+            if not block:
+                raise ValueError(f"segment {i} runs past the end of the file")
+            image.add(paddr + pos, block)
+            pos += len(block)
+    return image
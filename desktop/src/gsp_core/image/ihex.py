@@ -0,0 +1,65 @@
+# src/gsp_core/image/ihex.py
+
+from typing import IO, Iterable, Union
+
+from gsp_core.image.segments import SegmentMap
+
+# record types
+_DATA       = 0x00
+_EOF        = 0x01
+_EXT_SEG    = 0x02   # segment base (address bits 4–19)
+_START_SEG  = 0x03   # CS:IP
+_EXT_LINEAR = 0x04   # upper 16 address bits
+_START_LIN  = 0x05   # EIP
+
+def load_ihex(source: Union[str, IO[bytes], Iterable[bytes]]) -> SegmentMap:
+    """
+    Parse an Intel HEX file into a SegmentMap.
+
+    The file is read line by line, so only the decoded data is kept in
+    memory, never the hex text. `source` is a path, a binary file object
+    or any iterable of lines. Bad checksums and malformed records raise
+    ValueError naming the line.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return _parse(f)
+    return _parse(source)
+
+def _parse(lines: Iterable[bytes]) -> SegmentMap:
+    image = SegmentMap()
+    base  = 0
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line[:1] != b":":
+            raise ValueError(f"line {lineno}: not an Intel HEX record")
+        try:
+            rec = bytes.fromhex(line[1:].decode("ascii"))
+        except ValueError:
+            raise ValueError(f"line {lineno}: invalid hex digits") from None
+        if len(rec) < 5 or len(rec) != rec[0] + 5:
+            raise ValueError(f"line {lineno}: bad record length")
+        if sum(rec) & 0xFF:
+            raise ValueError(f"line {lineno}: checksum mismatch")
+
+        count, kind = rec[0], rec[3]
+        offset = (rec[1] << 8) | rec[2]
+        data   = rec[4:4 + count]
+        if kind == _DATA:
+            image.add(base + offset, data)
+        elif kind == _EOF:
+            break
+        elif kind == _EXT_SEG:
+            base = int.from_bytes(data, "big") << 4
+        elif kind == _EXT_LINEAR:
+            base = int.from_bytes(data, "big") << 16
+        elif kind == _START_SEG:
+            cs, ip = int.from_bytes(data[:2], "big"), int.from_bytes(data[2:], "big")
+            image.entry = (cs << 4) + ip
+        elif kind == _START_LIN:
+            image.entry = int.from_bytes(data, "big")
+        else:
+            raise ValueError(f"line {lineno}: unknown record type 0x{kind:02X}")
+    return image
@@ -0,0 +1,58 @@
+# src/gsp_core/image/load.py
+
+import os
+from typing import Optional
+
+from gsp_core.image.elf import load_elf
+from gsp_core.image.ihex import load_ihex
+from gsp_core.image.segments import SegmentMap
+from gsp_core.image.srec import load_srec
+
+FORMATS = ("bin", "ihex", "srec", "elf")
+
+_SUFFIXES = {
+    ".bin": "bin",
+    ".hex": "ihex", ".ihex": "ihex", ".ihx": "ihex",
+    ".srec": "srec", ".s19": "srec", ".s28": "srec", ".s37": "srec", ".mot": "srec",
+    ".elf": "elf", ".axf": "elf", ".out": "elf",
+}
+
+def detect_format(path: str) -> str:
+    """
+    Guess the image format of `path`: ELF by its magic, Intel HEX and
+    S-record by their first record, then by file suffix; "bin" otherwise.
+    """
+    with open(path, "rb") as f:
+        head = f.read(4)
+    if head == b"\x7fELF":
+        return "elf"
+    if head[:1] == b":" and _is_hex(head[1:]):
+        return "ihex"
+    if head[:1] == b"S" and head[1:2].isdigit() and _is_hex(head[2:]):
+        return "srec"
+    return _SUFFIXES.get(os.path.splitext(path)[1].lower(), "bin")
+
+def _is_hex(chars: bytes) -> bool:
+    return all(c in b"0123456789abcdefABCDEF" for c in chars)
+
+def load_image(path: str, fmt: Optional[str] = None, address: int = 0x08000000) -> SegmentMap:
+    """
+    Load any supported image as a SegmentMap.
+
+    :param fmt:     one of FORMATS; None detects it (see detect_format)
+    :param address: flash address of a raw binary (other formats carry
+                    their own addresses)
+    """
+    fmt = fmt or detect_format(path)
+    if fmt == "ihex":
+        return load_ihex(path)
+    if fmt == "srec":
+        return load_srec(path)
+    if fmt == "elf":
+        return load_elf(path)
+    if fmt == "bin":
+        image = SegmentMap()
+        with open(path, "rb") as f:
+            image.add(address, f.read())
+        return image
+    raise ValueError(f"unknown image format {fmt!r} (expected one of {', '.join(FORMATS)})")
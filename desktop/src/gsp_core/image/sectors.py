@@ -0,0 +1,148 @@
+# src/gsp_core/image/sectors.py
+
+import bisect
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from gsp_core.image.segments import SegmentMap
+
+_GROUP = re.compile(r"^\s*(?:(\d+)\s*[xX*]\s*)?(\d+)\s*([kKmM]?)\s*$")
+_UNITS = {"": 1, "k": 1024, "m": 1024 * 1024}
+
+class SectorMap:
+    """
+    Erase geometry of a flash part: which sector every address belongs to.
+
+    Either uniform (every `size` bytes from address 0, unbounded) or a
+    list of sectors from a base address, e.g. an STM32F4 bank:
+
+        SectorMap.parse("4x16K, 1x64K, 7x128K", base=0x08000000)
+    """
+    def __init__(self, sectors: Iterable[Tuple[int, int]] = (), uniform: Optional[int] = None):
+        """
+        :param sectors: (address, size) of each sector, contiguous and ascending
+        :param uniform: sector size for every address instead
+        """
+        self._starts: List[int] = []
+        self._sizes:  List[int] = []
+        for address, size in sectors:
+            if size <= 0 or (self._starts and address != self._starts[-1] + self._sizes[-1]):
+                raise ValueError(f"sector at 0x{address:08X} does not follow the previous one")
+            self._starts.append(address)
+            self._sizes.append(size)
+        if uniform is not None and uniform <= 0:
+            raise ValueError("sector size must be positive")
+        if uniform is None and not self._starts:
+            raise ValueError("no sectors")
+        self.uniform = uniform if not self._starts else None
+
+    @classmethod
+    def parse(cls, layout: str, base: int = 0) -> "SectorMap":
+        """
+        Build from a layout like "4x16K,1x64K,7x128K" (count x size, in
+        bytes, K or M); a single size without count means uniform sectors.
+        """
+        groups, address = [], base
+        for part in layout.split(","):
+            m = _GROUP.match(part)
+            if not m:
+                raise ValueError(f"bad sector layout {part.strip()!r}")
+            size = int(m.group(2)) * _UNITS[m.group(3).lower()]
+            if m.group(1) is None and "," not in layout:
+                return cls(uniform=size)
+            for _ in range(int(m.group(1) or 1)):
+                groups.append((address, size))
+                address += size
+        return cls(groups)
+
+    @classmethod
+    def from_config(cls, section: Mapping[str, Any]) -> Optional["SectorMap"]:
+        """
+        Build from the `flash` config section: `sectors` layout, else
+        uniform `sector_size`; None if neither is set (geometry unknown).
+        """
+        layout = section.get("sectors")
+        if layout:
+            base = section.get("base", 0)
+            return cls.parse(str(layout), int(base, 0) if isinstance(base, str) else base)
+        size = section.get("sector_size")
+        if size is None:
+            return None
+        return cls(uniform=int(size, 0) if isinstance(size, str) else int(size))
+
+    def layout(self) -> Dict[str, Any]:
+        """JSON-serialisable description, equal for equal geometry."""
+        if self.uniform is not None:
+            return {"uniform": self.uniform}
+        return {"sectors": [[a, n] for a, n in zip(self._starts, self._sizes)]}
+
+    def sector(self, address: int) -> Tuple[int, int]:
+        """(start, size) of the sector holding `address`."""
+        if self.uniform is not None:
+            return address - address % self.uniform, self.uniform
+        i = bisect.bisect_right(self._starts, address) - 1
+        if i < 0 or address >= self._starts[i] + self._sizes[i]:
+            raise ValueError(f"0x{address:08X} is outside the flash sectors")
+        return self._starts[i], self._sizes[i]
+
+    def covering(self, address: int, length: int) -> List[Tuple[int, int]]:
+        """Sectors (start, size) that [address, address + length) touches."""
+        out, end = [], address + length
+        while address < end:
+            start, size = self.sector(address)
+            out.append((start, size))
+            address = start + size
+        return out
+
+class EraseStep:
+    """One erase command and the image pieces to write into the erased range."""
+    __slots__ = ("address", "length", "writes")
+
+    def __init__(self, address: int, length: int):
+        self.address = address
+        self.length  = length
+        self.writes: List[Tuple[int, memoryview]] = []   # (flash address, data)
+
+    @property
+    def end(self) -> int:
+        return self.address + self.length
+
+    def __repr__(self) -> str:
+        return f"EraseStep(0x{self.address:08X}, {self.length}, {len(self.writes)} writes)"
+
+def plan_erases(image: SegmentMap, sectors: SectorMap, max_erase: int = 0) -> List[EraseStep]:
+    """
+    Plan erase and write order for a sparse image: the sectors its
+    segments touch, in address order, each erased just before its data is
+    written rather than all of them up front. Segments sharing a sector
+    share its erase; neighbouring sectors are merged into one erase while
+    the result stays within `max_erase` bytes (0: one sector per erase,
+    so that every erase after the first overlaps writes to the previous
+    sector on targets that can do both at once).
+
+    A segment crossing a step boundary is split there, so every write
+    lands in flash that was erased by an earlier step.
+    """
+    steps: List[EraseStep] = []
+    for seg in image:
+        for start, size in sectors.covering(seg.address, len(seg)):
+            last = steps[-1] if steps else None
+            if last is not None and start < last.end:
+                continue                                    # already planned
+            if (last is not None and start == last.end
+                    and last.length + size <= max_erase):
+                last.length += size
+            else:
+                steps.append(EraseStep(start, size))
+
+    starts = [step.address for step in steps]
+    for seg in image:
+        data = memoryview(seg.data)
+        i = max(bisect.bisect_right(starts, seg.address) - 1, 0)
+        while i < len(steps) and steps[i].address < seg.end:
+            step = steps[i]
+            lo, hi = max(seg.address, step.address), min(seg.end, step.end)
+            if lo < hi:
+                step.writes.append((lo, data[lo - seg.address:hi - seg.address]))
+            i += 1
+    return steps
@@ -0,0 +1,99 @@
+# src/gsp_core/image/segments.py
+
+import bisect
+from typing import Iterator, List, Optional, Tuple
+
+from gsp_core.protocol.cra import Buffer
+
+class Segment:
+    """A run of populated flash: `data` programmed from `address`."""
+    __slots__ = ("address", "data")
+
+    def __init__(self, address: int, data: bytearray):
+        self.address = address
+        self.data    = data
+
+    @property
+    def end(self) -> int:
+        return self.address + len(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"Segment(0x{self.address:08X}, {len(self.data)} bytes)"
+
+class SegmentMap:
+    """
+    Sparse firmware image: the populated address ranges and their bytes,
+    nothing for the gaps between them.
+
+    Loaders add() records as they parse them; touching records are merged
+    into one segment (records usually arrive in address order, so that is
+    an append). Overlapping data is an error, as it is for a programmer.
+
+        image = load_image("fw.hex")
+        for seg in image:
+            print(f"0x{seg.address:08X} {len(seg)} bytes")
+    """
+    def __init__(self):
+        self._segs:   List[Segment] = []
+        self._starts: List[int]     = []   # segment addresses, for bisect
+        self.entry: Optional[int]   = None # start address, if the file gives one
+
+    def add(self, address: int, data: Buffer) -> None:
+        """Insert `data` at `address`, merging with touching segments."""
+        if not data:
+            return
+        end = address + len(data)
+        i   = bisect.bisect_right(self._starts, address)
+
+        prev = self._segs[i - 1] if i else None
+        if prev is not None and prev.end > address:
+            raise ValueError(f"overlapping data at 0x{address:08X}")
+        if i < len(self._segs) and self._segs[i].address < end:
+            raise ValueError(f"overlapping data at 0x{self._segs[i].address:08X}")
+
+        if prev is not None and prev.end == address:
+            prev.data += data
+            seg = prev
+        else:
+            seg = Segment(address, bytearray(data))
+            self._segs.insert(i, seg)
+            self._starts.insert(i, address)
+            i += 1
+        # the new bytes may close the gap to the next segment
+        if i < len(self._segs) and self._segs[i].address == seg.end:
+            seg.data += self._segs.pop(i).data
+            del self._starts[i]
+
+    def __iter__(self) -> Iterator[Segment]:
+        return iter(self._segs)
+
+    def __len__(self) -> int:
+        return len(self._segs)
+
+    @property
+    def size(self) -> int:
+        """Populated bytes (what is actually sent)."""
+        return sum(len(s) for s in self._segs)
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        """(lowest address, highest address + 1); (0, 0) if empty."""
+        if not self._segs:
+            return 0, 0
+        return self._segs[0].address, self._segs[-1].end
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        """(address, length) of every segment."""
+        return [(s.address, len(s)) for s in self._segs]
+
+    def read(self, address: int, length: int, fill: int = 0xFF) -> bytes:
+        """Bytes at [address, address + length); gaps read as `fill`."""
+        out = bytearray([fill]) * length
+        for seg in self._segs:
+            lo, hi = max(seg.address, address), min(seg.end, address + length)
+            if lo < hi:
+                out[lo - address:hi - address] = seg.data[lo - seg.address:hi - seg.address]
+        return bytes(out)
@@ -0,0 +1,49 @@
+# src/gsp_core/image/srec.py
+
+from typing import IO, Iterable, Union
+
+from gsp_core.image.segments import SegmentMap
+
+# record type → address bytes; data records S1–S3, start address S7–S9
+_DATA  = {1: 2, 2: 3, 3: 4}
+_START = {9: 2, 8: 3, 7: 4}
+
+def load_srec(source: Union[str, IO[bytes], Iterable[bytes]]) -> SegmentMap:
+    """
+    Parse a Motorola S-record file (S19 / S28 / S37) into a SegmentMap.
+
+    Read line by line like load_ihex(). Header (S0) and count (S5/S6)
+    records are checked but carry no data; S7–S9 set `entry`.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return _parse(f)
+    return _parse(source)
+
+def _parse(lines: Iterable[bytes]) -> SegmentMap:
+    image = SegmentMap()
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line[:1] not in (b"S", b"s") or not line[1:2].isdigit():
+            raise ValueError(f"line {lineno}: not an S-record")
+        kind = int(line[1:2])
+        try:
+            rec = bytes.fromhex(line[2:].decode("ascii"))
+        except ValueError:
+            raise ValueError(f"line {lineno}: invalid hex digits") from None
+        if not rec or len(rec) != rec[0] + 1:
+            raise ValueError(f"line {lineno}: bad record length")
+        if (sum(rec) & 0xFF) != 0xFF:
+            raise ValueError(f"line {lineno}: checksum mismatch")
+
+        body = rec[1:-1]               # address + data
+        if kind in _DATA:
+            n = _DATA[kind]
+            image.add(int.from_bytes(body[:n], "big"), body[n:])
+        elif kind in _START:
+            image.entry = int.from_bytes(body[:_START[kind]], "big")
+        elif kind not in (0, 5, 6):
+            raise ValueError(f"line {lineno}: unknown record type S{kind}")
+    return image
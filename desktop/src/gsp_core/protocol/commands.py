@@ -17,14 +17,31 @@
   0xC0–0xFF: Reserved for future use
 """
 
+from struct import Struct
+
 # ─── 0x10–0x1F: Bootloader flash operations ─────────────────────────────────
 CMD_ERASE_FLASH   = 0x10
 CMD_WRITE_CHUNK   = 0x11
 CMD_VERIFY_CHUNK  = 0x12
 CMD_RESET_AND_RUN = 0x13
 CMD_ABORT         = 0x14
+CMD_SET_ADDRESS   = 0x15
+CMD_VERIFY_RANGE  = 0x16
+CMD_READ_FLASH    = 0x17
+
+# ─── Payload layouts shared by host and target (LE) ─────────────────────────
+VERIFY_RANGE_REQUEST = Struct("<IIH")  # address, length, expected CRC-16
+VERIFY_RANGE_RESULT  = Struct("<BH")   # match status, CRC-16 computed by the target
+READ_FLASH_REQUEST   = Struct("<IH")   # address, length
 
 # ─── 0x30–0x3F: Message/IPC commands ───────────────────────────────────────
 CMD_SEND_MESSAGE  = 0x30
 
 # (add more commands as needed…)
+
+# ─── Response status codes (first payload byte of a response) ──────────────
+STATUS_OK            = 0x00
+STATUS_ERROR         = 0x01
+STATUS_FLASH_FAILURE = 0x02
+STATUS_BAD_CRC       = 0x03
+STATUS_TIMEOUT       = 0x04
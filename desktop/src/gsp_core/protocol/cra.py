@@ -2,8 +2,19 @@
 
 from dataclasses import dataclass
 from enum import IntEnum
-from struct import pack, unpack_from
-from typing import ClassVar, Tuple, Dict, Any
+from struct import Struct
+from typing import ClassVar, Tuple, Dict, Any, Union
+
+# precompiled codecs, so the format strings are parsed once at import
+_CMD_HDR = Struct("<BBBH")  # sid, flags, cmd, payload_len (LE)
+_ACK     = Struct("<BBB")   # sid, flags, cmd
+_LEN     = Struct("<H")
+
+MAX_PAYLOAD = 0xFFFF                   # 16-bit length field
+
+_ACK_FLAGS = (0 << 3) | (1 << 2) | 0   # reserved=0, AF=1 (ACK), priority=0
+
+Buffer = Union[bytes, bytearray, memoryview]
 
 class Priority(IntEnum):
     LOW      = 0
@@ -15,64 +26,135 @@ class Priority(IntEnum):
 class CommandFrame:
     sid:      int
     cmd:      int
-    payload:  bytes = b""
+    payload:  Buffer = b""
     priority: Priority = Priority.NORMAL
 
     _HDR_LEN: ClassVar[int] = 5
+    kind:     ClassVar[str] = "cmd"
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the built frame in bytes."""
+        return self._HDR_LEN + len(self.payload)
+
+    def _flags(self) -> int:
+        # Flags: reserved=0, AF=0 (command), priority=0-3
+        return (0 << 3) | (0 << 2) | (self.priority & 0x03)
 
     def build(self) -> bytes:
         """Builds a CRA command frame (no SLIP!)."""
-        # Flags: reserved=0, AF=0 (command), priority=0-3
-        flags = (0 << 3) | (0 << 2) | (self.priority & 0x03)
-        # <BBBH = sid, flags, cmd, payload_len (LE)
-        header = pack("<BBBH", self.sid, flags, self.cmd, len(self.payload))
+        header = _CMD_HDR.pack(self.sid, self._flags(), self.cmd, len(self.payload))
         return header + self.payload
 
+    def build_into(self, buf: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """
+        Write the CRA command frame into `buf` at `offset` (no SLIP!).
+        The payload — bytes or a memoryview — is copied exactly once.
+        Returns the number of bytes written (== nbytes).
+        """
+        n = len(self.payload)
+        _CMD_HDR.pack_into(buf, offset, self.sid, self._flags(), self.cmd, n)
+        start = offset + self._HDR_LEN
+        buf[start:start + n] = self.payload
+        return self._HDR_LEN + n
+
 @dataclass(slots=True)
 class AckFrame:
     sid: int
 
+    nbytes: ClassVar[int] = 3
+    kind:   ClassVar[str] = "ack"
+
     def build(self) -> bytes:
         """Builds an ACK-only frame (3 bytes, no payload)."""
-        # Flags: reserved=0, AF=1 (ACK), priority=0
-        flags = (0 << 3) | (1 << 2) | 0
-        return pack("<BBB", self.sid, flags, 0x00)  # sid, flags, cmd=0x00
+        return _ACK.pack(self.sid, _ACK_FLAGS, 0x00)  # sid, flags, cmd=0x00
 
-def parse_frame(buf: bytes) -> Tuple[str, Dict[str, Any]]:
+    def build_into(self, buf: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """Write the ACK-only frame into `buf` at `offset`; returns 3."""
+        _ACK.pack_into(buf, offset, self.sid, _ACK_FLAGS, 0x00)
+        return self.nbytes
+
+@dataclass(slots=True)
+class ResponseFrame:
+    sid:     int
+    status:  int
+    payload: Buffer = b""
+
+    _HDR_LEN: ClassVar[int] = 6   # sid, flags, cmd=0x00, len, status
+    kind:     ClassVar[str] = "resp"
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the built frame in bytes."""
+        return self._HDR_LEN + len(self.payload)
+
+    def build(self) -> bytes:
+        """Builds a CRA response frame (no SLIP!)."""
+        buf = bytearray(self.nbytes)
+        self.build_into(buf)
+        return bytes(buf)
+
+    def build_into(self, buf: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """Write the response frame into `buf` at `offset`; returns bytes written."""
+        n = len(self.payload)
+        _CMD_HDR.pack_into(buf, offset, self.sid, 0x00, 0x00, n + 1)
+        buf[offset + 5] = self.status
+        start = offset + self._HDR_LEN
+        buf[start:start + n] = self.payload
+        return self._HDR_LEN + n
+
+Frame = Union[CommandFrame, AckFrame, ResponseFrame]
+
+def parse(buf: Buffer) -> Frame:
     """
-    Parse raw CRA frame (pre-SLIP). Returns (kind, meta).
-      kind: "cmd", "ack", or "resp"
-      meta: dict with keys:
-        - for "cmd": sid, cmd, priority, payload
-        - for "ack": sid
-        - for "resp": sid, status (byte), payload (bytes)
+    Parse a raw CRA frame (pre-SLIP) into a CommandFrame, AckFrame or
+    ResponseFrame. Payloads are memoryview slices of `buf`, not copies,
+    and a response's status is a plain int.
+
+    Raises ValueError on a truncated frame or a length mismatch.
     """
     if len(buf) < 3:
         raise ValueError("frame too short")
-    sid, flags, cmd = unpack_from("<BBB", buf)
-    af = (flags >> 2) & 1
-    if af:
-        # ACK-only
-        return "ack", {"sid": sid}
+    sid, flags, cmd = _ACK.unpack_from(buf)
+    if (flags >> 2) & 1:
+        return AckFrame(sid)
 
-    # Command or response
     if len(buf) < 5:
         raise ValueError("missing length field")
-    length  = unpack_from("<H", buf, 3)[0]
-    payload = buf[5:]
-    if length != len(payload):
-        raise ValueError(f"length mismatch: expected {length}, got {len(payload)}")
+    length = _LEN.unpack_from(buf, 3)[0]
+    if length != len(buf) - 5:
+        raise ValueError(f"length mismatch: expected {length}, got {len(buf) - 5}")
 
+    view = memoryview(buf)
     if cmd == 0x00:
-        # Response: first byte of payload is status
-        status = payload[:1]
-        return "resp", {"sid": sid, "status": status, "payload": payload[1:]}
-    else:
-        # Command
-        priority = Priority(flags & 0x03)
-        return "cmd", {
-            "sid": sid,
-            "cmd": cmd,
-            "priority": priority,
-            "payload": payload
+        if not length:
+            raise ValueError("response frame missing status byte")
+        return ResponseFrame(sid, buf[5], view[6:])
+    return CommandFrame(sid, cmd, view[5:], Priority(flags & 0x03))
+
+def parse_frame(buf: bytes) -> Tuple[str, Dict[str, Any]]:
+    """
+    Parse raw CRA frame (pre-SLIP). Returns (kind, meta).
+      kind: "cmd", "ack", or "resp"
+      meta: dict with keys:
+        - for "cmd": sid, cmd, priority, payload
+        - for "ack": sid
+        - for "resp": sid, status (byte), payload (bytes)
+
+    Compatibility wrapper around parse(); new code should use that.
+    """
+    frame = parse(buf)
+    if frame.kind == "ack":
+        return "ack", {"sid": frame.sid}
+    if frame.kind == "resp":
+        return "resp", {
+            "sid": frame.sid,
+            "status": bytes([frame.status]),
+            "payload": bytes(frame.payload)
         }
+    return "cmd", {
+        "sid": frame.sid,
+        "cmd": frame.cmd,
+        "priority": frame.priority,
+        "payload": bytes(frame.payload)
+    }
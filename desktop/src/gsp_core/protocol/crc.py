@@ -2,10 +2,29 @@
 
 """Flexible CRC-16 engine supporting CCITT-False and Genibus variants."""
 
-from typing import List
+from array import array
+from struct import Struct
+from typing import Dict, List, Tuple, Union
+
+try:
+    import numpy as _np
+except ImportError:  # optional: crc16_batch falls back to the scalar engine
+    _np = None
+
+BytesLike = Union[bytes, bytearray, memoryview]
 
 _POLY    = 0x1021
 _TABLE: List[int] = []
+# _TABLES[k][b]: CRC contribution of byte b followed by k zero bytes
+_TABLES: List[List[int]] = []
+
+_OCTETS = Struct("8B")
+
+# name → (seed, xorout)
+VARIANTS: Dict[str, Tuple[int, int]] = {
+    "ccitt-false": (0xFFFF, 0x0000),
+    "genibus":     (0xFFFF, 0xFFFF),
+}
 
 def _build_table() -> None:
     """Populate the CRC-16/CCITT lookup table (poly=0x1021)."""
@@ -18,8 +37,42 @@ def _build_table() -> None:
                 crc = (crc << 1) & 0xFFFF
         _TABLE.append(crc)
 
-# build the table once
+def _build_slicing_tables() -> None:
+    """Derive the 8 slicing tables by pushing zero bytes through _TABLE."""
+    _TABLES.append(_TABLE)
+    for _ in range(7):
+        prev = _TABLES[-1]
+        _TABLES.append([((c << 8) & 0xFFFF) ^ _TABLE[c >> 8] for c in prev])
+
+# build the tables once
 _build_table()
+_build_slicing_tables()
+
+def _as_octets(data: BytesLike) -> memoryview:
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+def _update_bytewise(crc: int, data: BytesLike) -> int:
+    """Reference engine: one table lookup per byte. Returns the raw register."""
+    for b in data:
+        tbl_idx = ((crc >> 8) ^ b) & 0xFF
+        crc     = (_TABLE[tbl_idx] ^ ((crc << 8) & 0xFFFF)) & 0xFFFF
+    return crc
+
+def _update(crc: int, data: BytesLike) -> int:
+    """
+    Slicing-by-8 engine: folds 8 bytes per iteration with 8 lookups.
+    Returns the raw register (no final XOR).
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = _TABLES
+    view = _as_octets(data)
+    n8   = len(view) & ~7
+    for a, b, c, d, e, f, g, h in _OCTETS.iter_unpack(view[:n8]):
+        crc = (t7[(crc >> 8) ^ a] ^ t6[(crc & 0xFF) ^ b] ^ t5[c] ^ t4[d]
+               ^ t3[e] ^ t2[f] ^ t1[g] ^ t0[h])
+    return _update_bytewise(crc, view[n8:])
 
 def crc16(
     data:    bytes,
@@ -35,13 +88,103 @@ def crc16(
 
     To get CRC-16/Genibus, call with xorout=0xFFFF.
 
-    :param data:   input bytes
+    :param data:   input bytes (any bytes-like object, e.g. a memoryview)
     :param seed:   initial CRC register value
     :param xorout: final XOR value (0x0000 for CCITT-False, 0xFFFF for Genibus)
     :return:       16-bit CRC
     """
-    crc = seed
-    for b in data:
-        tbl_idx = ((crc >> 8) ^ b) & 0xFF
-        crc     = (_TABLE[tbl_idx] ^ ((crc << 8) & 0xFFFF)) & 0xFFFF
-    return (crc ^ xorout) & 0xFFFF
+    return (_update(seed & 0xFFFF, data) ^ xorout) & 0xFFFF
+
+def crc16_batch(
+    buffer:     BytesLike,
+    chunk_size: int,
+    seed:       int = 0xFFFF,
+    xorout:     int = 0x0000
+) -> "array[int]":
+    """
+    CRC-16 of every `chunk_size`-byte chunk of `buffer`, as if crc16() were
+    called on buffer[0:chunk_size], buffer[chunk_size:2*chunk_size], ...
+    The last chunk may be shorter.
+
+    With NumPy installed all full chunks are processed in lockstep: one
+    vectorised table lookup per byte column instead of one Python
+    iteration per byte. Without NumPy the slicing-by-8 engine is used.
+
+    :return: array('H') with one CRC per chunk
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    view   = _as_octets(buffer)
+    n_full = len(view) // chunk_size
+    out    = array("H")
+
+    if _np is not None and n_full:
+        blocks = _np.frombuffer(view, dtype=_np.uint8, count=n_full * chunk_size)
+        # one contiguous row per byte position, one column per chunk
+        columns = _np.ascontiguousarray(blocks.reshape(n_full, chunk_size).T)
+        table   = _np.asarray(_TABLE, dtype=_np.uint16)
+        crc     = _np.full(n_full, seed & 0xFFFF, dtype=_np.uint16)
+        for col in columns:
+            # uint16 arithmetic drops the bits shifted out, like & 0xFFFF
+            crc = table[(crc >> 8) ^ col] ^ (crc << 8)
+        crc ^= _np.uint16(xorout & 0xFFFF)
+        out.frombytes(crc.astype(_np.uint16).tobytes())
+    else:
+        for off in range(0, n_full * chunk_size, chunk_size):
+            out.append(crc16(view[off:off + chunk_size], seed, xorout))
+
+    if len(view) > n_full * chunk_size:
+        out.append(crc16(view[n_full * chunk_size:], seed, xorout))
+    return out
+
+class Crc16:
+    """
+    hashlib-style incremental CRC-16, for data that arrives in pieces
+    (streamed firmware, memoryview slices) and should not be joined first.
+
+        c = Crc16(variant="genibus")
+        c.update(chunk1); c.update(chunk2)
+        c.value       → int
+        c.digest()    → 2 bytes, big-endian
+    """
+
+    digest_size = 2
+    block_size  = 8
+
+    __slots__ = ("name", "_crc", "_xorout")
+
+    def __init__(self, data: BytesLike = b"", variant: str = "ccitt-false"):
+        try:
+            seed, xorout = VARIANTS[variant]
+        except KeyError:
+            raise ValueError(f"unknown CRC-16 variant: {variant!r}") from None
+        self.name    = variant
+        self._crc    = seed
+        self._xorout = xorout
+        if data:
+            self.update(data)
+
+    def update(self, data: BytesLike) -> None:
+        """Feed more bytes into the running CRC."""
+        self._crc = _update(self._crc, data)
+
+    @property
+    def value(self) -> int:
+        """Current CRC as an integer (final XOR applied)."""
+        return self._crc ^ self._xorout
+
+    def digest(self) -> bytes:
+        """Current CRC as 2 big-endian bytes."""
+        return self.value.to_bytes(2, "big")
+
+    def hexdigest(self) -> str:
+        """Current CRC as 4 lowercase hex digits."""
+        return f"{self.value:04x}"
+
+    def copy(self) -> "Crc16":
+        """Independent clone of the running state."""
+        clone = Crc16.__new__(Crc16)
+        clone.name    = self.name
+        clone._crc    = self._crc
+        clone._xorout = self._xorout
+        return clone
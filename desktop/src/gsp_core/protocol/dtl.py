@@ -1,9 +1,12 @@
 # src/gsp_core/protocol/dlt.py
 
 from typing import Tuple
-from .slip import encode, decode
+from .slip import decode_fast as decode, encode_into
 from .crc import crc16
 
+HEADROOM = 2   # leading END + DTL header byte
+TAILROOM = 3   # CRC-16 + trailing END
+
 def encode_frame(cmd_frame: bytes, crc_enable: bool = True) -> bytes:
     """
     Encapsulate a raw CRA frame into a SLIP-wrapped DTL packet.
@@ -15,11 +18,36 @@ def encode_frame(cmd_frame: bytes, crc_enable: bool = True) -> bytes:
 
     Returns SLIP-encoded bytes (adds leading & trailing END delimiters).
     """
-    header = 0x80 if crc_enable else 0x00
-    payload = bytes([header]) + cmd_frame
+    n   = len(cmd_frame)
+    buf = bytearray(HEADROOM + n + TAILROOM)
+    buf[HEADROOM:HEADROOM + n] = cmd_frame
+    return bytes(encode_frame_into(buf, n, crc_enable))
+
+
+def encode_frame_into(buf: bytearray, length: int, crc_enable: bool = True) -> bytes:
+    """
+    Turn a CRA frame already placed at buf[HEADROOM:HEADROOM+length] into a
+    SLIP-wrapped DTL packet, in place.
+
+    `buf` must hold at least HEADROOM + length + TAILROOM bytes. Header,
+    CRC and delimiters are written around the frame; the CRC is computed
+    straight off the buffer and SLIP escaping only copies when the packet
+    actually contains END/ESC bytes.
+
+    Returns the wire frame: `buf` itself (truncated to size) or, when
+    escaping was needed, a new bytes object.
+    """
+    end = HEADROOM + length
     if crc_enable:
-        payload += crc16(payload).to_bytes(2, "little")
-    return encode(payload)
+        buf[1] = 0x80
+        with memoryview(buf) as view:
+            crc = crc16(view[1:end])  # header + cmd_frame
+        buf[end]     = crc & 0xFF
+        buf[end + 1] = crc >> 8
+        end += 2
+    else:
+        buf[1] = 0x00
+    return encode_into(buf, end + 1)
 
 
 def decode_frame(frame: bytes) -> Tuple[bytes, bool]:
@@ -28,28 +56,36 @@ def decode_frame(frame: bytes) -> Tuple[bytes, bool]:
 
     Steps:
       1. SLIP-decode (removes END delimiters & un-escapes).
-      2. Read header byte: high bit = CRC_EN flag.
-      3. If CRC_EN set, split off last 2 bytes as CRC and verify.
-      4. Return (cmd_frame, crc_enable).
+      2. Hand the packet to decode_packet().
+
+    Raises ValueError on malformed packet or CRC mismatch.
+    """
+    return decode_packet(decode(frame))
+
+
+def decode_packet(raw: bytes) -> Tuple[bytes, bool]:
+    """
+    Decode an already SLIP-decoded DTL packet (e.g. from StreamDecoder).
+
+    Steps:
+      1. Read header byte: high bit = CRC_EN flag.
+      2. If CRC_EN set, split off last 2 bytes as CRC and verify.
+      3. Return (cmd_frame, crc_enable).
 
     Raises ValueError on malformed packet or CRC mismatch.
     """
-    raw = decode(frame)
     if not raw:
         raise ValueError("DTL frame too short")
 
     crc_enable = bool(raw[0] & 0x80)
-    content = raw[1:]
-
-    if crc_enable:
-        if len(content) < 2:
-            raise ValueError("Missing CRC in DTL frame")
-        data, recv_crc = content[:-2], int.from_bytes(content[-2:], "little")
-        calc_crc = crc16(raw[:-2])  # header + data
-        if recv_crc != calc_crc:
-            raise ValueError(f"CRC mismatch: got 0x{recv_crc:04X}, expected 0x{calc_crc:04X}")
-        cmd_frame = data
-    else:
-        cmd_frame = content
+    if not crc_enable:
+        return raw[1:], False
 
-    return cmd_frame, crc_enable
+    if len(raw) < 3:
+        raise ValueError("Missing CRC in DTL frame")
+    recv_crc = raw[-2] | (raw[-1] << 8)
+    with memoryview(raw) as view:
+        calc_crc = crc16(view[:-2])  # header + data, no copy
+    if recv_crc != calc_crc:
+        raise ValueError(f"CRC mismatch: got 0x{recv_crc:04X}, expected 0x{calc_crc:04X}")
+    return raw[1:-2], True
@@ -23,3 +23,15 @@ def find_matching_ports(vid: int=None, pid: int=None, desc_filter: str=None) ->
         elif desc_filter and desc_filter.lower() in p.description.lower():
             results.append(p.device)
     return results
+
+def port_identity(port: str) -> str:
+    """
+    Stable name for the device behind `port`: its USB vendor/product ID
+    and serial number when the adapter reports one (unchanged when the
+    board is re-plugged or enumerates under another name), else the
+    port name itself.
+    """
+    for p in list_ports.comports():
+        if p.device == port and p.serial_number and p.vid is not None:
+            return f"usb-{p.vid:04x}:{p.pid:04x}-{p.serial_number}"
+    return port
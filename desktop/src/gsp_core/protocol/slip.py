@@ -5,6 +5,11 @@ _ESC     = 0xDB
 _ESC_END = 0xDC
 _ESC_ESC = 0xDD
 
+_END_B   = bytes([_END])
+_ESC_B   = bytes([_ESC])
+_SEQ_END = bytes([_ESC, _ESC_END])
+_SEQ_ESC = bytes([_ESC, _ESC_ESC])
+
 def encode(raw: bytes) -> bytes:
     """
     SLIP-encode a raw byte sequence.
@@ -53,3 +58,63 @@ def decode(frame: bytes) -> bytes:
         raise ValueError("SLIP frame ends with unfinished escape")
     return bytes(out)
 
+# ─── Fast path ──────────────────────────────────────────────────────────────
+# Same wire format as encode()/decode(), but whole buffers are handled by
+# bytes.find/count/replace in C instead of a per-byte Python loop.
+
+def encode_fast(raw: bytes) -> bytes:
+    """
+    SLIP-encode `raw` (any bytes-like object); output is identical to encode().
+    Escape-free payloads are framed with a single copy.
+    """
+    frame = b"".join((_END_B, raw, _END_B))
+    last  = len(frame) - 1
+    if frame.find(_END, 1, last) < 0 and frame.find(_ESC, 1, last) < 0:
+        return frame
+
+    body = raw if isinstance(raw, (bytes, bytearray)) else bytes(raw)
+    # ESC first, so the ESC bytes introduced for END are not escaped again
+    body = body.replace(_ESC_B, _SEQ_ESC).replace(_END_B, _SEQ_END)
+    return b"".join((_END_B, body, _END_B))
+
+def decode_fast(frame: bytes) -> bytes:
+    """
+    Decode a SLIP frame with leading and trailing END; identical to decode(),
+    including the ValueError raised for malformed frames.
+    """
+    if not frame or frame[0] != _END or frame[-1] != _END:
+        raise ValueError("Incomplete SLIP frame (missing END delimiters)")
+    body = bytes(frame[1:-1])
+    if _ESC not in body:
+        return body
+    try:
+        return _unescape(body)
+    except ValueError:
+        # let the reference decoder report exactly what is wrong
+        return decode(frame)
+
+def encode_into(buf: bytearray, end: int) -> bytes:
+    """
+    SLIP-encode in place. buf[1:end-1] holds the raw bytes and buf[0],
+    buf[end-1] are reserved for the END delimiters; buf is truncated to `end`.
+
+    Returns buf itself when nothing needs escaping (no copy at all),
+    otherwise a new escaped frame.
+    """
+    del buf[end:]
+    last = end - 1
+    buf[0] = buf[last] = _END
+    if buf.find(_END, 1, last) < 0 and buf.find(_ESC, 1, last) < 0:
+        return buf
+    with memoryview(buf) as view:
+        return encode_fast(view[1:last])
+
+def _unescape(body: bytes) -> bytes:
+    """
+    Un-escape frame contents (delimiters already stripped).
+    Raises ValueError on a dangling or invalid escape.
+    """
+    # every ESC must open a valid two-byte escape sequence
+    if body.count(_ESC_B) != body.count(_SEQ_END) + body.count(_SEQ_ESC):
+        raise ValueError("Invalid SLIP escape sequence")
+    return body.replace(_SEQ_END, _END_B).replace(_SEQ_ESC, _ESC_B)
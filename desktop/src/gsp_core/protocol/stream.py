@@ -0,0 +1,96 @@
+# src/gsp_core/protocol/stream.py
+
+"""Incremental SLIP de-framer for byte streams chunked at arbitrary points."""
+
+from typing import List, Union
+
+from .slip import _END, _ESC, _unescape
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class StreamDecoder:
+    """
+    Stateful SLIP de-framer.
+
+    feed() accepts whatever the transport read (a single byte, part of a
+    frame, several frames at once) and returns every frame completed by it.
+    Bytes following the last END are kept for the next call.
+
+      • Back-to-back END delimiters (empty frames) are skipped.
+      • Bytes received before the first END are discarded as line noise.
+      • Escape sequences split across chunks are fine: un-escaping happens
+        only once the whole frame is buffered.
+      • Frames with invalid escapes or longer than `max_frame` are dropped
+        and counted in `dropped`.
+    """
+
+    def __init__(self, unescape: bool = True, max_frame: int = 1 << 17):
+        """
+        :param unescape:  True  → return un-escaped frame contents (as slip.decode)
+                          False → return raw frames including both END delimiters
+                                  (the recv_frame() contract of the transports)
+        :param max_frame: maximum escaped frame size in bytes
+        """
+        self._unescape  = unescape
+        self._max_frame = max_frame
+        self._buf       = bytearray()
+        self._synced    = False
+        self.dropped    = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes belonging to an incomplete frame."""
+        return len(self._buf)
+
+    def reset(self) -> None:
+        """Discard any partial frame and wait for the next END."""
+        self._buf.clear()
+        self._synced = False
+
+    def feed(self, data: BytesLike) -> List[bytes]:
+        """
+        Append `data` to the stream and return the frames it completed,
+        in arrival order.
+        """
+        frames: List[bytes] = []
+        buf  = self._buf
+        scan = len(buf)
+        buf += data
+
+        # index just past the opening END of the current frame (buf[0] when synced)
+        start = 1 if self._synced else -1
+        while True:
+            end = buf.find(_END, scan)
+            if end < 0:
+                break
+            if 0 <= start < end:
+                self._emit(frames, start, end)
+            start = scan = end + 1
+
+        if start < 0:
+            buf.clear()
+            return frames
+
+        # keep the opening END of the partial frame so raw mode can return it
+        self._synced = True
+        del buf[:start - 1]
+        if len(buf) > self._max_frame:
+            self.dropped += 1
+            self.reset()
+        return frames
+
+    def _emit(self, frames: List[bytes], start: int, end: int) -> None:
+        with memoryview(self._buf) as view:
+            if not self._unescape:
+                frames.append(bytes(view[start - 1:end + 1]))
+                return
+            body = bytes(view[start:end])
+
+        if _ESC in body:
+            try:
+                body = _unescape(body)
+            except ValueError:
+                self.dropped += 1
+                return
+        frames.append(body)
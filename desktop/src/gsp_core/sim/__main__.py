@@ -0,0 +1,46 @@
+# src/gsp_core/sim/__main__.py
+
+"""
+Run a simulated GSP target on a TCP port:
+
+    python -m gsp_core.sim --port 4001 --latency 0.002 --baud 115200
+"""
+
+import argparse
+
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.server import SimServer
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m gsp_core.sim",
+                                 description="Simulated GSP target over TCP")
+    ap.add_argument("--host",       default="127.0.0.1")
+    ap.add_argument("--port",       type=int,   default=4001)
+    ap.add_argument("--flash-size", type=int,   default=512 * 1024)
+    ap.add_argument("--latency",    type=float, default=0.0, help="one-way delay (s)")
+    ap.add_argument("--baud",       type=int,   default=None, help="emulated UART speed")
+    ap.add_argument("--processing", type=float, default=0.0, help="target time per command (s)")
+    ap.add_argument("--ber",        type=float, default=0.0, help="bit error rate")
+    ap.add_argument("--drop",       type=float, default=0.0, help="frame loss probability")
+    ap.add_argument("--seed",       type=int,   default=None)
+    args = ap.parse_args()
+
+    server = SimServer(
+        SimDevice(flash_size=args.flash_size),
+        args.host, args.port,
+        latency=args.latency, baudrate=args.baud, processing=args.processing,
+        bit_error_rate=args.ber, drop_rate=args.drop, seed=args.seed,
+    )
+    host, port = server.address
+    print(f"GSP simulator listening on {host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
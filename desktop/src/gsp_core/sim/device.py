@@ -0,0 +1,341 @@
+# src/gsp_core/sim/device.py
+
+from collections import OrderedDict
+from struct import Struct
+from typing import Dict, List, Optional, Tuple
+
+from gsp_core.config import load_config
+from gsp_core.protocol.commands import (
+    CMD_ERASE_FLASH, CMD_WRITE_CHUNK, CMD_VERIFY_CHUNK,
+    CMD_RESET_AND_RUN, CMD_ABORT, CMD_SET_ADDRESS, CMD_VERIFY_RANGE, CMD_READ_FLASH,
+    CMD_SEND_MESSAGE,
+    STATUS_OK, STATUS_ERROR, STATUS_FLASH_FAILURE, STATUS_BAD_CRC,
+    VERIFY_RANGE_REQUEST, VERIFY_RANGE_RESULT, READ_FLASH_REQUEST,
+)
+from gsp_core.protocol.cra import ResponseFrame, parse_frame
+from gsp_core.protocol.crc import crc16
+from gsp_core.protocol.dtl import encode_frame, decode_frame
+from gsp_core.protocol.slip import encode, decode_fast as decode
+from gsp_core.protocol.stream import StreamDecoder
+
+_REGION  = Struct("<II")  # address, length (LE)
+_ADDRESS = Struct("<I")   # address (LE)
+
+# commands that move the write pointer, and so must run in SID order
+_ORDERED = (CMD_ERASE_FLASH, CMD_WRITE_CHUNK, CMD_SET_ADDRESS)
+
+# commands that read flash: left unanswered until everything before them
+# is applied, as their reply cannot be given early; they run once the gap
+# is filled and the host's re-send is answered with the result
+_BARRIERS = (CMD_VERIFY_RANGE, CMD_READ_FLASH)
+
+# how many recent SIDs to remember for duplicate detection / reordering;
+# matches the host pipeline's MAX_WINDOW
+_HISTORY = 128
+
+class SimDevice:
+    """
+    Target side of the GSP protocol, in memory.
+
+    Takes SLIP (or DTL) wire frames from the host, executes the bootloader
+    commands against a simulated NOR flash and returns wire responses:
+
+      - ERASE_FLASH sets a region (or the whole part) to `erased_value`
+        and rewinds the write pointer to its start
+      - WRITE_CHUNK programs the chunk at the write pointer; programming
+        can only move bits away from the erased state, as on real flash
+      - SET_ADDRESS moves the write pointer (e.g. to resume an upload)
+      - VERIFY_CHUNK re-reads the last chunk: OK, or BAD_CRC if flash
+        does not hold what was sent
+      - VERIFY_RANGE compares the CRC-16 of a flash range with the one
+        the host expects
+      - READ_FLASH returns the contents of a flash range
+      - SEND_MESSAGE echoes its payload back
+
+    Like a robust bootloader, it remembers the response to the last
+    `_HISTORY` SIDs: a re-sent command is answered from that cache instead
+    of being executed twice. Write chunks carry no address, so a chunk (or
+    SET_ADDRESS, or ERASE_FLASH, which rewinds the pointer) that arrives
+    ahead of a missing predecessor (pipelined host, lost frame) is held
+    and applied once the gap is filled — flash is always erased and
+    written in SID order, so erases may be pipelined between chunks.
+    Reads (VERIFY_RANGE, READ_FLASH) that arrive early are not answered,
+    but run as soon as the gap is filled; the re-send gets their result.
+    Commands more than `_HISTORY // 2` SIDs ahead of the gap are
+    discarded unanswered, as a full receive buffer would.
+    """
+    def __init__(
+        self,
+        flash_size:   int = 512 * 1024,
+        base_address: int = 0x08000000,
+        erased_value: int = 0xFF,
+        dtl:          Optional[bool] = None,
+        crc_enable:   Optional[bool] = None,
+        max_payload:  Optional[int] = None
+    ):
+        """
+        :param flash_size:   simulated flash size in bytes
+        :param base_address: address of the first flash byte
+        :param erased_value: value of an erased byte
+        :param dtl:          expect DTL-wrapped frames (default: config general.dtl)
+        :param crc_enable:   CRC-16 on DTL frames (default: config general.crc_enable)
+        :param max_payload:  longest command payload the receive buffer holds;
+                             longer commands are answered STATUS_ERROR (None: no limit)
+        """
+        general = load_config().get("general", {})
+        self.base_address = base_address
+        self.erased_value = erased_value
+        self.flash        = bytearray([erased_value]) * flash_size
+        self.max_payload  = max_payload
+        self.messages: List[bytes] = []
+        self.running      = False
+        self._dtl         = general.get("dtl", False) if dtl is None else dtl
+        self._crc_enable  = general.get("crc_enable", True) if crc_enable is None else crc_enable
+        self._decoder     = StreamDecoder(unescape=False)
+        self._handlers    = {
+            CMD_ERASE_FLASH:   self._erase,
+            CMD_WRITE_CHUNK:   self._write,
+            CMD_VERIFY_CHUNK:  self._verify,
+            CMD_RESET_AND_RUN: self._reset_and_run,
+            CMD_ABORT:         self._abort,
+            CMD_SET_ADDRESS:   self._set_address,
+            CMD_VERIFY_RANGE:  self._verify_range,
+            CMD_READ_FLASH:    self._read_flash,
+            CMD_SEND_MESSAGE:  self._message,
+        }
+
+        # counters
+        self.commands   = 0   # commands executed
+        self.duplicates = 0   # re-sent commands answered from the cache
+        self.rejected   = 0   # frames that failed SLIP/DTL/CRA decoding
+        self.overflows  = 0   # commands discarded while waiting for a lost one
+
+        self._ptr    = 0                        # write pointer (flash offset)
+        self._last: Optional[Tuple[int, bytes]] = None
+        self._failed = False                    # a held write fell off the end
+        self._cache: "OrderedDict[int, Tuple[bytes, bytes]]" = OrderedDict()
+        self._held:  Dict[int, Optional[Tuple[int, bytes]]] = {}   # sid → (cmd, payload)
+        # sid → (payload, result) of reads run when their gap was filled
+        self._answers: "OrderedDict[int, Tuple[bytes, Tuple[int, bytes]]]" = OrderedDict()
+        self._next_sid: Optional[int] = None
+
+    # ─── wire interface ──────────────────────────────────────────────────
+
+    def handle(self, wire: bytes) -> Optional[bytes]:
+        """
+        Process one complete wire frame (END delimiters included).
+        Returns the wire response, or None if the frame is undecodable or
+        is not a command.
+        """
+        try:
+            if self._dtl:
+                raw, ok = decode_frame(wire)
+                if self._crc_enable and not ok:
+                    raise ValueError("bad CRC")
+            else:
+                raw = decode(wire)
+            kind, info = parse_frame(raw)
+        except ValueError:
+            self.rejected += 1
+            return None
+        if kind != "cmd":
+            return None
+
+        resp = self._respond(bytes(raw), info)
+        if resp is None:
+            return None
+        if self._dtl:
+            return encode_frame(resp, self._crc_enable)
+        return encode(resp)
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Stream interface: raw bytes in, wire responses out."""
+        out = []
+        for frame in self._decoder.feed(data):
+            resp = self.handle(frame)
+            if resp is not None:
+                out.append(resp)
+        return out
+
+    def reset_session(self) -> None:
+        """
+        Forget SID history and stream state, e.g. when a new host connects
+        and may start counting SIDs from anywhere. Flash is kept.
+        """
+        self._decoder.reset()
+        self._cache.clear()
+        self._held.clear()
+        self._answers.clear()
+        self._next_sid = None
+
+    def read(self, address: int, length: int) -> bytes:
+        """Return `length` bytes of simulated flash starting at `address`."""
+        off = address - self.base_address
+        return bytes(self.flash[off:off + length])
+
+    # ─── sequencing ──────────────────────────────────────────────────────
+
+    def _respond(self, raw: bytes, info: dict) -> Optional[bytes]:
+        sid = info["sid"]
+        cached = self._cache.get(sid)
+        if cached is not None and cached[0] == raw:
+            self.duplicates += 1
+            return cached[1]
+
+        result = self._sequence(sid, info["cmd"], info["payload"])
+        if result is None:
+            return None
+        resp = ResponseFrame(sid, *result).build()
+        self._cache[sid] = (raw, resp)
+        self._cache.move_to_end(sid)
+        if len(self._cache) > _HISTORY:
+            self._cache.popitem(last=False)
+        return resp
+
+    def _sequence(self, sid: int, cmd: int, payload: bytes) -> Optional[Tuple[int, bytes]]:
+        answer = self._answers.pop(sid, None)
+        if answer is not None and answer[0] == payload:
+            return answer[1]            # a barrier that ran when its gap was filled
+        expected = self._next_sid
+        gap = 0 if expected is None else (sid - expected) & 0xFF
+
+        if gap >= _HISTORY:
+            # behind the window and not a duplicate: the host restarted
+            self._drain(flush=True)
+            gap = 0
+        elif gap >= _HISTORY // 2:
+            # too far ahead of the gap: reorder buffer full, frame discarded
+            self.overflows += 1
+            return None
+
+        if cmd in _BARRIERS and gap:
+            self._held[sid] = (cmd, payload)
+            return None
+        self.commands += 1
+        if cmd in _ORDERED and gap:
+            # ahead of a missing command: apply it once the gap is filled
+            self._held[sid] = (cmd, payload)
+            return STATUS_OK, b""
+
+        result = self._dispatch(cmd, payload)
+        if gap:
+            self._held[sid] = None      # executed out of order; just a marker
+        else:
+            self._next_sid = (sid + 1) & 0xFF
+            self._drain()
+        return result
+
+    def _drain(self, flush: bool = False) -> None:
+        """Apply held commands that are now in order (all of them if flush)."""
+        while self._held:
+            sid = self._next_sid
+            if sid not in self._held:
+                if not flush:
+                    return
+                sid = min(self._held, key=lambda s: (s - self._next_sid) & 0xFF)
+            held = self._held.pop(sid)
+            if held is not None and held[0] in _BARRIERS:
+                self.commands += 1
+                self._answers[sid] = (held[1], self._dispatch(*held))
+                if len(self._answers) > _HISTORY:
+                    self._answers.popitem(last=False)
+            elif held is not None and self._dispatch(*held)[0] != STATUS_OK:
+                self._failed = True
+            self._next_sid = (sid + 1) & 0xFF
+        if flush:
+            self._next_sid = None
+
+    def _dispatch(self, cmd: int, payload: bytes) -> Tuple[int, bytes]:
+        handler = self._handlers.get(cmd)
+        if handler is None or (self.max_payload is not None and len(payload) > self.max_payload):
+            return STATUS_ERROR, b""
+        return handler(payload)
+
+    # ─── commands ────────────────────────────────────────────────────────
+
+    def _erase(self, payload: bytes) -> Tuple[int, bytes]:
+        if not payload:
+            start, length = 0, len(self.flash)
+        elif len(payload) == _REGION.size:
+            address, length = _REGION.unpack(payload)
+            start = address - self.base_address
+            if start < 0 or start + length > len(self.flash):
+                return STATUS_FLASH_FAILURE, b""
+        else:
+            return STATUS_ERROR, b""
+
+        self.flash[start:start + length] = bytes([self.erased_value]) * length
+        self._ptr    = start
+        self._last   = None
+        self._failed = False
+        return STATUS_OK, b""
+
+    def _write(self, data: bytes) -> Tuple[int, bytes]:
+        start, n = self._ptr, len(data)
+        if start + n > len(self.flash):
+            return STATUS_FLASH_FAILURE, b""
+        cur = int.from_bytes(self.flash[start:start + n], "little")
+        new = int.from_bytes(data, "little")
+        if self.erased_value == 0xFF:
+            cur &= new                  # programming clears bits
+        elif self.erased_value == 0x00:
+            cur |= new                  # programming sets bits
+        else:
+            cur = new
+        self.flash[start:start + n] = cur.to_bytes(n, "little")
+        self._ptr  = start + n
+        self._last = (start, bytes(data))
+        return STATUS_OK, b""
+
+    def _verify(self, payload: bytes) -> Tuple[int, bytes]:
+        if self._failed:
+            return STATUS_FLASH_FAILURE, b""
+        if self._last is None:
+            return STATUS_ERROR, b""
+        start, data = self._last
+        if self.flash[start:start + len(data)] != data:
+            return STATUS_BAD_CRC, b""
+        return STATUS_OK, b""
+
+    def _verify_range(self, payload: bytes) -> Tuple[int, bytes]:
+        if len(payload) != VERIFY_RANGE_REQUEST.size:
+            return STATUS_ERROR, b""
+        address, length, expected = VERIFY_RANGE_REQUEST.unpack(payload)
+        start = address - self.base_address
+        if start < 0 or start + length > len(self.flash):
+            return STATUS_FLASH_FAILURE, b""
+        with memoryview(self.flash) as view:
+            crc = crc16(view[start:start + length])
+        return STATUS_OK, VERIFY_RANGE_RESULT.pack(STATUS_OK if crc == expected else STATUS_BAD_CRC, crc)
+
+    def _read_flash(self, payload: bytes) -> Tuple[int, bytes]:
+        if len(payload) != READ_FLASH_REQUEST.size:
+            return STATUS_ERROR, b""
+        address, length = READ_FLASH_REQUEST.unpack(payload)
+        start = address - self.base_address
+        if start < 0 or start + length > len(self.flash):
+            return STATUS_FLASH_FAILURE, b""
+        return STATUS_OK, bytes(self.flash[start:start + length])
+
+    def _set_address(self, payload: bytes) -> Tuple[int, bytes]:
+        if len(payload) != _ADDRESS.size:
+            return STATUS_ERROR, b""
+        start = _ADDRESS.unpack(payload)[0] - self.base_address
+        if not 0 <= start <= len(self.flash):
+            return STATUS_FLASH_FAILURE, b""
+        self._ptr  = start
+        self._last = None
+        return STATUS_OK, b""
+
+    def _reset_and_run(self, payload: bytes) -> Tuple[int, bytes]:
+        self.running = True
+        return STATUS_OK, b""
+
+    def _abort(self, payload: bytes) -> Tuple[int, bytes]:
+        self._held = {s: None for s in self._held}
+        self._last = None
+        return STATUS_OK, b""
+
+    def _message(self, payload: bytes) -> Tuple[int, bytes]:
+        self.messages.append(bytes(payload))
+        return STATUS_OK, bytes(payload)
@@ -0,0 +1,217 @@
+# src/gsp_core/sim/link.py
+
+import queue
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, ContextManager, List, Optional, Tuple
+
+from gsp_core.protocol.stream import StreamDecoder
+from gsp_core.sim.device import SimDevice
+
+class LinkModel:
+    """
+    Timing and fault model of one full-duplex link between host and target.
+
+    Every frame occupies its direction of the wire for len*10/baudrate
+    seconds (8N1 framing), then takes `latency` seconds to arrive. The
+    target handles one command at a time and spends `processing` seconds
+    on each. Frames may be lost (`drop_rate`, per frame) or damaged
+    (`bit_error_rate`, per bit; a damaged frame has one bit flipped).
+
+    Faults come from a private random.Random(seed), so a seeded run is
+    reproducible as long as the host sends the same frames in the same order.
+    """
+    def __init__(
+        self,
+        latency:        float = 0.0,
+        baudrate:       Optional[int] = None,
+        processing:     float = 0.0,
+        bit_error_rate: float = 0.0,
+        drop_rate:      float = 0.0,
+        seed:           Optional[int] = None
+    ):
+        """
+        :param latency:        one-way propagation delay in seconds
+        :param baudrate:       emulated UART speed; None = infinitely fast
+        :param processing:     target time per command in seconds
+        :param bit_error_rate: probability that any one bit is flipped
+        :param drop_rate:      probability that a frame is lost
+        :param seed:           seed for the fault generator
+        """
+        self.latency        = latency
+        self.baudrate       = baudrate
+        self.processing     = processing
+        self.bit_error_rate = bit_error_rate
+        self.drop_rate      = drop_rate
+        self._rng           = random.Random(seed)
+
+        # counters
+        self.dropped   = 0
+        self.corrupted = 0
+
+        # when each resource is next free (time.monotonic() seconds)
+        self._up_free     = 0.0
+        self._target_free = 0.0
+        self._down_free   = 0.0
+
+    def wire_time(self, nbytes: int) -> float:
+        """Seconds `nbytes` occupy the wire at the emulated baud rate."""
+        return nbytes * 10 / self.baudrate if self.baudrate else 0.0
+
+    def impair(self, frame: bytes) -> Optional[bytes]:
+        """Apply drop / bit-error injection; None means the frame was lost."""
+        rng = self._rng
+        if self.drop_rate and rng.random() < self.drop_rate:
+            self.dropped += 1
+            return None
+        if self.bit_error_rate:
+            bits = len(frame) * 8
+            if rng.random() < 1.0 - (1.0 - self.bit_error_rate) ** bits:
+                bit = rng.randrange(bits)
+                damaged = bytearray(frame)
+                damaged[bit >> 3] ^= 1 << (bit & 7)
+                self.corrupted += 1
+                return bytes(damaged)
+        return frame
+
+    def exchange(
+        self,
+        now:     float,
+        frame:   bytes,
+        handler: Callable[[bytes], Optional[bytes]]
+    ) -> List[Tuple[float, bytes]]:
+        """
+        Carry one host frame sent at `now` to `handler` (the target) and
+        its response back. Returns [(deliver_at, response)], empty if
+        either frame was lost or the target did not answer.
+        """
+        up = max(now, self._up_free) + self.wire_time(len(frame))
+        self._up_free = up
+
+        frame = self.impair(frame)
+        if frame is None:
+            return []
+        done = max(up + self.latency, self._target_free) + self.processing
+        self._target_free = done
+
+        resp = handler(frame)
+        if resp is None:
+            return []
+        down = max(done, self._down_free) + self.wire_time(len(resp))
+        self._down_free = down
+
+        resp = self.impair(resp)
+        if resp is None:
+            return []
+        return [(down + self.latency, resp)]
+
+class SimTransport:
+    """
+    In-memory transport wired straight to a SimDevice, with the delays and
+    faults of a LinkModel. Drop-in for UARTTransport/TCPTransport:
+
+        dev    = SimDevice()
+        client = GSPClient(SimTransport(dev, latency=0.002, baudrate=115200))
+        client.erase_flash()
+
+    Responses become visible to recv_frame() at their simulated arrival
+    time, so commands can be pipelined just as over a real link. With all
+    delays at zero nothing ever sleeps except a recv_frame() that times out.
+    """
+    def __init__(
+        self,
+        device:  Optional[SimDevice] = None,
+        timeout: Optional[float] = 0.2,
+        **link:  float
+    ):
+        """
+        :param device:  target to talk to (default: a fresh SimDevice)
+        :param timeout: recv_frame() timeout in seconds; None blocks
+                        until a frame arrives
+        :param link:    LinkModel arguments (latency, baudrate, processing,
+                        bit_error_rate, drop_rate, seed)
+        """
+        self.device  = device if device is not None else SimDevice()
+        self.link    = LinkModel(**link)
+        self.timeout = timeout
+        self._inbox: "deque[Tuple[float, bytes]]" = deque()
+        self._arrived = threading.Condition()
+        self.device.reset_session()
+
+    def send(self, frame: bytes) -> None:
+        """Hand one SLIP-wrapped frame to the simulated link."""
+        responses = self.link.exchange(time.monotonic(), bytes(frame), self.device.handle)
+        with self._arrived:
+            self._inbox.extend(responses)
+            self._arrived.notify_all()
+
+    def recv_frame(self, timeout: Optional[float] = None) -> bytes:
+        """
+        Next response frame, or b"" if none arrives within the timeout.
+        Without a timeout (None here and in the constructor) it blocks
+        until a frame arrives, like a socket in blocking mode.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        inbox = self._inbox
+        if timeout is None:
+            with self._arrived:
+                self._arrived.wait_for(lambda: inbox)
+        wait  = inbox[0][0] - time.monotonic() if inbox else None
+        if wait is None or (timeout is not None and wait > timeout):
+            if timeout:
+                time.sleep(timeout)
+            return b""
+        if wait > 0:
+            time.sleep(wait)
+        return inbox.popleft()[1]
+
+    def close(self) -> None:
+        """Nothing to release; present for transport API parity."""
+        self._inbox.clear()
+
+def serve_stream(
+    recv:   Callable[[], bytes],
+    send:   Callable[[bytes], None],
+    device: SimDevice,
+    link:   LinkModel,
+    lock:   ContextManager
+) -> None:
+    """
+    Run `device` on a byte stream until recv() returns b"" (EOF/stop).
+    Incoming bytes are cut into frames, carried through `link` and the
+    responses written back by a helper thread once they are due.
+    `lock` serialises access to a device shared between streams.
+    """
+    decoder = StreamDecoder(unescape=False)
+    outbox: "queue.Queue[Optional[Tuple[float, bytes]]]" = queue.Queue()
+
+    def write_loop() -> None:
+        # responses are queued in arrival order; hold each until it is due
+        while (item := outbox.get()) is not None:
+            deliver_at, frame = item
+            delay = deliver_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                send(frame)
+            except OSError:
+                return
+
+    writer = threading.Thread(target=write_loop, daemon=True)
+    writer.start()
+    try:
+        while data := recv():
+            now = time.monotonic()
+            for frame in decoder.feed(data):
+                with lock:
+                    replies = link.exchange(now, frame, device.handle)
+                for item in replies:
+                    outbox.put(item)
+    except OSError:
+        pass
+    finally:
+        outbox.put(None)
+        writer.join()
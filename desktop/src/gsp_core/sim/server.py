@@ -0,0 +1,100 @@
+# src/gsp_core/sim/server.py
+
+import socket
+import threading
+from typing import Any, List, Optional, Tuple
+
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import LinkModel, serve_stream
+
+class SimServer:
+    """
+    Serve a SimDevice on a local TCP port, so TCPTransport, the async
+    transports and the `gsp` CLI can all be pointed at it.
+
+    Each connection gets its own LinkModel (same arguments) and starts a
+    fresh SID session on the shared device; commands from concurrent
+    connections are executed one at a time.
+
+        with SimServer(SimDevice(), latency=0.001) as srv:
+            t = TCPTransport(*srv.address, timeout=0.2)
+    """
+    def __init__(
+        self,
+        device: Optional[SimDevice] = None,
+        host:   str = "127.0.0.1",
+        port:   int = 0,
+        **link: Any
+    ):
+        """
+        :param device: target to serve (default: a fresh SimDevice)
+        :param host:   address to bind
+        :param port:   port to bind; 0 picks a free one (see `address`)
+        :param link:   LinkModel arguments applied to every connection
+        """
+        self.device = device if device is not None else SimDevice()
+        self._link  = link
+        self._lock  = threading.Lock()
+        self._sock  = socket.create_server((host, port))
+        self._conns: List[socket.socket] = []
+        self._threads: List[threading.Thread] = []
+        self._stop  = threading.Event()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(host, port) the server is listening on."""
+        return self._sock.getsockname()[:2]
+
+    def start(self) -> "SimServer":
+        """Accept connections on a background thread."""
+        self._spawn(self._accept_loop)
+        return self
+
+    def serve_forever(self) -> None:
+        """Accept connections on the calling thread until stop()."""
+        self._accept_loop()
+
+    def stop(self) -> None:
+        """Close the listening socket and every open connection."""
+        self._stop.set()
+        # shutdown() (not just close()) is what wakes a blocked accept()/recv()
+        for sock in [self._sock, *self._conns]:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._sock.close()
+        for th in list(self._threads):
+            if th is not threading.current_thread():
+                th.join()
+
+    def __enter__(self) -> "SimServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _spawn(self, target: Any, *args: Any) -> None:
+        th = threading.Thread(target=target, args=args, daemon=True)
+        self._threads.append(th)
+        th.start()
+
+    def _accept_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._conns.append(conn)
+            self._spawn(self._serve, conn)
+
+    def _serve(self, conn: socket.socket) -> None:
+        with self._lock:
+            self.device.reset_session()
+        try:
+            serve_stream(lambda: conn.recv(65536), conn.sendall,
+                         self.device, LinkModel(**self._link), self._lock)
+        finally:
+            conn.close()
+            self._conns.remove(conn)
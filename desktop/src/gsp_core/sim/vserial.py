@@ -0,0 +1,83 @@
+# src/gsp_core/sim/vserial.py
+
+import os
+import select
+import threading
+import tty
+from typing import Any, Optional
+
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import LinkModel, serve_stream
+
+class VirtualSerialPort:
+    """
+    A SimDevice behind a real tty (Linux/macOS pseudo-terminal).
+
+    The simulated target sits on the pty master; `port` names the slave,
+    which UARTTransport / pyserial open like any USB-serial adapter. Every
+    byte then goes through pyserial's read/write paths, its timeouts and
+    the kernel tty buffers, just as with hardware:
+
+        with VirtualSerialPort(SimDevice()) as vsp:
+            client = GSPClient(UARTTransport(vsp.port, 115200, timeout=0.2))
+            client.erase_flash()
+
+    A pty ignores the configured baud rate; pass `baudrate=` (a LinkModel
+    argument) to emulate the wire time of a real UART.
+    """
+    def __init__(self, device: Optional[SimDevice] = None, **link: Any):
+        """
+        :param device: target to attach (default: a fresh SimDevice)
+        :param link:   LinkModel arguments (latency, baudrate, processing,
+                       bit_error_rate, drop_rate, seed)
+        """
+        self.device = device if device is not None else SimDevice()
+        self.link   = LinkModel(**link)
+        self._master, self._slave = os.openpty()
+        # no echo / line discipline before the host has opened the port
+        tty.setraw(self._slave)
+        self.port   = os.ttyname(self._slave)
+        self._stop  = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "VirtualSerialPort":
+        """Run the target on a background thread."""
+        self.device.reset_session()
+        self._thread = threading.Thread(
+            target=serve_stream,
+            args=(self._recv, self._send, self.device, self.link, threading.Lock()),
+            name=f"gsp-vserial-{self.port}", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the target and release both ends of the pty."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "VirtualSerialPort":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _recv(self) -> bytes:
+        # poll so stop() is noticed without closing the fd under a read
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if ready:
+                return os.read(self._master, 65536)
+        return b""
+
+    def _send(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._master, view):]
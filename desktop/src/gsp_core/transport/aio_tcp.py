@@ -0,0 +1,71 @@
+# src/gsp_core/transport/aio_tcp.py
+
+import asyncio
+import socket
+from collections import deque
+from typing import Optional
+
+from gsp_core.protocol.stream import StreamDecoder
+
+class AsyncTCPTransport:
+    """
+    asyncio TCP transport for GSP frames.
+
+    Same contract as TCPTransport, as coroutines: recv_frame() returns one
+    SLIP-wrapped frame (both END delimiters included) or b"" on timeout
+    or EOF. Create it with `await AsyncTCPTransport.open(host, port)`.
+    """
+    def __init__(
+        self,
+        reader:  asyncio.StreamReader,
+        writer:  asyncio.StreamWriter,
+        timeout: Optional[float] = None
+    ):
+        self.timeout  = timeout
+        self._reader  = reader
+        self._writer  = writer
+        self._decoder = StreamDecoder(unescape=False)
+        self._frames  = deque()
+
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    @classmethod
+    async def open(
+        cls,
+        host:    str,
+        port:    int,
+        timeout: Optional[float] = None
+    ) -> "AsyncTCPTransport":
+        """Connect to host:port; `timeout` also bounds each recv_frame()."""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        return cls(reader, writer, timeout)
+
+    async def send(self, frame: bytes) -> None:
+        """Send the entire SLIP-wrapped frame, waiting for buffer space."""
+        self._writer.write(frame)
+        await self._writer.drain()
+
+    async def recv_frame(self, timeout: Optional[float] = None) -> bytes:
+        """Next complete frame, or b"" on timeout (default: self.timeout) / closed connection."""
+        if self._frames:
+            return self._frames.popleft()
+        try:
+            return await asyncio.wait_for(self._read_frame(), self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            return b""
+
+    async def _read_frame(self) -> bytes:
+        frames = self._frames
+        while not frames:
+            data = await self._reader.read(65536)
+            if not data:
+                return b""
+            frames.extend(self._decoder.feed(data))
+        return frames.popleft()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+        await self._writer.wait_closed()
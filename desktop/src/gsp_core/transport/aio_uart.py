@@ -0,0 +1,73 @@
+# src/gsp_core/transport/aio_uart.py
+
+import asyncio
+from typing import Optional
+
+import serial
+
+from gsp_core.protocol.stream import StreamDecoder
+
+class AsyncUARTTransport:
+    """
+    asyncio UART transport for GSP frames (POSIX only).
+
+    The port is opened non-blocking and its file descriptor is watched
+    with loop.add_reader(): whenever the tty is readable, everything
+    waiting is drained in one read, cut into frames by a StreamDecoder and
+    queued. No thread per port, so one loop can serve many boards.
+
+    Writes run in the loop's default executor, one frame at a time, so a
+    slow or flow-controlled port does not stall the loop.
+    Create it with `await AsyncUARTTransport.open(port, baudrate, timeout)`.
+    """
+    def __init__(self, ser: serial.Serial, timeout: Optional[float] = None):
+        self.ser      = ser
+        self.timeout  = timeout
+        self._decoder = StreamDecoder(unescape=False)
+        self._frames: "asyncio.Queue[bytes]" = asyncio.Queue()
+        self._writing = asyncio.Lock()     # frames must not interleave on the wire
+        self._loop    = asyncio.get_running_loop()
+        self._loop.add_reader(ser.fileno(), self._on_readable)
+
+    @classmethod
+    async def open(
+        cls,
+        port:     str,
+        baudrate: int,
+        timeout:  Optional[float] = None
+    ) -> "AsyncUARTTransport":
+        """
+        :param port:     Serial port (e.g. "/dev/ttyUSB0")
+        :param baudrate: Baud rate (e.g. 115200)
+        :param timeout:  recv_frame() timeout in seconds
+        """
+        # timeout=0 → read() never blocks the event loop
+        ser = serial.Serial(port=port, baudrate=baudrate, timeout=0)
+        return cls(ser, timeout)
+
+    def _on_readable(self) -> None:
+        try:
+            data = self.ser.read(self.ser.in_waiting or 1)
+        except serial.SerialException:
+            # device went away: stop watching, recv_frame() will time out
+            self._loop.remove_reader(self.ser.fileno())
+            return
+        for frame in self._decoder.feed(data):
+            self._frames.put_nowait(frame)
+
+    async def send(self, frame: bytes) -> None:
+        """Write a complete SLIP-wrapped frame to the UART."""
+        async with self._writing:
+            await self._loop.run_in_executor(None, self.ser.write, bytes(frame))
+
+    async def recv_frame(self, timeout: Optional[float] = None) -> bytes:
+        """Next complete frame, or b"" on timeout (default: self.timeout)."""
+        try:
+            return await asyncio.wait_for(self._frames.get(), self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            return b""
+
+    async def close(self) -> None:
+        """Stop watching the port and close it."""
+        self._loop.remove_reader(self.ser.fileno())
+        self.ser.close()
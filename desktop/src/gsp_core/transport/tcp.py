@@ -1,6 +1,10 @@
 # src/gsp_core/transport/tcp.py
 
 import socket
+from collections import deque
+from typing import Optional
+
+from gsp_core.protocol.stream import StreamDecoder
 
 _END = 0xC0
 
@@ -8,30 +12,98 @@ class TCPTransport:
     """
     TCP-based transport for GSP frames.
     Reads a full SLIP-wrapped frame (with leading+trailing END) from a socket.
+
+    With buffered=True the socket is drained in blocks of up to `bufsize`
+    bytes via recv_into() on a preallocated buffer; frames are cut out by a
+    StreamDecoder and bytes belonging to the next frame are kept for the
+    following recv_frame() call.
     """
-    def __init__(self, host: str, port: int, timeout: float = None):
+    def __init__(
+        self,
+        host:     str,
+        port:     int,
+        timeout:  float = None,
+        buffered: bool = False,
+        bufsize:  int = 16384
+    ):
         self.sock = socket.create_connection((host, port), timeout)
+        self._timeout = timeout
+        self._sock_timeout = timeout   # what the socket is currently set to
+        # frames are small and latency-bound: don't let Nagle hold them back
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._partial   = bytearray()   # unbuffered: frame read so far
+        self._ends_seen = 0
+
+        self._buffered = buffered
+        if buffered:
+            self._rxbuf   = bytearray(bufsize)
+            self._rxview  = memoryview(self._rxbuf)
+            self._decoder = StreamDecoder(unescape=False)
+            self._frames  = deque()
 
     def send(self, frame: bytes) -> None:
         """Send the entire SLIP-wrapped frame over TCP."""
         self.sock.sendall(frame)
 
-    def recv_frame(self) -> bytes:
+    @property
+    def timeout(self) -> Optional[float]:
+        """Default recv_frame() timeout in seconds."""
+        return self._timeout
+
+    def recv_frame(self, timeout: Optional[float] = None) -> bytes:
         """
         Read bytes until we've seen two END (0xC0) delimiters:
         first marks frame start, second marks frame end.
-        Returns the complete frame (including both ENDs).
+        Returns the complete frame (including both ENDs), or b"" on
+        timeout; a frame cut off by the timeout is completed next call.
+
+        :param timeout: override the socket timeout for this call
         """
-        buf = bytearray()
-        ends_seen = 0
+        if timeout is None:
+            timeout = self._timeout
+        if timeout != self._sock_timeout:
+            self.sock.settimeout(timeout)
+            self._sock_timeout = timeout
+        if self._buffered:
+            return self._recv_buffered()
 
-        while ends_seen < 2:
-            b = self.sock.recv(1)
+        buf = self._partial
+        while self._ends_seen < 2:
+            try:
+                b = self.sock.recv(1)
+            except (socket.timeout, BlockingIOError):
+                # keep the partial frame: its rest arrives on a later call
+                return b""
             if not b:
-                # Connection closed or timeout; return what we have
+                # Connection closed; return what we have
                 break
             buf.append(b[0])
             if b[0] == _END:
-                ends_seen += 1
+                self._ends_seen += 1
+
+        frame = bytes(buf)
+        buf.clear()
+        self._ends_seen = 0
+        return frame
+
+    def _recv_buffered(self) -> bytes:
+        """
+        Return the next queued frame, reading more blocks as needed.
+        Returns b"" on timeout or when the peer closed the connection.
+        """
+        frames = self._frames
+        while not frames:
+            try:
+                n = self.sock.recv_into(self._rxview)
+            except (socket.timeout, BlockingIOError):
+                # BlockingIOError: a zero timeout makes the socket non-blocking
+                return b""
+            if not n:
+                return b""
+            frames.extend(self._decoder.feed(self._rxview[:n]))
+        return frames.popleft()
 
-        return bytes(buf)
+    def close(self) -> None:
+        """Close the underlying socket."""
+        self.sock.close()
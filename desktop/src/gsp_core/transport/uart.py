@@ -1,22 +1,67 @@
 # src/gsp_core/transport/uart.py
 
+import math
+import queue
+import threading
+from typing import Optional
+
 import serial
 
+from gsp_core.protocol.stream import StreamDecoder
+
 _END = 0xC0
 
+# port timeouts are rounded up to quarter-octave steps (at most 19% longer
+# than asked): every change makes pyserial reconfigure the port, and the
+# adaptive, jittered per-call timeouts would otherwise change it each call
+_STEPS_PER_OCTAVE = 4
+
+def _port_timeout(timeout: Optional[float]) -> Optional[float]:
+    if not timeout:
+        return timeout
+    return 2.0 ** (math.ceil(math.log2(timeout) * _STEPS_PER_OCTAVE) / _STEPS_PER_OCTAVE)
+
 class UARTTransport:
     """
     UART transport for GSP frames.
 
     Sends raw SLIP‐wrapped frames and reads back until SLIP END.
+
+    With threaded=True a background reader thread drains everything the
+    port has buffered (in_waiting) in one read, cuts it into frames with a
+    StreamDecoder and pushes them onto a bounded queue; recv_frame() then
+    only pops from that queue. When the queue is full the reader stops
+    pulling bytes, leaving them in the driver buffer rather than dropping
+    them.
     """
-    def __init__(self, port: str, baudrate: int, timeout: float):
+    def __init__(
+        self,
+        port:       str,
+        baudrate:   int,
+        timeout:    float,
+        threaded:   bool = False,
+        queue_size: int = 64
+    ):
         """
-        :param port:     Serial port (e.g. "/dev/ttyUSB0" or "COM3")
-        :param baudrate: Baud rate (e.g. 115200)
-        :param timeout:  Read timeout in seconds
+        :param port:       Serial port (e.g. "/dev/ttyUSB0" or "COM3")
+        :param baudrate:   Baud rate (e.g. 115200)
+        :param timeout:    Read timeout in seconds
+        :param threaded:   receive on a dedicated reader thread
+        :param queue_size: frames buffered between reader thread and caller
         """
         self.ser = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
+        self._timeout = timeout
+        self._port_timeout = timeout   # what the port is currently set to
+        self._thread: Optional[threading.Thread] = None
+        if threaded:
+            self._frames: "queue.Queue[bytes]" = queue.Queue(maxsize=queue_size)
+            self._decoder = StreamDecoder(unescape=False)
+            self._stop    = threading.Event()
+            self._error: Optional[BaseException] = None
+            self._thread  = threading.Thread(
+                target=self._reader_loop, name=f"gsp-uart-{port}", daemon=True
+            )
+            self._thread.start()
 
     def send(self, frame: bytes) -> None:
         """
@@ -24,9 +69,67 @@ class UARTTransport:
         """
         self.ser.write(frame)
 
-    def recv_frame(self) -> bytes:
+    @property
+    def timeout(self) -> Optional[float]:
+        """Default recv_frame() timeout in seconds."""
+        return self._timeout
+
+    def recv_frame(self, timeout: Optional[float] = None) -> bytes:
         """
         Read bytes until SLIP END (0xC0) is received.
-        Returns the full frame (including delimiter).
+        Returns the full frame (including delimiter), or b"" on timeout.
+
+        :param timeout: override the port timeout for this call
         """
-        return self.ser.read_until(bytes([_END]))
+        if timeout is None:
+            timeout = self._timeout
+        if self._thread is not None:
+            return self._recv_queued(timeout)
+
+        timeout = _port_timeout(timeout)
+        if timeout != self._port_timeout:
+            self.ser.timeout   = timeout
+            self._port_timeout = timeout
+        frame = self.ser.read_until(bytes([_END]))
+        if frame == bytes([_END]):
+            # that was the leading delimiter; the body follows
+            frame += self.ser.read_until(bytes([_END]))
+        return frame
+
+    def _recv_queued(self, timeout: Optional[float]) -> bytes:
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            if self._error is not None:
+                raise self._error
+            return b""
+
+    def _reader_loop(self) -> None:
+        ser, feed, frames, stop = self.ser, self._decoder.feed, self._frames, self._stop
+        try:
+            while not stop.is_set():
+                # block for the first byte (up to the port timeout), then take
+                # everything else that is already buffered in one go
+                data = ser.read(ser.in_waiting or 1)
+                if not data:
+                    continue
+                for frame in feed(data):
+                    while not stop.is_set():
+                        try:
+                            frames.put(frame, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+        except (serial.SerialException, OSError) as e:
+            if not stop.is_set():
+                self._error = e
+
+    def close(self) -> None:
+        """Stop the reader thread (if any) and close the port."""
+        if self._thread is not None:
+            self._stop.set()
+            cancel = getattr(self.ser, "cancel_read", None)
+            if cancel is not None:
+                cancel()   # wake a read() blocked without timeout
+            self._thread.join()
+        self.ser.close()
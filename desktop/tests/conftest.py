@@ -0,0 +1,40 @@
+# desktop/tests/conftest.py
+
+import pytest
+
+from gsp_core.protocol.commands import CMD_ERASE_FLASH, CMD_WRITE_CHUNK
+from gsp_core.sim.device import SimDevice
+
+
+class CountingDevice(SimDevice):
+    """
+    SimDevice that records what it executes: `counts` by command ID,
+    `written` bytes of WRITE_CHUNK and the `erased` ERASE_FLASH payloads.
+    With `corrupt=n` it flips a bit in the n-th chunk written.
+    """
+    def __init__(self, corrupt=None, **kwargs):
+        super().__init__(**kwargs)
+        self.corrupt = corrupt
+        self.counts  = {}
+        self.written = 0
+        self.erased  = []
+
+    @property
+    def writes(self) -> int:
+        return self.counts.get(CMD_WRITE_CHUNK, 0)
+
+    def _dispatch(self, cmd, payload):
+        self.counts[cmd] = self.counts.get(cmd, 0) + 1
+        if cmd == CMD_WRITE_CHUNK:
+            self.written += len(payload)
+            if self.counts[cmd] == self.corrupt:
+                payload = bytes([payload[0] ^ 0x01]) + payload[1:]
+        elif cmd == CMD_ERASE_FLASH:
+            self.erased.append(payload)
+        return super()._dispatch(cmd, payload)
+
+
+@pytest.fixture
+def counting_device():
+    """Build CountingDevices: counting_device(flash_size=..., corrupt=...)."""
+    return CountingDevice
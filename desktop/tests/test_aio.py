@@ -0,0 +1,121 @@
+# desktop/tests/test_aio.py
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from gsp_core.client.aio import AsyncGSPClient
+from gsp_core.client.base import GSPTimeout
+from gsp_core.protocol.commands import CMD_WRITE_CHUNK
+from gsp_core.protocol.cra import ResponseFrame, parse
+from gsp_core.protocol.slip import encode
+from gsp_core.protocol.stream import StreamDecoder
+from gsp_core.transport.aio_tcp import AsyncTCPTransport
+
+
+def _respond(frame: bytes) -> bytes:
+    """OK response echoing the command payload."""
+    cmd = parse(frame)
+    return encode(ResponseFrame(cmd.sid, 0x00, cmd.payload).build())
+
+
+async def _serve(ignore_first: int = 0):
+    """Loopback target: answers every command; drops the first `ignore_first`."""
+    seen = []
+
+    async def handle(reader, writer):
+        dec = StreamDecoder()
+        while data := await reader.read(4096):
+            for frame in dec.feed(data):
+                seen.append(parse(frame).cmd)
+                if len(seen) <= ignore_first:
+                    continue
+                writer.write(_respond(frame))
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], seen
+
+
+def test_many_targets_on_one_loop():
+    async def board(port, n):
+        t = await AsyncTCPTransport.open("127.0.0.1", port, timeout=1.0)
+        client = AsyncGSPClient(t)
+        await client.erase_flash(0x08000000, 0x1000)
+        for i in range(4):
+            await client.write_chunk(bytes([n, i]) * 32)
+        reply = await client.send_message(b"board %d" % n)
+        await t.close()
+        return reply
+
+    async def main():
+        server, port, seen = await _serve()
+        async with server:
+            replies = await asyncio.gather(*(board(port, n) for n in range(50)))
+        return replies, seen
+
+    replies, seen = asyncio.run(main())
+    assert replies == [b"board %d" % n for n in range(50)]
+    assert seen.count(CMD_WRITE_CHUNK) == 200
+
+
+def test_async_retry_after_timeout():
+    async def main():
+        server, port, seen = await _serve(ignore_first=1)
+        async with server:
+            t = await AsyncTCPTransport.open("127.0.0.1", port, timeout=0.05)
+            await AsyncGSPClient(t).verify_chunk()
+            await t.close()
+        return seen
+
+    assert len(asyncio.run(main())) == 2
+
+
+def test_async_retries_exhausted():
+    async def main():
+        server, port, _ = await _serve(ignore_first=100)
+        async with server:
+            t = await AsyncTCPTransport.open("127.0.0.1", port, timeout=0.01)
+            try:
+                await AsyncGSPClient(t).abort()
+            finally:
+                await t.close()
+
+    with pytest.raises(GSPTimeout):
+        asyncio.run(main())
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs a POSIX pty")
+def test_async_uart_over_pty():
+    from gsp_core.transport.aio_uart import AsyncUARTTransport
+
+    async def main():
+        master, slave = os.openpty()
+        loop = asyncio.get_running_loop()
+        dec = StreamDecoder()
+
+        def on_master():
+            for frame in dec.feed(os.read(master, 4096)):
+                os.write(master, _respond(frame))
+
+        loop.add_reader(master, on_master)
+        t = await AsyncUARTTransport.open(os.ttyname(slave), 115200, timeout=1.0)
+        try:
+            client = AsyncGSPClient(t)
+            await client.write_chunk(b"\xC0\xDB" * 100)
+            return await client.send_message(b"over a tty")
+        finally:
+            await t.close()
+            loop.remove_reader(master)
+            os.close(master)
+            os.close(slave)
+
+    assert asyncio.run(main()) == b"over a tty"
+
+
+def test_async_client_has_no_pipelined_helpers():
+    for name in ("pipeline", "write_chunks", "upload_image", "read_flash"):
+        assert not hasattr(AsyncGSPClient, name)
@@ -0,0 +1,78 @@
+# desktop/tests/test_blank.py
+
+import os
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.image import blank
+from gsp_core.image.blank import is_blank
+from gsp_core.image.segments import SegmentMap
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+BASE = 0x08000000
+
+
+def _padded(erased=0xFF):
+    """Code, a padding hole, more code, trailing padding: half blank."""
+    pad = bytes([erased])
+    return (os.urandom(1000) + pad * 2048 + os.urandom(24) + pad * 24
+            + os.urandom(1000) + pad * 2000)
+
+
+@pytest.mark.parametrize("n", [1, 255, 256, blank._NP_MIN, 3 * blank._NP_MIN + 1])
+def test_is_blank(n):
+    assert is_blank(b"\xFF" * n)
+    assert is_blank(memoryview(bytearray(n)), erased=0x00)
+    assert not is_blank(b"\xFF" * n, erased=0x00)
+    for i in {0, n // 2, n - 1}:
+        chunk = bytearray(b"\xFF" * n)
+        chunk[i] = 0xFE
+        assert not is_blank(chunk)
+    assert not is_blank(b"")
+
+
+@pytest.mark.parametrize("window", [1, 8])
+@pytest.mark.parametrize("erased", [0xFF, 0x00])
+def test_blank_chunks_are_skipped(window, erased, counting_device):
+    data = _padded(erased)
+    dev  = counting_device(flash_size=64 * 1024, erased_value=erased)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    acked  = []
+
+    client.erase_flash(BASE, len(data))
+    sent = client.upload_image(
+        data, window=window, address=BASE, erased_value=erased,
+        on_chunk=lambda offset, n: acked.append((offset, n)),
+    )
+
+    assert dev.read(BASE, len(data)) == data
+    assert sent == dev.written < len(data) // 2
+    # skipped chunks are reported too, so progress and journals see every byte
+    assert sum(n for _, n in acked) == len(data)
+    assert sorted(acked)[-1] == (len(data) - len(data) % 256, len(data) % 256)
+    client.verify_chunk()               # last chunk actually written still checks out
+
+
+def test_segments_skip_blank_only_after_erase(counting_device):
+    data  = _padded()
+    image = SegmentMap()
+    image.add(BASE, data)
+
+    dev = counting_device(flash_size=64 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.upload_segments(image, window=4, erased_value=0xFF)
+    assert dev.read(BASE, len(data)) == data
+    assert dev.written < len(data) // 2
+
+    dev = counting_device(flash_size=64 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.upload_segments(image, erase=False, erased_value=0xFF)
+    assert dev.written == len(data)
+
+
+def test_skipping_needs_an_address():
+    client = GSPClient(SimTransport(SimDevice(flash_size=4096), timeout=0.5))
+    with pytest.raises(ValueError):
+        client.upload_image(b"\xFF" * 512, erased_value=0xFF)
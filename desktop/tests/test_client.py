@@ -0,0 +1,62 @@
+# desktop/tests/test_client.py
+
+import pytest
+from struct import pack
+
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.protocol.cra import parse_frame
+from gsp_core.protocol.dtl import encode_frame, decode_frame
+from gsp_core.protocol.slip import encode, decode
+
+
+class LoopbackDevice:
+    """
+    Transport stand-in that answers every command with an OK response.
+    `corrupt` is the number of responses to damage before answering cleanly.
+    """
+    def __init__(self, dtl: bool, corrupt: int = 0):
+        self.dtl      = dtl
+        self.corrupt  = corrupt
+        self.received = []
+        self._out     = []
+
+    def send(self, frame) -> None:
+        frame = bytes(frame)
+        raw = decode_frame(frame)[0] if self.dtl else decode(frame)
+        kind, info = parse_frame(raw)
+        self.received.append((kind, info))
+        resp = pack("<BBBH", info["sid"], 0, 0x00, 1) + b"\x00"
+        wire = bytearray(encode_frame(resp) if self.dtl else encode(resp))
+        if self.corrupt:
+            self.corrupt -= 1
+            wire[3] ^= 0x01
+        self._out.append(bytes(wire))
+
+    def recv_frame(self) -> bytes:
+        return self._out.pop(0) if self._out else b""
+
+
+@pytest.mark.parametrize("dtl", [False, True])
+def test_write_chunk_roundtrip(dtl):
+    dev = LoopbackDevice(dtl)
+    client = GSPClient(dev, dtl=dtl)
+    client.write_chunk(b"\xC0\xDB" + bytes(range(64)))
+    kind, info = dev.received[0]
+    assert kind == "cmd"
+    assert info["payload"] == b"\xC0\xDB" + bytes(range(64))
+
+
+def test_dtl_crc_error_triggers_retry():
+    dev = LoopbackDevice(dtl=True, corrupt=1)
+    client = GSPClient(dev, dtl=True, crc_enable=True)
+    client.verify_chunk()
+    # first response failed its CRC, so the command went out twice
+    assert len(dev.received) == 2
+    assert dev.received[0][1]["sid"] == dev.received[1][1]["sid"]
+
+
+def test_retries_exhausted_raises():
+    dev = LoopbackDevice(dtl=True, corrupt=100)
+    client = GSPClient(dev, dtl=True)
+    with pytest.raises(GSPTimeout):
+        client.abort()
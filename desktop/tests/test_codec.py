@@ -1,6 +1,8 @@
 import pytest
 
-from gsp_core.protocol.cra import CommandFrame, AckFrame, parse_frame, Priority
+from gsp_core.protocol.cra import (
+    CommandFrame, AckFrame, ResponseFrame, parse, parse_frame, Priority
+)
 
 
 def test_command_frame_build_basic():
@@ -85,3 +87,52 @@ def test_parse_frame_priority_low():
     assert info["cmd"] == 0x99
     assert info["priority"] == Priority.LOW
     assert info["payload"] == b""
+
+
+def test_build_into_matches_build_with_offset():
+    frame = CommandFrame(sid=0x07, cmd=0x11, payload=b"\x01\x02\x03", priority=Priority.HIGH)
+    buf = bytearray(b"\xEE" * (2 + frame.nbytes + 1))
+    n = frame.build_into(buf, 2)
+    assert n == frame.nbytes == 8
+    assert buf[2:2 + n] == frame.build()
+    assert buf[:2] == b"\xEE\xEE" and buf[-1] == 0xEE
+
+
+def test_build_accepts_memoryview_payload():
+    data = bytes(range(32))
+    view = memoryview(data)[8:24]
+    frame = CommandFrame(sid=1, cmd=0x11, payload=view)
+    out = bytearray(frame.nbytes)
+    frame.build_into(out)
+    assert bytes(out) == frame.build() == CommandFrame(sid=1, cmd=0x11, payload=data[8:24]).build()
+
+
+def test_ack_build_into():
+    buf = bytearray(4)
+    assert AckFrame(sid=0x42).build_into(buf, 1) == 3
+    assert buf[1:] == AckFrame(sid=0x42).build()
+
+
+def test_parse_response_object():
+    buf = ResponseFrame(sid=0x21, status=0x03, payload=b"\xAA\xBB").build()
+    assert buf == bytes([0x21, 0x00, 0x00, 0x03, 0x00, 0x03, 0xAA, 0xBB])
+    frame = parse(buf)
+    assert isinstance(frame, ResponseFrame)
+    assert (frame.sid, frame.status) == (0x21, 0x03)
+    assert isinstance(frame.payload, memoryview)
+    assert frame.payload == b"\xAA\xBB"
+    assert frame.payload.obj is buf  # a view, not a copy
+
+
+def test_parse_command_and_ack_objects():
+    cmd = parse(CommandFrame(sid=9, cmd=0x30, payload=b"hi", priority=Priority.CRITICAL).build())
+    assert isinstance(cmd, CommandFrame)
+    assert (cmd.sid, cmd.cmd, cmd.priority, bytes(cmd.payload)) == (9, 0x30, Priority.CRITICAL, b"hi")
+    ack = parse(AckFrame(sid=4).build())
+    assert ack == AckFrame(sid=4)
+    assert not hasattr(ack, "__dict__")
+
+
+def test_parse_response_without_status_raises():
+    with pytest.raises(ValueError):
+        parse(bytes([0x01, 0x00, 0x00, 0x00, 0x00]))
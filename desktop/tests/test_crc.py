@@ -21,3 +21,69 @@ def test_crc_consistency():
     data = b"hello world"
     # CRC should be deterministic across calls
     assert crc16(data) == crc16(data)
+
+
+# ─── slicing-by-8 engine & incremental API ──────────────────────────────────
+
+import os
+import pytest
+from gsp_core.protocol.crc import Crc16, _update, _update_bytewise
+
+@pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 63, 256, 1001])
+def test_slicing_matches_bytewise(size):
+    data = os.urandom(size)
+    for seed in (0xFFFF, 0x0000, 0x1D0F):
+        assert _update(seed, data) == _update_bytewise(seed, data)
+
+def test_crc_accepts_memoryview_and_wide_formats():
+    data = os.urandom(64)
+    assert crc16(memoryview(data)[3:40]) == crc16(data[3:40])
+    assert crc16(memoryview(data).cast("H")) == crc16(data)
+
+@pytest.mark.parametrize("variant, expected", [("ccitt-false", 0x29B1), ("genibus", 0xD64E)])
+def test_incremental_matches_one_shot(variant, expected):
+    c = Crc16(variant=variant)
+    for part in (b"1", b"2345", b"", memoryview(b"6789")):
+        c.update(part)
+    assert c.value == expected
+    assert c.digest() == expected.to_bytes(2, "big")
+    assert c.hexdigest() == f"{expected:04x}"
+    assert Crc16(b"123456789", variant).value == expected
+
+def test_copy_is_independent():
+    a = Crc16(b"1234")
+    b = a.copy()
+    b.update(b"56789")
+    a.update(b"56789")
+    assert a.value == b.value == 0x29B1
+    b.update(b"x")
+    assert a.value != b.value
+
+def test_unknown_variant():
+    with pytest.raises(ValueError):
+        Crc16(variant="kermit")
+
+
+# ─── batched CRC over equal-length chunks ───────────────────────────────────
+
+import gsp_core.protocol.crc as crc_mod
+from gsp_core.protocol.crc import crc16_batch
+
+def _expected(data, size, **kw):
+    return [crc16(data[i:i + size], **kw) for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("length, size", [(0, 256), (256 * 40, 256), (1000, 64), (5, 8)])
+def test_batch_matches_scalar(monkeypatch, use_numpy, length, size):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(crc_mod, "_np", None)
+    data = os.urandom(length)
+    assert list(crc16_batch(data, size)) == _expected(data, size)
+    assert list(crc16_batch(memoryview(data), size, xorout=0xFFFF)) == \
+        _expected(data, size, xorout=0xFFFF)
+
+def test_batch_rejects_bad_chunk_size():
+    with pytest.raises(ValueError):
+        crc16_batch(b"abc", 0)
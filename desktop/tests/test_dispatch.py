@@ -0,0 +1,94 @@
+# desktop/tests/test_dispatch.py
+
+from collections import Counter
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.protocol.commands import CMD_SEND_MESSAGE, STATUS_ERROR, STATUS_OK
+from gsp_core.protocol.cra import AckFrame, CommandFrame, ResponseFrame, parse
+from gsp_core.protocol.slip import decode, encode
+
+CMD_DEVICE_EVENT = 0x31
+
+
+class ChattyDevice:
+    """
+    Transport stand-in for a device that talks on its own: before each
+    response it sends the frames in `before` (device commands, ACKs, stale
+    responses). Host replies to device commands are collected in `replies`.
+    """
+    def __init__(self, before):
+        self.before  = list(before)
+        self.sends   = Counter()
+        self.replies = []
+        self._out    = []
+
+    def send(self, frame) -> None:
+        f = parse(decode(bytes(frame)))
+        if isinstance(f, ResponseFrame):
+            self.replies.append((f.sid, f.status, bytes(f.payload)))
+            return
+        self.sends[f.sid] += 1
+        self._out += [encode(b.build()) for b in self.before]
+        self._out.append(encode(ResponseFrame(f.sid, STATUS_OK, f.payload).build()))
+
+    def recv_frame(self, timeout=None) -> bytes:
+        return self._out.pop(0) if self._out else b""
+
+
+def test_unsolicited_frames_do_not_cause_resends():
+    dev = ChattyDevice([
+        CommandFrame(sid=0x40, cmd=CMD_DEVICE_EVENT, payload=b"temp=42"),
+        AckFrame(sid=0),
+        ResponseFrame(sid=0xFE, status=STATUS_OK),          # late reply to an old SID
+    ])
+    client = GSPClient(dev)
+    events = []
+
+    @client.dispatcher.on(CMD_DEVICE_EVENT)
+    def on_event(frame):
+        events.append(bytes(frame.payload))
+        return b"got it"
+
+    assert client.send_message(b"hello") == b"hello"
+    assert dev.sends == {0: 1}
+    assert events == [b"temp=42"]
+    assert dev.replies == [(0x40, STATUS_OK, b"got it")]
+    d = client.dispatcher
+    assert (d.commands, d.acks, d.stale) == (1, 1, 1)
+
+
+def test_unhandled_or_failing_command_is_answered_with_error():
+    dev = ChattyDevice([
+        CommandFrame(sid=1, cmd=0x77),
+        CommandFrame(sid=2, cmd=CMD_DEVICE_EVENT),
+    ])
+    client = GSPClient(dev)
+    client.dispatcher.register(CMD_DEVICE_EVENT, lambda frame: 1 / 0)
+    client.verify_chunk()
+    assert dev.replies == [(1, STATUS_ERROR, b""), (2, STATUS_ERROR, b"")]
+
+
+def test_resent_device_command_is_answered_not_rerun():
+    event = CommandFrame(sid=9, cmd=CMD_DEVICE_EVENT, payload=b"x")
+    dev = ChattyDevice([event])
+    client = GSPClient(dev)
+    calls = []
+    client.dispatcher.register(CMD_DEVICE_EVENT, lambda frame: calls.append(1) or b"ok")
+    client.verify_chunk()
+    client.verify_chunk()                  # device repeats the same event
+    assert calls == [1]
+    assert dev.replies == [(9, STATUS_OK, b"ok")] * 2
+    assert client.dispatcher.duplicates == 1
+
+
+def test_pipeline_routes_unsolicited_frames():
+    dev = ChattyDevice([CommandFrame(sid=0x80, cmd=CMD_DEVICE_EVENT, payload=b"e"), AckFrame(sid=3)])
+    client = GSPClient(dev)
+    seen = []
+    client.dispatcher.register(CMD_DEVICE_EVENT, lambda frame: seen.append(frame.sid))
+    with client.pipeline(window=4) as pipe:
+        futures = [pipe.submit(CMD_SEND_MESSAGE, bytes([i])) for i in range(6)]
+    assert [f.result() for f in futures] == [bytes([i]) for i in range(6)]
+    assert all(n == 1 for n in dev.sends.values())
+    assert seen == [0x80]                  # later copies were duplicates
+    assert client.dispatcher.acks == 6
@@ -1,7 +1,9 @@
 # desktop/tests/test_dtl.py
 
 import pytest
-from gsp_core.protocol.dtl import encode_frame, decode_frame
+from gsp_core.protocol.dtl import (
+    encode_frame, decode_frame, encode_frame_into, decode_packet, HEADROOM, TAILROOM
+)
 
 def test_roundtrip_without_crc():
     cmd = b'\x01\x02\x03'
@@ -24,3 +26,23 @@ def test_crc_mismatch_raises():
     frame[3] ^= 0xFF
     with pytest.raises(ValueError, match="CRC mismatch"):
         decode_frame(bytes(frame))
+
+@pytest.mark.parametrize("cmd", [b"", b"\x01\x02", b"\xC0\xDB\x00", bytes(range(256))])
+@pytest.mark.parametrize("crc", [True, False])
+def test_encode_frame_into_matches_encode_frame(cmd, crc):
+    n = len(cmd)
+    buf = bytearray(HEADROOM + n + TAILROOM + 16)  # spare capacity is trimmed
+    buf[HEADROOM:HEADROOM + n] = cmd
+    wire = encode_frame_into(buf, n, crc)
+    assert bytes(wire) == encode_frame(cmd, crc_enable=crc)
+    assert decode_frame(bytes(wire)) == (cmd, crc)
+
+def test_encode_frame_into_escape_free_is_in_place():
+    cmd = b"\x01\x02\x03"
+    buf = bytearray(HEADROOM + len(cmd) + TAILROOM)
+    buf[HEADROOM:HEADROOM + 3] = cmd
+    assert encode_frame_into(buf, 3, crc_enable=False) is buf
+
+def test_decode_packet_missing_crc():
+    with pytest.raises(ValueError, match="Missing CRC"):
+        decode_packet(b"\x80\x01")
@@ -0,0 +1,166 @@
+# desktop/tests/test_flashcache.py
+
+import os
+import struct
+
+import pytest
+
+from gsp_core.client.commands.bootloader_ops.verify import range_result
+from gsp_core.client.flashcache import FlashCache
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.image.sectors import SectorMap
+from gsp_core.image.segments import SegmentMap
+from gsp_core.protocol.crc import crc16
+from gsp_core.sim.link import SimTransport
+
+BASE   = 0x08000000
+SECTOR = 1024
+
+
+def _image(data: bytes, address: int = BASE) -> SegmentMap:
+    image = SegmentMap()
+    image.add(address, data)
+    return image
+
+
+def _flash(cache, dev, image, device="board-1", sectors=None):
+    plan = cache.plan(device, image)
+    cache.begin(plan)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.upload_segments(plan.image, window=4, erased_value=0xFF, sectors=sectors)
+    cache.commit(plan)
+    return plan
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FlashCache(str(tmp_path / "cache"), sector_size=SECTOR)
+
+
+def test_reflash_rewrites_only_changed_sectors(cache, counting_device):
+    dev = counting_device(flash_size=64 * 1024)
+    old = os.urandom(20 * SECTOR + 100)
+    plan = _flash(cache, dev, _image(old))
+    assert plan.full and plan.reason == "no record for this device"
+
+    new = bytearray(old)
+    new[3 * SECTOR + 7] ^= 0xFF                      # one byte in sector 3
+    new[4 * SECTOR:4 * SECTOR + 16] = os.urandom(16) # and sector 4
+    new += os.urandom(50)                            # grows within the last sector
+    dev.written, dev.erased = 0, []
+    plan = _flash(cache, dev, _image(bytes(new)))
+
+    assert not plan.full and plan.changed == 3
+    assert plan.image.ranges() == [(BASE + 3 * SECTOR, 2 * SECTOR), (BASE + 20 * SECTOR, SECTOR)]
+    assert len(dev.erased) == 2 and dev.written < 3 * SECTOR
+    assert dev.read(BASE, len(new)) == bytes(new)
+
+    assert cache.plan("board-1", _image(bytes(new))).changed == 0
+
+
+def test_sectors_of_sparse_image(cache):
+    image = SegmentMap()
+    image.add(BASE + 10, b"\x01" * 10)
+    image.add(BASE + SECTOR - 4, b"\x02" * 8)         # straddles sectors 0 and 1
+    image.add(BASE + 5 * SECTOR, b"\x03")
+    plan = cache.plan("board-1", image)
+    assert plan.sectors == [BASE, BASE + SECTOR, BASE + 5 * SECTOR]
+    assert plan.crcs[2] == crc16(b"\x03" + b"\xFF" * (SECTOR - 1))
+
+
+def test_crc_collision_is_caught_by_byte_compare(cache, counting_device):
+    dev = counting_device(flash_size=16 * 1024)
+    old = os.urandom(4 * SECTOR)
+    _flash(cache, dev, _image(old))
+
+    # adding the CRC-16 generator polynomial keeps the CRC unchanged
+    new = bytearray(old)
+    for i, b in enumerate(b"\x01\x10\x21"):
+        new[SECTOR + 100 + i] ^= b
+    assert crc16(new[SECTOR:2 * SECTOR]) == crc16(old[SECTOR:2 * SECTOR])
+
+    plan = cache.plan("board-1", _image(bytes(new)))
+    assert plan.changed == 1 and plan.image.ranges() == [(BASE + SECTOR, SECTOR)]
+
+
+def test_untrusted_records_fall_back_to_full(cache, tmp_path, counting_device):
+    dev   = counting_device(flash_size=16 * 1024)
+    image = _image(os.urandom(3 * SECTOR))
+    _flash(cache, dev, image)
+    assert not cache.plan("board-1", image).full
+
+    assert cache.plan("board-2", image).reason == "no record for this device"
+    assert cache.plan("board-1", image, full=True).reason == "requested"
+    other = FlashCache(cache.root, sector_size=2 * SECTOR)
+    assert other.plan("board-1", image).reason == "record is for other sector geometry"
+    stale = FlashCache(cache.root, sector_size=SECTOR, max_age=-1)
+    assert stale.plan("board-1", image).reason == "record is too old"
+
+    # a flash that starts but never commits leaves the device unknown
+    cache.begin(cache.plan("board-1", image))
+    assert cache.plan("board-1", image).full
+
+    _flash(cache, dev, image)
+    blob = os.path.join(cache.root, "images", os.listdir(os.path.join(cache.root, "images"))[0])
+    with open(blob, "r+b") as f:
+        f.write(b"\x00")
+    assert cache.plan("board-1", image).reason == "cached image is missing or damaged"
+
+
+def test_boards_share_contents_and_old_ones_are_pruned(cache, counting_device):
+    images = os.path.join(cache.root, "images")
+    v1, v2 = _image(os.urandom(2 * SECTOR)), _image(os.urandom(2 * SECTOR))
+    for board in ("a", "b"):
+        _flash(cache, counting_device(flash_size=8 * 1024), v1, board)
+    assert len(os.listdir(images)) == 1
+
+    _flash(cache, counting_device(flash_size=8 * 1024), v2, "a")
+    assert len(os.listdir(images)) == 2              # "b" still runs v1
+    _flash(cache, counting_device(flash_size=8 * 1024), v2, "b")
+    assert len(os.listdir(images)) == 1
+
+
+def test_non_uniform_sectors_are_rewritten_whole(tmp_path, counting_device):
+    layout = SectorMap.parse("2x1K, 2x4K, 1x16K", base=BASE)
+    cache  = FlashCache(str(tmp_path / "cache"), sectors=layout)
+    dev    = counting_device(flash_size=64 * 1024)
+    old    = os.urandom(20 * 1024)
+    _flash(cache, dev, _image(old), sectors=layout)
+
+    new = bytearray(old)
+    new[2 * 1024 + 4 * 1024 + 100] ^= 0xFF           # inside the second 4K sector
+    dev.written, dev.erased = 0, []
+    plan = _flash(cache, dev, _image(bytes(new)), sectors=layout)
+
+    assert plan.changed == 1 and plan.image.ranges() == [(BASE + 6 * 1024, 4 * 1024)]
+    assert dev.erased == [struct.pack("<II", BASE + 6 * 1024, 4 * 1024)]
+    assert dev.read(BASE, len(new)) == bytes(new)
+
+    other = FlashCache(cache.root, sectors=SectorMap.parse("4x1K, 1x4K, 1x16K", base=BASE))
+    assert other.plan("board-1", _image(bytes(new))).reason == "record is for other sector geometry"
+    with pytest.raises(ValueError):
+        cache.plan("board-1", _image(b"\x00", BASE + 64 * 1024))     # outside the layout
+
+
+def test_skipped_sectors_are_confirmed_on_the_device(cache, counting_device):
+    dev = counting_device(flash_size=64 * 1024)
+    old = os.urandom(8 * SECTOR)
+    _flash(cache, dev, _image(old))
+    new = bytearray(old)
+    new[5 * SECTOR] ^= 0xFF
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+
+    def check(address, length, crc):
+        checked.append((address, length))
+        return range_result(client.verify_range(address, length, crc))[0]
+
+    checked = []
+    plan = cache.plan("board-1", _image(bytes(new)), check=check)
+    assert not plan.full and plan.changed == 1
+    assert checked == [(BASE, 5 * SECTOR), (BASE + 6 * SECTOR, 2 * SECTOR)]
+
+    # another board behind the same adapter: its flash does not match the record
+    dev.flash[2 * SECTOR] ^= 0xFF
+    checked = []
+    plan = cache.plan("board-1", _image(bytes(new)), check=check)
+    assert plan.full and plan.reason == f"flash at 0x{BASE:08X} (+{5 * SECTOR}) does not match the record"
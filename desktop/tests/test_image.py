@@ -0,0 +1,148 @@
+# desktop/tests/test_image.py
+
+import io
+import os
+import struct
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.image.elf import load_elf
+from gsp_core.image.ihex import load_ihex
+from gsp_core.image.load import detect_format, load_image
+from gsp_core.image.segments import SegmentMap
+from gsp_core.image.srec import load_srec
+from gsp_core.sim.link import SimTransport
+
+BASE = 0x08000000
+
+
+def _ihex_record(kind: int, offset: int, data: bytes) -> bytes:
+    rec = bytes([len(data), offset >> 8, offset & 0xFF, kind]) + data
+    return b":" + (rec + bytes([-sum(rec) & 0xFF])).hex().upper().encode() + b"\n"
+
+
+def _ihex(segments, entry=None) -> bytes:
+    out, upper = [], None
+    for address, data in segments:
+        for i in range(0, len(data), 16):
+            a = address + i
+            if a >> 16 != upper:
+                upper = a >> 16
+                out.append(_ihex_record(0x04, 0, upper.to_bytes(2, "big")))
+            out.append(_ihex_record(0x00, a & 0xFFFF, data[i:i + 16]))
+    if entry is not None:
+        out.append(_ihex_record(0x05, 0, entry.to_bytes(4, "big")))
+    out.append(_ihex_record(0x01, 0, b""))
+    return b"".join(out)
+
+
+def _srec_record(kind: int, address: int, data: bytes) -> bytes:
+    n = {0: 2, 1: 2, 2: 3, 3: 4, 5: 2, 7: 4, 8: 3, 9: 2}[kind]
+    rec = bytes([n + len(data) + 1]) + address.to_bytes(n, "big") + data
+    return b"S%d" % kind + (rec + bytes([~sum(rec) & 0xFF])).hex().upper().encode() + b"\n"
+
+
+def _elf32(segments, entry=0) -> bytes:
+    """Minimal little-endian ELF32 executable with one PT_LOAD per segment."""
+    phoff = 52
+    data_off = phoff + 32 * len(segments)
+    hdr = b"\x7fELF\x01\x01\x01" + bytes(9) + struct.pack(
+        "<HHIIIIIHHHHHH", 2, 40, 1, entry, phoff, 0, 0, 52, 32, len(segments), 40, 0, 0)
+    phdrs, blobs = b"", b""
+    for paddr, data, memsz in segments:
+        phdrs += struct.pack("<IIIIIIII", 1, data_off + len(blobs), 0x20000000, paddr,
+                             len(data), memsz, 5, 4)
+        blobs += data
+    return hdr + phdrs + blobs
+
+
+SEGMENTS = [(BASE, os.urandom(1000)), (BASE + 0x10000, os.urandom(300))]
+
+
+def test_segment_map_merges_and_rejects_overlap():
+    m = SegmentMap()
+    m.add(0x100, b"\x01" * 16)
+    m.add(0x120, b"\x03" * 16)
+    m.add(0x110, b"\x02" * 16)          # closes the gap: one segment
+    assert m.ranges() == [(0x100, 48)]
+    m.add(0x200, b"\x04")
+    assert m.ranges() == [(0x100, 48), (0x200, 1)]
+    assert m.size == 49 and m.span == (0x100, 0x201)
+    assert m.read(0x12E, 4) == b"\x03\x03\xFF\xFF"
+    with pytest.raises(ValueError):
+        m.add(0x12F, b"\x00\x00")
+
+
+def test_intel_hex():
+    image = load_ihex(io.BytesIO(_ihex(SEGMENTS, entry=BASE + 0x101)))
+    assert [(s.address, bytes(s.data)) for s in image] == SEGMENTS
+    assert image.entry == BASE + 0x101
+
+
+def test_intel_hex_errors():
+    lines = _ihex([(0, b"\x00" * 4)]).splitlines(keepends=True)
+    lines[1] = lines[1].replace(b"00000000FC", b"00000001FC")
+    bad = b"".join(lines)
+    with pytest.raises(ValueError, match="line 2: checksum"):
+        load_ihex(io.BytesIO(bad))
+    with pytest.raises(ValueError, match="line 1"):
+        load_ihex([b"garbage"])
+
+
+def test_srecord():
+    lines = [_srec_record(0, 0, b"hdr")]
+    for i in range(0, 1000, 32):
+        lines.append(_srec_record(3, BASE + i, SEGMENTS[0][1][i:i + 32]))
+    lines.append(_srec_record(2, 0x123456, b"\xAA\xBB"))
+    lines.append(_srec_record(1, 0x10, b"\xCC"))
+    lines.append(_srec_record(7, BASE + 1, b""))
+    image = load_srec(lines)
+    assert image.ranges() == [(0x10, 1), (0x123456, 2), (BASE, 1000)]
+    assert bytes(image.read(BASE, 1000)) == SEGMENTS[0][1]
+    assert image.entry == BASE + 1
+    with pytest.raises(ValueError, match="checksum"):
+        load_srec([lines[1][:-3] + b"00\n"])
+
+
+def test_elf_uses_load_addresses_and_skips_bss():
+    blob = _elf32([(BASE, SEGMENTS[0][1], 1000),
+                   (BASE + 0x10000, SEGMENTS[1][1], 300),
+                   (0x20000400, b"", 0x400)], entry=BASE + 0x101)   # .bss only
+    image = load_elf(io.BytesIO(blob))
+    assert [(s.address, bytes(s.data)) for s in image] == SEGMENTS
+    assert image.entry == BASE + 0x101
+    with pytest.raises(ValueError):
+        load_elf(io.BytesIO(b"MZ\x90\x00" + bytes(60)))
+
+
+def test_detect_format(tmp_path):
+    files = {
+        "a.hex": _ihex(SEGMENTS), "a.s37": _srec_record(3, BASE, b"\x01"),
+        "a.axf": _elf32([(BASE, b"\x01", 1)]), "a.bin": b"\x7fELX",
+        "noext": _ihex(SEGMENTS),
+    }
+    for name, blob in files.items():
+        (tmp_path / name).write_bytes(blob)
+    fmt = {name: detect_format(str(tmp_path / name)) for name in files}
+    assert fmt == {"a.hex": "ihex", "a.s37": "srec", "a.axf": "elf", "a.bin": "bin", "noext": "ihex"}
+    assert load_image(str(tmp_path / "a.bin"), address=BASE).ranges() == [(BASE, 4)]
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_upload_segments_sends_only_populated_ranges(tmp_path, window, counting_device):
+    path = tmp_path / "fw.hex"
+    path.write_bytes(_ihex(SEGMENTS))
+    dev = counting_device(flash_size=128 * 1024)
+    dev.flash[:] = b"\x00" * len(dev.flash)      # old contents everywhere
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    acked = []
+
+    image = load_image(str(path))
+    sent  = client.upload_segments(image, window=window, on_chunk=lambda a, n: acked.append((a, n)))
+
+    assert sent == dev.written == 1300
+    for address, data in SEGMENTS:
+        assert dev.read(address, len(data)) == data
+    assert dev.read(BASE + 1000, 16) == b"\x00" * 16   # gap neither erased nor written
+    assert sorted(acked)[0] == (BASE, 256) and sorted(acked)[-1] == (BASE + 0x10100, 44)
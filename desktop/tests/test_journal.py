@@ -0,0 +1,133 @@
+# desktop/tests/test_journal.py
+
+import json
+import os
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.client.journal import UploadJournal, image_digest, journal_path
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+BASE = 0x08000000
+
+
+class CutTransport(SimTransport):
+    """SimTransport whose line goes dead after `cut` frames."""
+    def __init__(self, device, cut, **kwargs):
+        super().__init__(device, **kwargs)
+        self.cut = cut
+
+    def send(self, frame) -> None:
+        self.cut -= 1
+        if self.cut >= 0:
+            super().send(frame)
+
+
+def _image(tmp_path, n=40_000):
+    path = tmp_path / "fw.bin"
+    path.write_bytes(os.urandom(n))
+    return str(path)
+
+
+def test_ack_tracks_contiguous_prefix(tmp_path):
+    j = UploadJournal(str(tmp_path / "j"), "00", 1000, interval=3600)
+    j.ack(256, 256)
+    assert j.confirmed == 0                  # offset 0 not acknowledged yet
+    j.ack(0, 256)
+    assert j.confirmed == 512
+    j.ack(768, 232)
+    j.ack(512, 256)
+    assert j.confirmed == 1000 and j.done
+
+
+def test_journal_must_match_image_and_address(tmp_path):
+    image = _image(tmp_path, 1000)
+    path  = str(tmp_path / "fw.journal")
+    j = UploadJournal.open(path, image, BASE)
+    j.ack(0, 512)
+    j.save()
+    assert json.load(open(path))["sha256"] == image_digest(image)
+
+    assert UploadJournal.open(path, image, BASE).confirmed == 512
+    assert UploadJournal.open(path, image, BASE, resume=False).confirmed == 0
+    assert UploadJournal.open(path, image, BASE + 0x1000).confirmed == 0
+    with open(image, "r+b") as f:
+        f.write(b"rebuilt")
+    assert not UploadJournal.open(path, image, BASE).resumed
+    with pytest.raises(ValueError):
+        image_digest(iter([b"stream"]))
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_resume_after_line_failure(tmp_path, window, counting_device):
+    image = _image(tmp_path)
+    data  = open(image, "rb").read()
+    jpath = image + ".journal"
+    dev   = counting_device(flash_size=64 * 1024)
+
+    client = GSPClient(CutTransport(dev, cut=100, timeout=0.01))
+    client._max_retries = 2
+    client.erase_flash(BASE, len(data))
+    with pytest.raises(GSPTimeout):
+        client.upload_image(image, window=window, journal=UploadJournal.open(jpath, image, BASE))
+    confirmed = json.load(open(jpath))["confirmed"]
+    assert 0 < confirmed < len(data)
+    first = dev.writes
+
+    # a new host session picks up where the last one stopped
+    dev.reset_session()
+    client  = GSPClient(SimTransport(dev, timeout=0.5))
+    journal = UploadJournal.open(jpath, image, BASE, resume=True)
+    assert journal.resumed and journal.confirmed == confirmed
+    client.upload_image(image, window=window, journal=journal)
+
+    assert dev.read(BASE, len(data)) == data
+    assert not os.path.exists(jpath)
+    assert dev.writes - first <= (len(data) - confirmed) // 256 + 1
+
+
+def test_interrupt_saves_journal(tmp_path):
+    image = _image(tmp_path, 10_000)
+    jpath = image + ".journal"
+    dev   = SimDevice(flash_size=64 * 1024)
+    client = GSPClient(SimTransport(dev))
+    client.erase_flash()
+
+    def stop(offset, length):
+        if offset >= 4096:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        client.upload_image(image, journal=UploadJournal.open(jpath, image, BASE), on_chunk=stop)
+    assert json.load(open(jpath))["confirmed"] == 4096 + 256
+
+    client.upload_image(image, journal=UploadJournal.open(jpath, image, BASE))
+    assert dev.read(BASE, 10_000) == open(image, "rb").read()
+
+
+def test_journal_path_is_per_image_under_the_directory(tmp_path):
+    a = journal_path(str(tmp_path / "j"), str(tmp_path / "a" / "fw.bin"))
+    b = journal_path(str(tmp_path / "j"), str(tmp_path / "b" / "fw.bin"))
+    assert os.path.dirname(a) == str(tmp_path / "j")
+    assert os.path.basename(a).startswith("fw.bin.") and a.endswith(".journal")
+    assert a != b
+    assert a == journal_path(str(tmp_path / "j"), os.path.relpath(str(tmp_path / "a" / "fw.bin")))
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_unwritable_journal_does_not_stop_the_upload(tmp_path, window):
+    image = _image(tmp_path)
+    (tmp_path / "ro").write_bytes(b"")               # a file where the directory should be
+    jpath = str(tmp_path / "ro" / "fw.journal")
+    dev   = SimDevice(flash_size=64 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.erase_flash()
+
+    journal = UploadJournal.open(jpath, image, BASE, interval=0.0)
+    client.upload_image(image, window=window, journal=journal)
+
+    with open(image, "rb") as f:
+        assert dev.read(BASE, 40_000) == f.read()
+    assert journal.done and not os.path.exists(jpath)
@@ -0,0 +1,109 @@
+# desktop/tests/test_pipeline.py
+
+from collections import Counter
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.protocol.commands import CMD_SEND_MESSAGE, CMD_WRITE_CHUNK
+from gsp_core.protocol.cra import ResponseFrame, parse
+from gsp_core.protocol.slip import decode, encode
+
+
+class WindowDevice:
+    """
+    Transport stand-in that queues one echo response per command and
+    releases one per recv_frame() call (FIFO, or LIFO with `lifo=True`).
+    Responses for SIDs in `drop` are swallowed the given number of times.
+    """
+    def __init__(self, lifo: bool = False, drop: dict = None):
+        self.lifo     = lifo
+        self.drop     = dict(drop or {})
+        self.sends    = Counter()
+        self.commands = []
+        self.max_out  = 0
+        self._out     = []
+
+    def send(self, frame) -> None:
+        cmd = parse(decode(bytes(frame)))
+        self.sends[cmd.sid] += 1
+        self.commands.append((cmd.sid, cmd.cmd, bytes(cmd.payload)))
+        if self.drop.get(cmd.sid, 0):
+            self.drop[cmd.sid] -= 1
+            return
+        self._out.append(encode(ResponseFrame(cmd.sid, 0x00, cmd.payload).build()))
+        self.max_out = max(self.max_out, len(self._out))
+
+    def recv_frame(self) -> bytes:
+        if not self._out:
+            return b""
+        return self._out.pop() if self.lifo else self._out.pop(0)
+
+
+def test_window_limits_outstanding_commands():
+    dev = WindowDevice()
+    client = GSPClient(dev)
+    with client.pipeline(window=4) as pipe:
+        futures = [pipe.submit(CMD_SEND_MESSAGE, bytes([i])) for i in range(10)]
+    assert dev.max_out == 4
+    assert [f.result() for f in futures] == [bytes([i]) for i in range(10)]
+
+
+def test_out_of_order_responses_matched_by_sid():
+    dev = WindowDevice(lifo=True)
+    client = GSPClient(dev)
+    pipe = client.pipeline(window=8)
+    futures = [pipe.submit(CMD_SEND_MESSAGE, b"m%d" % i) for i in range(8)]
+    # result() drives the pipeline itself
+    assert futures[0].result() == b"m0"
+    pipe.flush()
+    assert [f.result() for f in futures] == [b"m%d" % i for i in range(8)]
+
+
+def test_only_the_lost_command_is_resent():
+    dev = WindowDevice(drop={2: 1})
+    client = GSPClient(dev)
+    with client.pipeline(window=4, timeout=0.01) as pipe:
+        futures = [pipe.submit(CMD_SEND_MESSAGE, bytes([i])) for i in range(6)]
+    assert dev.sends[2] == 2
+    assert all(n == 1 for sid, n in dev.sends.items() if sid != 2)
+    assert futures[2].result() == b"\x02"
+
+
+def test_exhausted_command_fails_its_future_only():
+    dev = WindowDevice(drop={1: 100})
+    client = GSPClient(dev)
+    pipe = client.pipeline(window=3, timeout=0.005)
+    futures = [pipe.submit(CMD_SEND_MESSAGE, bytes([i])) for i in range(3)]
+    with pytest.raises(GSPTimeout):
+        pipe.flush()
+    assert isinstance(futures[1].exception(), GSPTimeout)
+    assert futures[0].result() == b"\x00" and futures[2].result() == b"\x02"
+    assert dev.sends[1] == client._max_retries
+
+
+def test_write_chunks_streams_in_order():
+    dev = WindowDevice()
+    client = GSPClient(dev)
+    chunks = [bytes([i]) * 16 for i in range(20)]
+    client.write_chunks(chunks, window=6)
+    assert [c for _, cmd, c in dev.commands if cmd == CMD_WRITE_CHUNK] == chunks
+
+
+def test_window_bounds():
+    client = GSPClient(WindowDevice())
+    with pytest.raises(ValueError):
+        client.pipeline(window=0)
+    with pytest.raises(ValueError):
+        client.pipeline(window=200)
+
+
+def test_sid_of_a_retried_command_is_not_reused():
+    # sid 0 stays unanswered while 300 others complete and the SIDs wrap
+    dev = WindowDevice(drop={0: 3})
+    client = GSPClient(dev)
+    with client.pipeline(window=8, timeout=0.05) as pipe:
+        futures = [pipe.submit(CMD_SEND_MESSAGE, i.to_bytes(2, "little")) for i in range(300)]
+        assert pipe.in_flight <= 8
+    assert [f.result() for f in futures] == [i.to_bytes(2, "little") for i in range(300)]
+    assert dev.sends[0] == 4 + 1       # the retried command, then the next lap's
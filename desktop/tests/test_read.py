@@ -0,0 +1,124 @@
+# desktop/tests/test_read.py
+
+import io
+import os
+import tracemalloc
+
+import pytest
+
+from gsp_core.client.commands.bootloader_ops.read import MAX_READ
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.client.scheduler import CommandScheduler, ScheduledGSPClient
+from gsp_core.protocol.commands import CMD_READ_FLASH, CMD_WRITE_CHUNK
+from gsp_core.protocol.crc import Crc16, crc16
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+BASE = 0x08000000
+
+
+def _device(size: int, **kwargs) -> SimDevice:
+    dev = SimDevice(flash_size=size, **kwargs)
+    dev.flash[:] = os.urandom(size)
+    return dev
+
+
+def test_read_chunk_against_sim():
+    dev    = _device(4096)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    assert client.read_chunk(BASE + 100, 300) == dev.read(BASE + 100, 300)
+    with pytest.raises(GSPTimeout):
+        client.read_chunk(BASE + 4000, 200)        # outside flash: FLASH_FAILURE
+
+
+def test_reads_leave_room_for_the_status_byte():
+    dev    = _device(64 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    assert client.read_chunk(BASE, MAX_READ) == dev.read(BASE, MAX_READ)
+    with pytest.raises(ValueError):
+        client.read_chunk(BASE, MAX_READ + 1)
+    with pytest.raises(ValueError):
+        client.read_flash(BASE, 1024, io.BytesIO(), chunk_size=MAX_READ + 1)
+
+
+def test_scheduled_client_reads_through_the_queues():
+    dev    = _device(8192)
+    sched  = CommandScheduler(GSPClient(SimTransport(dev, timeout=0.5)))
+    with sched:
+        api = ScheduledGSPClient(sched)
+        out = io.BytesIO()
+        assert api.read_flash(BASE, 5000, out, window=8) == crc16(dev.read(BASE, 5000))
+    assert out.getvalue() == dev.read(BASE, 5000)
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_read_flash_into_each_kind_of_sink(window, tmp_path):
+    dev    = _device(64 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    want   = dev.read(BASE + 10, 20000)
+
+    buf = bytearray(20000)
+    assert client.read_flash(BASE + 10, 20000, buf, window=window) == crc16(want)
+    assert buf == want
+
+    stream = io.BytesIO(b"head")
+    stream.seek(4)
+    client.read_flash(BASE + 10, 20000, stream, chunk_size=1000, window=window)
+    assert stream.getvalue() == b"head" + want
+
+    path, seen = tmp_path / "dump.bin", []
+    client.read_flash(BASE + 10, 20000, str(path), window=window, on_chunk=lambda o, n: seen.append((o, n)))
+    assert path.read_bytes() == want
+    assert [o for o, _ in seen] == list(range(0, 20000, 256))
+
+    with pytest.raises(ValueError):
+        client.read_flash(BASE, 100, bytearray(50))
+
+
+def test_crc_continues_across_resumed_reads():
+    dev    = _device(8192)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    crc    = Crc16(dev.read(BASE, 3000))            # already on disk
+    assert client.read_flash(BASE + 3000, 5000, io.BytesIO(), window=4, crc=crc) == crc16(dev.read(BASE, 8000))
+
+
+def test_pipelined_read_survives_drops_and_stays_in_order():
+    dev    = _device(64 * 1024, dtl=True)
+    link   = SimTransport(dev, timeout=0.01, drop_rate=0.05, seed=3)
+    client = GSPClient(link, dtl=True)
+    client._max_retries = 10
+    out = io.BytesIO()
+
+    crc = client.read_flash(BASE, 48 * 1024, out, window=16)
+
+    assert link.link.dropped
+    assert out.getvalue() == dev.read(BASE, 48 * 1024)
+    assert crc == crc16(out.getvalue())
+
+
+def test_read_sees_earlier_pipelined_writes():
+    dev    = SimDevice(flash_size=4096)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    data   = os.urandom(512)
+    with client.pipeline(window=4) as pipe:
+        pipe.submit(CMD_WRITE_CHUNK, data[:256])
+        pipe.submit(CMD_WRITE_CHUNK, data[256:])
+        future = pipe.submit(CMD_READ_FLASH, (BASE).to_bytes(4, "little") + (512).to_bytes(2, "little"))
+    assert future.result() == data
+
+
+def test_dump_to_file_holds_only_the_window(tmp_path):
+    size   = 4 * 1024 * 1024
+    dev    = _device(size)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    path   = tmp_path / "dump.bin"
+
+    tracemalloc.start()
+    try:
+        client.read_flash(BASE, size, str(path), chunk_size=1024, window=8)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert path.read_bytes() == dev.read(BASE, size)
+    assert peak < size // 4          # mostly the simulator's response cache
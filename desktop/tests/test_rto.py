@@ -0,0 +1,89 @@
+# desktop/tests/test_rto.py
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.client.rto import RetransmitPolicy, RttEstimator
+from gsp_core.protocol.commands import CMD_ERASE_FLASH, CMD_WRITE_CHUNK
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+
+def test_estimator_follows_rfc6298():
+    est = RttEstimator(initial=1.0, floor=0.0, ceiling=60.0)
+    assert est.rto == 1.0
+    est.sample(0.100)
+    assert est.srtt == pytest.approx(0.100)
+    assert est.rttvar == pytest.approx(0.050)
+    assert est.rto == pytest.approx(0.100 + 4 * 0.050)
+    est.sample(0.200)
+    assert est.rttvar == pytest.approx(0.75 * 0.050 + 0.25 * 0.100)
+    assert est.srtt == pytest.approx(0.875 * 0.100 + 0.125 * 0.200)
+
+
+def test_estimator_is_clamped():
+    est = RttEstimator(initial=10.0, floor=0.05, ceiling=2.0)
+    assert est.rto == 2.0
+    for _ in range(50):
+        est.sample(0.0001)
+    assert est.rto == 0.05
+
+
+def test_backoff_is_exponential_jittered_and_capped():
+    policy = RetransmitPolicy(initial=0.1, ceiling=1.0, backoff=2.0, jitter=0.1, seed=3)
+    assert policy.timeout(CMD_WRITE_CHUNK, 1) == 0.1
+    for attempt, base in ((2, 0.2), (3, 0.4), (4, 0.8)):
+        assert base * 0.9 <= policy.timeout(CMD_WRITE_CHUNK, attempt) <= base * 1.1
+    assert policy.timeout(CMD_WRITE_CHUNK, 8) == pytest.approx(1.0, rel=0.1)
+    assert policy.timeout(CMD_WRITE_CHUNK, 8) <= 1.0
+
+
+def test_from_config_per_command_limits():
+    policy = RetransmitPolicy.from_config({
+        "initial":  None,
+        "ceiling":  2.0,
+        "commands": {"erase_flash": {"initial": 3.0, "ceiling": 30.0}},
+    }, initial=0.2)
+    assert policy.timeout(CMD_WRITE_CHUNK) == 0.2
+    assert policy.timeout(CMD_ERASE_FLASH) == 3.0
+    assert RetransmitPolicy.from_config({"adaptive": False}) is None
+    with pytest.raises(ValueError):
+        RetransmitPolicy.from_config({"commands": {"no_such_cmd": {}}})
+
+
+def test_client_learns_rtt_per_command():
+    t = SimTransport(SimDevice(flash_size=64 * 1024), timeout=0.5, latency=0.001)
+    client = GSPClient(t)
+    client.erase_flash()
+    for _ in range(20):
+        client.write_chunk(bytes(64))
+    est = client.rto.estimator(CMD_WRITE_CHUNK)
+    assert est.samples == 20
+    # adapted from the 0.5 s transport default towards the ~2 ms round trip
+    assert est.rto < 0.1
+    assert client.rto.estimator(CMD_ERASE_FLASH).samples == 1
+
+
+class SilentTransport:
+    """Never answers; records the timeout of every receive."""
+    timeout = 0.01
+
+    def __init__(self):
+        self.waits = []
+
+    def send(self, frame) -> None:
+        pass
+
+    def recv_frame(self, timeout=None) -> bytes:
+        self.waits.append(timeout)
+        return b""
+
+
+def test_retries_back_off():
+    t = SilentTransport()
+    client = GSPClient(t)
+    with pytest.raises(GSPTimeout):
+        client.verify_chunk()
+    assert t.waits[0] == pytest.approx(0.01, abs=1e-3)
+    assert all(b > a for a, b in zip(t.waits, t.waits[1:]))
+    assert t.waits[-1] > 0.01 * 2 ** (len(t.waits) - 2)
@@ -0,0 +1,134 @@
+# desktop/tests/test_scheduler.py
+
+import os
+import threading
+import time
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.client.scheduler import CommandScheduler, ScheduledGSPClient
+from gsp_core.image.sectors import SectorMap
+from gsp_core.image.segments import SegmentMap
+from gsp_core.protocol.commands import CMD_ABORT, CMD_SEND_MESSAGE, CMD_WRITE_CHUNK
+from gsp_core.protocol.cra import Priority
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+
+class RecordingDevice(SimDevice):
+    """SimDevice that logs the command ID of every command it executes."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.order = []
+
+    def _sequence(self, sid, cmd, payload):
+        self.order.append(cmd)
+        return super()._sequence(sid, cmd, payload)
+
+
+def _scheduler(processing: float = 0.0005, aging: float = 0.25, **link):
+    dev = RecordingDevice(flash_size=256 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5, processing=processing, **link))
+    return dev, CommandScheduler(client, aging=aging)
+
+
+def test_critical_jumps_ahead_of_bulk():
+    dev, sched = _scheduler()
+    with sched:
+        bulk = [sched.submit(CMD_WRITE_CHUNK, bytes(256), Priority.LOW) for _ in range(300)]
+        abort = sched.submit(CMD_ABORT, priority=Priority.CRITICAL)
+        abort.result(timeout=5)
+        assert sum(f.done() for f in bulk) < 20
+    assert all(f.result() == b"" for f in bulk)
+    assert dev.order.index(CMD_ABORT) < 20
+    assert sched.stats[Priority.CRITICAL].count == 1
+    assert sched.stats[Priority.CRITICAL].max < sched.stats[Priority.LOW].max
+
+
+def test_low_priority_is_not_starved():
+    dev, sched = _scheduler(aging=0.02)
+    with sched:
+        low  = sched.submit(CMD_SEND_MESSAGE, b"low", Priority.LOW)
+        high = [sched.submit(CMD_SEND_MESSAGE, b"hi", Priority.HIGH) for _ in range(400)]
+        assert low.result(timeout=5) == b"low"
+        assert not high[-1].done()
+    # aged past HIGH long before the HIGH backlog drained
+    assert dev.order.index(CMD_SEND_MESSAGE) == 0
+    assert sched.stats[Priority.LOW].count == 1
+    assert sched.stats[Priority.HIGH].count == 400
+
+
+def test_abort_runs_between_retries_of_a_stuck_command():
+    dev, sched = _scheduler(processing=0.0)
+    dev._handlers[0xEE] = lambda payload: None      # never answered
+    client = sched.client
+    client._max_retries = 3
+    client.rto = None
+    client.transport.timeout = 0.05
+    with sched:
+        stuck = sched.submit(0xEE, b"", Priority.LOW)
+        time.sleep(0.02)                            # first attempt is waiting
+        abort = sched.submit(CMD_ABORT, priority=Priority.CRITICAL)
+        abort.result(timeout=5)
+        assert not stuck.done()
+        with pytest.raises(GSPTimeout):
+            stuck.result(timeout=5)
+    assert dev.order == [0xEE, CMD_ABORT, 0xEE, 0xEE]
+
+
+def test_scheduled_client_api_from_threads():
+    dev, sched = _scheduler()
+    api = ScheduledGSPClient(sched)
+    with sched:
+        api.erase_flash()
+        uploader = threading.Thread(
+            target=lambda: [api.write_chunk(bytes([i]) * 256, Priority.LOW) for i in range(50)]
+        )
+        uploader.start()
+        assert api.send_message(b"status?", Priority.HIGH) == b"status?"
+        api.abort()
+        uploader.join()
+    assert sched.stats[Priority.LOW].count == 50
+    with pytest.raises(RuntimeError):
+        sched.submit(CMD_ABORT)
+
+
+def test_scheduled_client_pipelines_bulk_helpers():
+    dev, sched = _scheduler(processing=0.0)
+    api    = ScheduledGSPClient(sched)
+    image  = os.urandom(8192)
+    base   = dev.base_address
+    sparse = SegmentMap()
+    sparse.add(base + 0x8000, image[:3000])
+    sparse.add(base + 0xA000, image[3000:])
+    acked  = []
+    with sched:
+        api.erase_flash()
+        assert api.upload_image(image, window=8, on_chunk=lambda o, n: acked.append(o)) == 8192
+        assert acked == list(range(0, 8192, 256))      # settled on this thread, in order
+        api.upload_segments(sparse, window=8, sectors=SectorMap(uniform=2048), verify=True)
+        with api.pipeline(window=4) as pipe:
+            futures = [pipe.submit(CMD_SEND_MESSAGE, bytes([i]), Priority.LOW) for i in range(10)]
+            assert pipe.in_flight <= 4
+    assert dev.read(base, 8192) == image
+    assert dev.read(base + 0x8000, 3000) == image[:3000]
+    assert dev.read(base + 0xA000, 5192) == image[3000:]
+    assert [f.result() for f in futures] == [bytes([i]) for i in range(10)]
+
+
+def test_scheduled_pipeline_reports_the_first_failure():
+    dev, sched = _scheduler(processing=0.0)
+    dev._handlers[0xEE] = lambda payload: None      # never answered
+    sched.client._max_retries = 2
+    sched.client.rto = None
+    sched.client.transport.timeout = 0.02
+    api = ScheduledGSPClient(sched)
+    with sched:
+        pipe = api.pipeline(window=4)
+        ok   = pipe.submit(CMD_SEND_MESSAGE, b"ok")
+        bad  = pipe.submit(0xEE)
+        with pytest.raises(GSPTimeout):
+            pipe.flush()
+    assert ok.result() == b"ok"
+    assert pipe.error is bad.exception()
@@ -0,0 +1,116 @@
+# desktop/tests/test_sectors.py
+
+import os
+import struct
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.image.sectors import SectorMap, plan_erases
+from gsp_core.image.segments import SegmentMap
+from gsp_core.protocol.commands import CMD_ERASE_FLASH, CMD_WRITE_CHUNK
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+BASE = 0x08000000
+K    = 1024
+
+
+class LoggingDevice(SimDevice):
+    """Records the commands in the order they are applied to flash."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.log = []
+
+    def _dispatch(self, cmd, payload):
+        if cmd == CMD_ERASE_FLASH:
+            self.log.append(("E",) + struct.unpack("<II", payload))
+        elif cmd == CMD_WRITE_CHUNK:
+            self.log.append(("W", self._ptr + self.base_address, len(payload)))
+        return super()._dispatch(cmd, payload)
+
+
+def _image(*segments) -> SegmentMap:
+    image = SegmentMap()
+    for address, data in segments:
+        image.add(address, data)
+    return image
+
+
+def test_sector_map():
+    f4 = SectorMap.parse("4x16K, 1x64K, 7x128K", base=BASE)
+    assert f4.sector(BASE + 16 * K + 5) == (BASE + 16 * K, 16 * K)
+    assert f4.sector(BASE + 100 * K) == (BASE + 64 * K, 64 * K)
+    assert f4.covering(BASE + 60 * K, 8 * K) == [(BASE + 48 * K, 16 * K), (BASE + 64 * K, 64 * K)]
+    with pytest.raises(ValueError):
+        f4.sector(BASE + 1024 * K)
+    with pytest.raises(ValueError):
+        SectorMap.parse("4x16Q")
+
+    uniform = SectorMap.parse("2K")
+    assert uniform.uniform == 2048
+    assert uniform.covering(BASE + 100, 3900) == [(BASE, 2048), (BASE + 2048, 2048)]
+
+
+def test_geometry_from_config_only_when_set():
+    assert SectorMap.from_config({"sector_size": None, "sectors": None}) is None
+    assert SectorMap.from_config({"sector_size": "0x800"}).uniform == 2048
+    f4 = SectorMap.from_config({"sector_size": 2048, "sectors": "4x16K", "base": "0x08000000"})
+    assert f4.sector(BASE + 20 * K) == (BASE + 16 * K, 16 * K)
+
+
+def test_plan_merges_shared_and_neighbouring_sectors():
+    sectors = SectorMap(uniform=K)
+    image = _image((BASE + 10, b"\x01" * 10),
+                   (BASE + 100, b"\x02" * 1900),       # sectors 0–1, shares sector 0
+                   (BASE + 8 * K, b"\x03" * 10))
+
+    steps = plan_erases(image, sectors)
+    assert [(s.address, s.length) for s in steps] == [(BASE, K), (BASE + K, K), (BASE + 8 * K, K)]
+    # the segment crossing into sector 1 is split at the boundary
+    assert [(a, len(d)) for a, d in steps[0].writes] == [(BASE + 10, 10), (BASE + 100, K - 100)]
+    assert [(a, len(d)) for a, d in steps[1].writes] == [(BASE + K, 1900 - (K - 100))]
+
+    merged = plan_erases(image, sectors, max_erase=4 * K)
+    assert [(s.address, s.length) for s in merged] == [(BASE, 2 * K), (BASE + 8 * K, K)]
+    assert [(a, len(d)) for a, d in merged[0].writes] == [(BASE + 10, 10), (BASE + 100, 1900)]
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_sector_erases_are_interleaved_with_writes(window):
+    dev = LoggingDevice(flash_size=64 * K)
+    dev.flash[:] = b"\x00" * len(dev.flash)      # old contents everywhere
+    image = _image((BASE, os.urandom(4 * K - 300)), (BASE + 6 * K + 10, os.urandom(500)))
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    acked  = []
+
+    sent = client.upload_segments(image, window=window, sectors=SectorMap(uniform=K),
+                                  on_chunk=lambda a, n: acked.append((a, n)))
+
+    assert sent == image.size and sum(n for _, n in acked) == image.size
+    for seg in image:
+        assert dev.read(seg.address, len(seg)) == seg.data
+    # whole sectors were erased, one at a time, each just before its data
+    erases = [e for e in dev.log if e[0] == "E"]
+    assert erases == [("E", BASE + i * K, K) for i in (0, 1, 2, 3, 6)]
+    assert dev.read(BASE + 4 * K - 300, 300) == b"\xFF" * 300
+    assert dev.read(BASE + 4 * K, 16) == b"\x00" * 16              # untouched sector
+    sector = -1
+    for kind, address, n in dev.log:
+        if kind == "E":
+            sector = address
+        else:
+            assert sector <= address and address + n <= sector + K
+
+
+def test_interleaved_upload_survives_drops():
+    dev   = SimDevice(flash_size=64 * K, dtl=True)
+    link  = SimTransport(dev, timeout=0.01, drop_rate=0.05, seed=99)
+    image = _image((BASE + 100, os.urandom(12 * K)))
+
+    client = GSPClient(link, dtl=True)
+    client._max_retries = 10
+    client.upload_segments(image, window=16, sectors=SectorMap(uniform=2 * K), erased_value=0xFF)
+
+    assert link.link.dropped
+    assert dev.read(BASE + 100, 12 * K) == image.read(BASE + 100, 12 * K)
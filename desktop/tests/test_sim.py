@@ -0,0 +1,156 @@
+# desktop/tests/test_sim.py
+
+import os
+import time
+
+import pytest
+
+from gsp_core.client.highlevel import GSPClient, GSPTimeout
+from gsp_core.protocol.commands import (
+    CMD_SET_ADDRESS, CMD_VERIFY_RANGE, CMD_WRITE_CHUNK, STATUS_FLASH_FAILURE, STATUS_OK,
+)
+from gsp_core.protocol.crc import crc16
+from gsp_core.protocol.cra import CommandFrame, parse
+from gsp_core.protocol.slip import encode, decode
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+from gsp_core.sim.server import SimServer
+from gsp_core.transport.tcp import TCPTransport
+
+BASE = 0x08000000
+
+
+def _chunks(data: bytes, size: int = 256):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _status(wire: bytes) -> int:
+    return parse(decode(wire)).status
+
+
+@pytest.mark.parametrize("dtl", [False, True])
+def test_flash_roundtrip(dtl):
+    dev    = SimDevice(flash_size=64 * 1024, dtl=dtl)
+    client = GSPClient(SimTransport(dev), dtl=dtl)
+    image  = os.urandom(5000)
+
+    client.erase_flash(BASE, 8192)
+    for chunk in _chunks(image):
+        client.write_chunk(chunk)
+    client.verify_chunk()
+    assert client.send_message(b"ping") == b"ping"
+
+    assert dev.read(BASE, len(image)) == image
+    assert dev.read(BASE + len(image), 16) == b"\xFF" * 16
+
+
+def test_write_without_erase_fails_verify():
+    dev = SimDevice(flash_size=4096)
+    dev.flash[:4] = b"\x00\x00\x00\x00"       # programmed, not erased
+    client = GSPClient(SimTransport(dev, timeout=0.0))
+    client.write_chunk(b"\xAA\xBB\xCC\xDD")
+    with pytest.raises(GSPTimeout):
+        client.verify_chunk()
+
+
+def test_duplicate_command_is_not_executed_twice():
+    dev  = SimDevice(flash_size=4096)
+    wire = encode(CommandFrame(sid=7, cmd=CMD_WRITE_CHUNK, payload=b"\x12\x34").build())
+    first, again = dev.handle(wire), dev.handle(wire)
+    assert first == again and _status(first) == STATUS_OK
+    assert dev.duplicates == 1
+    assert dev.read(BASE, 4) == b"\x12\x34\xFF\xFF"
+
+
+def test_held_chunk_is_written_in_sid_order():
+    dev = SimDevice(flash_size=4096)
+    frames = [encode(CommandFrame(sid=s, cmd=CMD_WRITE_CHUNK, payload=bytes([s]) * 2).build())
+              for s in range(3)]
+    dev.handle(frames[0])
+    dev.handle(frames[2])                    # frames[1] was lost on the way
+    assert dev.read(BASE, 6) == b"\x00\x00\xFF\xFF\xFF\xFF"
+    dev.handle(frames[1])                    # retransmission fills the gap
+    assert dev.read(BASE, 6) == b"\x00\x00\x01\x01\x02\x02"
+
+
+def test_set_address_applies_in_sid_order():
+    dev = SimDevice(flash_size=4096)
+    frames = [
+        encode(CommandFrame(sid=0, cmd=CMD_WRITE_CHUNK, payload=b"\x00\x00").build()),
+        encode(CommandFrame(sid=1, cmd=CMD_WRITE_CHUNK, payload=b"\x01\x01").build()),
+        encode(CommandFrame(sid=2, cmd=CMD_SET_ADDRESS, payload=(BASE + 8).to_bytes(4, "little")).build()),
+        encode(CommandFrame(sid=3, cmd=CMD_WRITE_CHUNK, payload=b"\x03\x03").build()),
+    ]
+    dev.handle(frames[0])
+    dev.handle(frames[2])                    # overtakes the lost frames[1]
+    dev.handle(frames[3])
+    dev.handle(frames[1])
+    assert dev.read(BASE, 10) == b"\x00\x00\x01\x01" + b"\xFF" * 4 + b"\x03\x03"
+    bad = encode(CommandFrame(sid=4, cmd=CMD_SET_ADDRESS, payload=(BASE - 1).to_bytes(4, "little")).build())
+    assert _status(dev.handle(bad)) == STATUS_FLASH_FAILURE
+
+
+def test_verify_range_is_answered_after_earlier_writes():
+    dev = SimDevice(flash_size=4096)
+    check = (BASE).to_bytes(4, "little") + (4).to_bytes(4, "little") + crc16(b"\x00\x00\x01\x01").to_bytes(2, "little")
+    frames = [
+        encode(CommandFrame(sid=0, cmd=CMD_WRITE_CHUNK, payload=b"\x00\x00").build()),
+        encode(CommandFrame(sid=1, cmd=CMD_WRITE_CHUNK, payload=b"\x01\x01").build()),
+        encode(CommandFrame(sid=2, cmd=CMD_VERIFY_RANGE, payload=check).build()),
+    ]
+    dev.handle(frames[0])
+    assert dev.handle(frames[2]) is None     # frames[1] still missing: no early answer
+    dev.handle(frames[1])
+    resp = parse(decode(dev.handle(frames[2])))
+    assert resp.status == STATUS_OK and resp.payload[0] == STATUS_OK
+
+
+def test_pipelined_upload_survives_drops_and_bit_errors():
+    dev   = SimDevice(flash_size=256 * 1024, dtl=True)
+    link  = SimTransport(dev, timeout=0.01, drop_rate=0.05, bit_error_rate=1e-4, seed=1234)
+    image = os.urandom(40 * 1024)
+
+    client = GSPClient(link, dtl=True)
+    client._max_retries = 10
+    client.erase_flash(BASE, len(image))
+    client.write_chunks(_chunks(image), window=16)
+
+    assert link.link.dropped and link.link.corrupted
+    assert dev.rejected                      # damaged commands were refused
+    assert dev.read(BASE, len(image)) == image
+
+
+def test_baud_rate_and_latency_are_emulated():
+    dev    = SimDevice(flash_size=64 * 1024)
+    client = GSPClient(SimTransport(dev, baudrate=1_000_000, latency=0.001))
+    start  = time.monotonic()
+    for chunk in _chunks(bytes(20 * 256)):
+        client.write_chunk(chunk)
+    elapsed = time.monotonic() - start
+    # 20 round trips: ≥ 2 ms of latency plus ~2.6 ms of wire time each
+    assert elapsed >= 20 * (0.002 + 262 * 10 / 1_000_000)
+
+
+def test_tcp_server():
+    dev = SimDevice(flash_size=64 * 1024)
+    with SimServer(dev, latency=0.0005) as srv:
+        t = TCPTransport(*srv.address, timeout=0.5, buffered=True)
+        try:
+            client = GSPClient(t)
+            client.erase_flash()
+            client.write_chunks(_chunks(bytes(range(256)) * 16), window=8)
+            assert client.send_message(b"hello sim") == b"hello sim"
+        finally:
+            t.close()
+    assert dev.read(BASE, 4096) == bytes(range(256)) * 16
+    assert dev.messages == [b"hello sim"]
+
+
+def test_recv_without_timeout_blocks_until_a_frame_arrives():
+    link  = SimTransport(SimDevice(), timeout=None, latency=0.02)
+    start = time.monotonic()
+    link.send(encode(CommandFrame(sid=1, cmd=CMD_WRITE_CHUNK, payload=b"\x00\x00").build()))
+    frame = parse(decode(link.recv_frame()))
+    assert (frame.sid, frame.status) == (1, 0)
+    assert time.monotonic() - start >= 0.04        # command and response latency
+    assert link.recv_frame(timeout=0.0) == b""
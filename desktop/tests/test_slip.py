@@ -41,3 +41,46 @@ def test_invalid_escape_raises():
     frame = bytes([_END, _ESC, 0x00, _END])
     with pytest.raises(ValueError):
         decode(frame)
+
+
+# ─── fast codec must match the reference codec byte for byte ────────────────
+
+import os
+from gsp_core.protocol.slip import encode_fast, decode_fast, _ESC_END, _ESC_ESC
+
+_PAYLOADS = [
+    b"",
+    b"ABC",
+    bytes([_END]),
+    bytes([_ESC]),
+    bytes([_ESC, _ESC_END, _END, _ESC_ESC]),
+    bytes([_END, _ESC]) * 50,
+    bytes(range(256)) * 4,
+    os.urandom(4096),
+]
+
+@pytest.mark.parametrize("data", _PAYLOADS)
+def test_fast_encode_matches_reference(data):
+    assert encode_fast(data) == encode(data)
+    assert encode_fast(memoryview(data)) == encode(data)
+    assert encode_fast(bytearray(data)) == encode(data)
+
+@pytest.mark.parametrize("data", _PAYLOADS)
+def test_fast_decode_matches_reference(data):
+    frame = encode(data)
+    assert decode_fast(frame) == decode(frame) == data
+    assert decode_fast(bytearray(frame)) == data
+
+@pytest.mark.parametrize("frame", [
+    b"",
+    b"ABC",
+    bytes([_END, _ESC, _END]),
+    bytes([_END, _ESC, 0x00, _END]),
+    bytes([_END, _ESC, _ESC, _ESC_END, _END]),
+])
+def test_fast_decode_errors_match_reference(frame):
+    with pytest.raises(ValueError) as ref:
+        decode(frame)
+    with pytest.raises(ValueError) as fast:
+        decode_fast(frame)
+    assert str(fast.value) == str(ref.value)
@@ -0,0 +1,78 @@
+# desktop/tests/test_stream.py
+
+import pytest
+from gsp_core.protocol.slip import encode, _END, _ESC
+from gsp_core.protocol.stream import StreamDecoder
+from gsp_core.protocol.dtl import encode_frame, decode_packet
+
+
+def test_single_frame_in_one_chunk():
+    dec = StreamDecoder()
+    assert dec.feed(encode(b"HELLO")) == [b"HELLO"]
+    assert dec.pending == 1  # trailing END may open the next frame
+
+
+def test_frame_split_byte_by_byte():
+    data = bytes([0x01, _END, 0x02, _ESC, 0x03])
+    dec = StreamDecoder()
+    out = []
+    for b in encode(data):
+        out.extend(dec.feed(bytes([b])))
+    assert out == [data]
+
+
+def test_escape_split_across_chunks():
+    frame = encode(bytes([_END]))          # C0 DB DC C0
+    dec = StreamDecoder()
+    assert dec.feed(frame[:2]) == []       # ends on the ESC byte
+    assert dec.feed(memoryview(frame)[2:]) == [bytes([_END])]
+
+
+def test_back_to_back_frames_and_empty_frames():
+    stream = encode(b"ONE") + bytes([_END, _END]) + encode(b"TWO")
+    assert StreamDecoder().feed(stream) == [b"ONE", b"TWO"]
+
+
+def test_shared_delimiter_between_frames():
+    stream = bytes([_END]) + b"A" + bytes([_END]) + b"B" + bytes([_END])
+    assert StreamDecoder().feed(stream) == [b"A", b"B"]
+
+
+def test_leading_noise_is_discarded():
+    dec = StreamDecoder()
+    assert dec.feed(b"garbage") == []
+    assert dec.feed(encode(b"OK")) == [b"OK"]
+
+
+def test_invalid_escape_drops_frame():
+    dec = StreamDecoder()
+    bad = bytes([_END, _ESC, 0x00, _END])
+    assert dec.feed(bad + encode(b"NEXT")) == [b"NEXT"]
+    assert dec.dropped == 1
+
+
+def test_oversized_frame_dropped_and_resynced():
+    dec = StreamDecoder(max_frame=8)
+    assert dec.feed(bytes([_END]) + b"X" * 20) == []
+    assert dec.dropped == 1
+    assert dec.feed(bytes([_END]) + encode(b"ok")) == [b"ok"]
+
+
+def test_raw_mode_keeps_delimiters_and_escapes():
+    f1 = encode(bytes([_ESC, 0x10]))
+    f2 = encode(b"TWO")
+    dec = StreamDecoder(unescape=False)
+    stream = f1 + f2
+    out = dec.feed(stream[:3]) + dec.feed(stream[3:])
+    assert out == [f1, f2]
+
+
+@pytest.mark.parametrize("crc", [True, False])
+def test_dtl_packets_from_stream(crc):
+    cmds = [b"\x01\x02\x03", bytes([_END, _ESC]) * 3, b""]
+    stream = b"".join(encode_frame(c, crc_enable=crc) for c in cmds)
+    dec = StreamDecoder()
+    out = []
+    for i in range(0, len(stream), 5):
+        out.extend(decode_packet(p)[0] for p in dec.feed(stream[i:i + 5]))
+    assert out == cmds
@@ -5,6 +5,8 @@ sys.path.insert(0, repo_root)
 
 from src.gsp_core.transport.tcp import TCPTransport, _END
 
+_real_create_connection = socket.create_connection
+
 class DummySocket:
     """
     Stores bytes written via sendall() and returns them byte-by-byte
@@ -12,10 +14,15 @@ class DummySocket:
     """
     def __init__(self, addr, timeout=None):
         self._buf = bytearray()
+        self.opts = {}
+        self.max_read = None  # cap on bytes handed out per recv_into()
 
     def sendall(self, data: bytes):
         self._buf.extend(data)
 
+    def setsockopt(self, level, option, value):
+        self.opts[(level, option)] = value
+
     def recv(self, nbytes: int) -> bytes:
         if not self._buf:
             return b''
@@ -24,6 +31,12 @@ class DummySocket:
         del self._buf[:1]
         return bytes(b)
 
+    def recv_into(self, view) -> int:
+        n = min(len(view), len(self._buf), self.max_read or len(self._buf))
+        view[:n] = self._buf[:n]
+        del self._buf[:n]
+        return n
+
 @pytest.fixture(autouse=True)
 def patch_socket(monkeypatch):
     monkeypatch.setattr(
@@ -48,3 +61,65 @@ def test_tcp_two_frames_back_to_back():
 
     assert t.recv_frame() == f1
     assert t.recv_frame() == f2
+
+def test_tcp_sets_nodelay():
+    t = TCPTransport("127.0.0.1", 5000)
+    assert t.sock.opts[(socket.IPPROTO_TCP, socket.TCP_NODELAY)] == 1
+
+def test_buffered_keeps_bytes_of_next_frame():
+    t = TCPTransport("127.0.0.1", 5000, buffered=True)
+    f1 = bytes([_END]) + b"ONE" + bytes([_END])
+    f2 = bytes([_END]) + b"TWO" + bytes([_END])
+    # one recv_into() returns both frames plus the start of a third
+    t.send(f1 + f2 + bytes([_END]) + b"TH")
+    assert t.recv_frame() == f1
+    assert t.recv_frame() == f2
+    t.send(b"REE" + bytes([_END]))
+    assert t.recv_frame() == bytes([_END]) + b"THREE" + bytes([_END])
+
+def test_buffered_frame_split_across_reads():
+    t = TCPTransport("127.0.0.1", 5000, buffered=True, bufsize=4)
+    t.sock.max_read = 3
+    frame = bytes([_END]) + b"\xDB\xDCPAYLOAD" + bytes([_END])
+    t.send(frame)
+    assert t.recv_frame() == frame
+
+def test_buffered_returns_empty_on_close():
+    t = TCPTransport("127.0.0.1", 5000, buffered=True)
+    t.send(bytes([_END]) + b"PART")
+    assert t.recv_frame() == b""
+
+def test_buffered_over_loopback(monkeypatch):
+    monkeypatch.setattr(socket, "create_connection", _real_create_connection)
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    t = TCPTransport("127.0.0.1", srv.getsockname()[1], timeout=1.0, buffered=True)
+    peer, _ = srv.accept()
+    frames = [bytes([_END]) + bytes([i]) * 300 + bytes([_END]) for i in range(1, 6)]
+    peer.sendall(b"".join(frames))
+    try:
+        assert [t.recv_frame() for _ in frames] == frames
+    finally:
+        t.close()
+        peer.close()
+        srv.close()
+
+class TimeoutSocket(DummySocket):
+    """recv() times out instead of reporting a closed connection."""
+    def settimeout(self, timeout):
+        pass
+
+    def recv(self, nbytes: int) -> bytes:
+        if not self._buf:
+            raise socket.timeout("timed out")
+        return super().recv(nbytes)
+
+def test_unbuffered_timeout_keeps_the_partial_frame(monkeypatch):
+    monkeypatch.setattr(socket, "create_connection", lambda addr, timeout=None: TimeoutSocket(addr))
+    t = TCPTransport("localhost", 7000)
+    t.send(bytes([_END]) + b"PART")
+    assert t.recv_frame(0.0) == b""
+    t.send(b"IAL" + bytes([_END]) + bytes([_END]) + b"NEXT" + bytes([_END]))
+    assert t.recv_frame(0.0) == bytes([_END]) + b"PARTIAL" + bytes([_END])
+    assert t.recv_frame(0.0) == bytes([_END]) + b"NEXT" + bytes([_END])
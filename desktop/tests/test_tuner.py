@@ -0,0 +1,110 @@
+# desktop/tests/test_tuner.py
+
+import pytest
+
+from gsp_core.client.commands.bootloader_ops.upload import ImageSource
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.client.tuner import ChunkTuner, resolve_chunk_size
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+
+def _run(tuner, link, total=1 << 20):
+    """Feed `tuner` synthetic measurements from link(size) -> (seconds, retries)."""
+    sent = 0
+    while sent < total:
+        size = tuner.size
+        seconds, retries = link(size)
+        tuner.record(size, seconds, retries)
+        sent += size
+    return tuner
+
+
+def test_grows_while_goodput_improves():
+    # 2 ms per round trip dominates: bigger is always better
+    tuner = _run(ChunkTuner(max_size=4096, probe_bytes=8192), lambda n: (0.002 + n * 1e-6, 0))
+    assert tuner.settled
+    assert tuner.size == 4096
+
+
+def test_backs_off_from_sizes_that_get_corrupted():
+    def link(n):
+        return 0.002 + n * 1e-6, 1 if n >= 2048 else 0   # every big frame is re-sent
+    tuner = _run(ChunkTuner(max_size=8192, probe_bytes=8192), link)
+    assert tuner.settled
+    assert tuner.size == 1024
+    assert tuner.results[2048].retry_rate == 1.0
+
+
+def test_stops_when_gain_flattens():
+    # pure wire time: chunk size hardly matters, so the tuner stops early
+    tuner = _run(ChunkTuner(max_size=8192, probe_bytes=8192), lambda n: (n * 1e-5, 0))
+    assert tuner.settled
+    assert tuner.size <= 512
+
+
+def test_settled_size_halves_when_the_link_degrades():
+    tuner = _run(ChunkTuner(max_size=2048, probe_bytes=8192), lambda n: (0.002, 0))
+    assert (tuner.settled, tuner.size) == (True, 2048)
+    _run(tuner, lambda n: (0.002, 1), total=8192)
+    assert tuner.size == 1024
+
+
+def test_rejected_size_falls_back_and_caps_growth():
+    assert ChunkTuner().max_size == 256              # the size every target takes
+    tuner = _run(ChunkTuner(max_size=8192, probe_bytes=8192), lambda n: (0.002, 0), total=3 * 8192)
+    assert (tuner.size, tuner.probing) == (2048, True)
+    assert tuner.reject(2048)
+    assert (tuner.size, tuner.max_size) == (1024, 1024)
+    _run(tuner, lambda n: (0.002, 0), total=4 * 8192)
+    assert (tuner.settled, tuner.size) == (True, 1024)
+    assert not tuner.reject(1024)                    # it has worked: not a size limit
+
+
+def test_resolve_chunk_size():
+    section = {"chunk_size": 512, "max_chunk": 1024}
+    assert resolve_chunk_size(None, section) == 512
+    assert resolve_chunk_size("0x400", section) == 1024
+    tuner = resolve_chunk_size("AUTO", section)
+    assert isinstance(tuner, ChunkTuner) and tuner.max_size == 1024
+    with pytest.raises(ValueError):
+        resolve_chunk_size(70000, section)
+
+
+def test_auto_tuned_upload_on_sim():
+    dev = SimDevice(flash_size=128 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5, latency=0.001))
+    client.erase_flash()
+    data = bytes((i * 13) & 0xFF for i in range(96 * 1024))
+    tuner = ChunkTuner(initial=256, max_size=2048, probe_bytes=8192)
+    assert client.upload_image(data, chunk_size=tuner) == len(data)
+    assert dev.read(dev.base_address, len(data)) == data
+    assert tuner.settled
+    assert tuner.size > 256
+    assert client.retries == 0
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_auto_tuned_upload_backs_off_from_the_target_rx_limit(window):
+    dev = SimDevice(flash_size=128 * 1024, max_payload=1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5, latency=0.001))
+    client.erase_flash()
+    data = bytes((i * 13) & 0xFF for i in range(96 * 1024))
+    tuner = ChunkTuner(initial=256, max_size=8192, probe_bytes=8192)
+    assert client.upload_image(data, chunk_size=tuner, window=window) == len(data)
+    assert dev.read(dev.base_address, len(data)) == data
+    assert tuner.max_size == 1024
+    assert tuner.settled and tuner.size <= 1024
+
+
+def test_image_source_follows_chunk_size_changes():
+    data = bytes(range(256)) * 40
+    blocks = [data[i:i + 1000] for i in range(0, len(data), 1000)]
+    for source in (data, iter(blocks)):
+        with ImageSource(source, chunk_size=100) as image:
+            out, sizes = [], [100, 700, 50, 3000]
+            for off, chunk in image.chunks():
+                out.append(bytes(chunk))
+                image.chunk_size = sizes[len(out) % len(sizes)]
+        assert b"".join(out) == data
+        assert [len(c) for c in out[:4]] == [100, 700, 50, 3000]
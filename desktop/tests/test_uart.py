@@ -1,5 +1,8 @@
 # desktop/tests/test_uart.py
 
+import threading
+import time
+
 import pytest
 import serial
 from src.gsp_core.transport.uart import UARTTransport
@@ -69,3 +72,109 @@ def test_multiple_frames():
 
     assert t.recv_frame() == f1
     assert t.recv_frame() == f2
+
+
+class StreamingSerial(DummySerial):
+    """
+    Loopback port for the threaded mode: write() appends, read(n) returns
+    up to n buffered bytes, waiting up to `timeout` for the first one.
+    """
+    def __init__(self, port, baudrate, timeout):
+        super().__init__(port, baudrate, timeout)
+        self.timeout = timeout
+        self.reads   = []
+        self._cond   = threading.Condition()
+
+    def write(self, data: bytes):
+        with self._cond:
+            self._buf.extend(data)
+            self._cond.notify()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._buf)
+
+    def read(self, n: int) -> bytes:
+        with self._cond:
+            if not self._buf:
+                self._cond.wait(self.timeout)
+            out = bytes(self._buf[:n])
+            del self._buf[:n]
+        if out:
+            self.reads.append(len(out))
+        return out
+
+    def close(self):
+        pass
+
+
+class LeadingEndSerial(DummySerial):
+    """read_until() like pyserial: stops at the *first* END, even a leading one."""
+    def read_until(self, terminator: bytes) -> bytes:
+        idx = self._buf.index(terminator[0])
+        result = bytes(self._buf[: idx + 1])
+        del self._buf[: idx + 1]
+        return result
+
+
+def test_leading_end_is_not_returned_alone(monkeypatch):
+    monkeypatch.setattr(serial, "Serial", LeadingEndSerial)
+    t = UARTTransport(port="COM3", baudrate=9600, timeout=0.1)
+    t.send(b"\xC0ONE\xC0")
+    assert t.recv_frame() == b"\xC0ONE\xC0"
+
+
+def test_threaded_reads_in_bulk(monkeypatch):
+    monkeypatch.setattr(serial, "Serial", StreamingSerial)
+    t = UARTTransport(port="COM4", baudrate=921600, timeout=0.5, threaded=True)
+    frames = [b"\xC0" + bytes([i]) * 200 + b"\xC0" for i in range(1, 6)]
+    t.send(b"".join(frames))
+    try:
+        assert [t.recv_frame() for _ in frames] == frames
+        # at most the one byte that woke the reader, then everything else
+        # in a single bulk read -- not byte by byte
+        assert len(t.ser.reads) <= 2
+        assert sum(t.ser.reads) == sum(map(len, frames))
+    finally:
+        t.close()
+    assert not t._thread.is_alive()
+
+
+def test_threaded_timeout_and_partial_frames(monkeypatch):
+    monkeypatch.setattr(serial, "Serial", StreamingSerial)
+    t = UARTTransport(port="COM5", baudrate=115200, timeout=0.05, threaded=True)
+    try:
+        assert t.recv_frame() == b""
+        t.send(b"\xC0PART")
+        time.sleep(0.02)
+        t.send(b"IAL\xC0")
+        assert t.recv_frame() == b"\xC0PARTIAL\xC0"
+    finally:
+        t.close()
+
+
+class TimeoutCountingSerial(DummySerial):
+    """Counts reconfigurations of the port timeout."""
+    def __init__(self, port, baudrate, timeout):
+        super().__init__(port, baudrate, timeout)
+        self._timeout = timeout
+        self.changes  = 0
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self.changes += 1
+        self._timeout = value
+
+
+def test_jittered_timeouts_rarely_reconfigure_the_port(monkeypatch):
+    monkeypatch.setattr(serial, "Serial", TimeoutCountingSerial)
+    t = UARTTransport(port="COM6", baudrate=115200, timeout=0.5)
+    for rto in (0.030, 0.028, 0.029, 0.031, 0.0285, 0.0295):     # 0.03 s ± jitter
+        t.send(b"\xC0OK\xC0")
+        assert t.recv_frame(rto) == b"\xC0OK\xC0"
+    assert t.ser.changes == 1
+    assert 0.031 <= t.ser.timeout < 0.031 * 1.19
@@ -0,0 +1,127 @@
+# desktop/tests/test_upload.py
+
+import array
+import io
+import mmap
+import os
+import tracemalloc
+
+import pytest
+
+from gsp_core.client.commands.bootloader_ops.upload import ImageSource
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.events import clear_subscribers
+from gsp_core.protocol.commands import STATUS_OK
+from gsp_core.protocol.cra import ResponseFrame, parse
+from gsp_core.protocol.slip import decode, encode
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+
+def _image(n: int) -> bytes:
+    return bytes((i * 7 + (i >> 8)) & 0xFF for i in range(n))
+
+
+def _client():
+    dev = SimDevice(flash_size=64 * 1024)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.erase_flash()
+    return dev, client
+
+
+def test_upload_from_path(tmp_path):
+    data = _image(10_000)
+    path = tmp_path / "fw.bin"
+    path.write_bytes(data)
+    dev, client = _client()
+    assert client.upload_image(path) == len(data)
+    assert dev.read(dev.base_address, len(data)) == data
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, lambda d: array.array("H", d)])
+def test_upload_from_buffer(wrap):
+    data = _image(3000)
+    dev, client = _client()
+    assert client.upload_image(wrap(data), chunk_size=200) == len(data)
+    assert dev.read(dev.base_address, len(data)) == data
+
+
+def test_iterator_blocks_are_rechunked():
+    data   = _image(5000)
+    sizes  = [1, 255, 256, 700, 3, 1000]
+    blocks, pos = [], 0
+    while pos < len(data):
+        n = sizes[len(blocks) % len(sizes)]
+        blocks.append(data[pos:pos + n])
+        pos += n
+    with ImageSource(iter(blocks), chunk_size=256) as image:
+        chunks = [(off, bytes(c)) for off, c in image.chunks()]
+    assert [off for off, _ in chunks] == list(range(0, len(data), 256))
+    assert all(len(c) == 256 for _, c in chunks[:-1])
+    assert b"".join(c for _, c in chunks) == data
+
+
+def test_file_object_and_start_offset():
+    data = _image(4000)
+    with ImageSource(io.BytesIO(data), chunk_size=256) as image:
+        chunks = list((off, bytes(c)) for off, c in image.chunks(start=1000))
+    assert chunks[0][0] == 1000
+    assert b"".join(c for _, c in chunks) == data[1000:]
+
+
+def test_path_is_memory_mapped(tmp_path):
+    path = tmp_path / "fw.bin"
+    path.write_bytes(_image(1024))
+    with ImageSource(str(path)) as image:
+        assert image.size == 1024
+        off, chunk = next(image.chunks())
+        assert isinstance(chunk.obj, mmap.mmap)
+        chunk.release()
+
+
+def test_pipelined_upload_reports_every_chunk(tmp_path):
+    data = _image(20_000)
+    path = tmp_path / "fw.bin"
+    path.write_bytes(data)
+    dev, client = _client()
+    acked = []
+    sent = client.upload_image(path, window=16, on_chunk=lambda off, n: acked.append((off, n)))
+    assert sent == len(data)
+    assert sorted(acked) == [(off, min(256, len(data) - off)) for off in range(0, len(data), 256)]
+    assert dev.read(dev.base_address, len(data)) == data
+
+
+class EchoTransport:
+    """Acknowledges every command without keeping its payload."""
+    timeout = 10.0
+
+    def __init__(self):
+        self._out = []
+        self.bytes = 0
+
+    def send(self, frame) -> None:
+        f = parse(decode(bytes(frame)))
+        self.bytes += len(f.payload)
+        self._out.append(encode(ResponseFrame(f.sid, STATUS_OK).build()))
+
+    def recv_frame(self, timeout=None) -> bytes:
+        return self._out.pop(0) if self._out else b""
+
+
+def test_host_memory_stays_flat(tmp_path):
+    size = 8 * 1024 * 1024
+    path = tmp_path / "big.bin"
+    with open(path, "wb") as f:
+        f.truncate(size)
+    clear_subscribers()                    # earlier tests' recorders would grow
+    t = EchoTransport()
+    client = GSPClient(t)
+    client.rto = None                      # tracemalloc is slow; never re-send
+    tracemalloc.start()
+    try:
+        client.upload_image(os.fspath(path), window=8)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert t.bytes == size
+    assert peak < 1024 * 1024
@@ -0,0 +1,77 @@
+# desktop/tests/test_verify.py
+
+import os
+
+import pytest
+
+from gsp_core.client.commands.bootloader_ops.verify import range_result
+from gsp_core.client.highlevel import GSPClient, GSPVerifyError
+from gsp_core.image.sectors import SectorMap
+from gsp_core.image.segments import SegmentMap
+from gsp_core.protocol.commands import CMD_VERIFY_CHUNK, CMD_VERIFY_RANGE
+from gsp_core.protocol.crc import crc16
+from gsp_core.sim.device import SimDevice
+from gsp_core.sim.link import SimTransport
+
+BASE = 0x08000000
+
+
+def test_verify_range_against_sim():
+    dev  = SimDevice(flash_size=4096)
+    data = os.urandom(1000)
+    dev.flash[100:1100] = data
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+
+    assert range_result(client.verify_range(BASE + 100, 1000, crc16(data))) == (True, crc16(data))
+    matched, crc = range_result(client.verify_range(BASE + 100, 1000, crc16(data) ^ 1))
+    assert not matched and crc == crc16(data)
+    with pytest.raises(Exception):
+        client.verify_range(BASE + 4000, 1000, 0)      # outside flash: FLASH_FAILURE
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_upload_verifies_with_one_round_trip(window, counting_device):
+    dev  = counting_device(flash_size=64 * 1024)
+    data = os.urandom(40 * 1024 + 17)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.erase_flash(BASE, len(data))
+
+    client.upload_image(data, window=window, address=BASE, verify=True)
+
+    assert dev.counts[CMD_VERIFY_RANGE] == 1
+    assert CMD_VERIFY_CHUNK not in dev.counts
+    assert dev.read(BASE, len(data)) == data
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_corrupted_flash_is_reported(window, counting_device):
+    dev  = counting_device(corrupt=30, flash_size=64 * 1024)
+    data = os.urandom(40 * 256)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.erase_flash(BASE, len(data))
+    with pytest.raises(GSPVerifyError, match="0x08000000"):
+        client.upload_image(data, window=window, address=BASE, verify=True)
+
+
+def test_verify_covers_skipped_blank_chunks(counting_device):
+    dev  = counting_device(flash_size=64 * 1024)
+    data = os.urandom(1000) + b"\xFF" * 4096 + os.urandom(1000)
+    client = GSPClient(SimTransport(dev, timeout=0.5))
+    client.erase_flash(BASE, len(data))
+    client.upload_image(data, window=4, address=BASE, erased_value=0xFF, verify=True)
+    assert dev.counts[CMD_VERIFY_RANGE] == 1
+
+
+def test_sector_writes_verify_per_sector_under_loss(counting_device):
+    dev   = counting_device(corrupt=None, flash_size=64 * 1024, dtl=True)
+    link  = SimTransport(dev, timeout=0.01, drop_rate=0.05, seed=5)
+    image = SegmentMap()
+    image.add(BASE + 100, os.urandom(12 * 1024))
+    client = GSPClient(link, dtl=True)
+    client._max_retries = 10
+
+    client.upload_segments(image, window=16, sectors=SectorMap(uniform=2048), verify=True)
+
+    assert link.link.dropped
+    assert dev.counts[CMD_VERIFY_RANGE] == 7            # sectors 0–6
+    assert dev.read(BASE + 100, 12 * 1024) == image.read(BASE + 100, 12 * 1024)
@@ -0,0 +1,49 @@
+# desktop/tests/test_vserial.py
+
+import os
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs a POSIX pty")
+
+from gsp_core.client.highlevel import GSPClient
+from gsp_core.sim.device import SimDevice
+from gsp_core.transport.uart import UARTTransport
+
+BASE = 0x08000000
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_upload_over_real_tty(threaded):
+    from gsp_core.sim.vserial import VirtualSerialPort
+
+    image = os.urandom(8 * 1024) + b"\xC0\xDB" * 64     # plenty of SLIP escapes
+    dev   = SimDevice(flash_size=64 * 1024)
+    with VirtualSerialPort(dev) as vsp:
+        t = UARTTransport(vsp.port, 115200, timeout=0.5, threaded=threaded)
+        try:
+            client = GSPClient(t)
+            client.erase_flash(BASE, 16 * 1024)
+            client.write_chunks([image[i:i + 256] for i in range(0, len(image), 256)], window=8)
+            client.verify_chunk()
+            assert client.send_message(b"through the tty") == b"through the tty"
+        finally:
+            t.close()
+    assert dev.read(BASE, len(image)) == image
+
+
+def test_lost_response_is_retried_over_tty():
+    from gsp_core.sim.vserial import VirtualSerialPort
+
+    dev = SimDevice(flash_size=4096)
+    with VirtualSerialPort(dev, drop_rate=0.3, seed=7) as vsp:
+        t = UARTTransport(vsp.port, 115200, timeout=0.05, threaded=True)
+        try:
+            client = GSPClient(t)
+            client._max_retries = 20
+            for i in range(10):
+                assert client.send_message(bytes([i])) == bytes([i])
+        finally:
+            t.close()
+        assert vsp.link.dropped